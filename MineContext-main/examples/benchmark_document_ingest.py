@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: DocumentProcessor ingest throughput over a synthetic corpus
+Generates CSV, Markdown and scanned-style (image only) PDF files of mixed sizes, queues all
+of them at once and measures the time until every document is ingested.
+
+VLM page analysis and LLM chunking are replaced by fixed-latency stand-ins and storage by a
+no-op sink, so the numbers reflect the processor's own scheduling and parsing rather than a
+model provider. Each run uses a different ingest worker / parse process configuration,
+starting with a single worker that parses in-thread (the sequential baseline). Parse and
+render processes only pay off with spare CPU cores; on a single core their IPC is overhead.
+
+Usage:
+    python benchmark_document_ingest.py
+    python benchmark_document_ingest.py --documents 200 --llm-latency-ms 400 --workers 8
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory to path to import opencontext modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pypdfium2 as pdfium
+
+from opencontext.config import global_config
+from opencontext.context_processing.chunker.document_text_chunker import DocumentTextChunker
+from opencontext.context_processing.processor import document_processor
+from opencontext.context_processing.processor.document_processor import DocumentProcessor
+from opencontext.models.context import Chunk, RawContextProperties
+from opencontext.models.enums import ContentFormat, ContextSource
+from opencontext.utils.logging_utils import setup_logging
+
+setup_logging({"level": "WARNING", "log_path": None})
+
+
+def build_corpus(directory: str, documents: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    words = "context screen note meeting report draft budget design review plan".split()
+    paths = []
+    for i in range(documents):
+        kind = i % 3
+        if kind == 0:
+            path = os.path.join(directory, f"table_{i}.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("id,name,amount,comment\n")
+                for row in range(rng.randint(50, 5000)):
+                    comment = " ".join(rng.choices(words, k=8))
+                    f.write(f"{row},item {row},{rng.random() * 1000:.2f},{comment}\n")
+        elif kind == 1:
+            path = os.path.join(directory, f"notes_{i}.md")
+            with open(path, "w", encoding="utf-8") as f:
+                for section in range(rng.randint(2, 40)):
+                    f.write(f"# Section {section}\n\n")
+                    f.write(" ".join(rng.choices(words, k=rng.randint(50, 300))) + "\n\n")
+        else:
+            path = os.path.join(directory, f"scan_{i}.pdf")
+            pdf = pdfium.PdfDocument.new()
+            for _ in range(rng.randint(1, 12)):
+                pdf.new_page(612, 792)
+            with open(path, "wb") as f:
+                pdf.save(f)
+            pdf.close()
+        paths.append(path)
+    return paths
+
+
+class _NullStorage:
+    def batch_upsert_processed_context(self, contexts):
+        return [context.id for context in contexts]
+
+    def batch_delete_processed_contexts(self, ids_by_type):
+        return True
+
+
+def install_stand_ins(llm_latency: float):
+    """Replace model calls and storage, keeping parsing, rendering and scheduling real"""
+
+    async def analyze_image(self, image, page_number: int = 1) -> dict:
+        await asyncio.sleep(llm_latency)
+        return {"text": f"page {page_number}", "page_number": page_number}
+
+    def chunk_text(self, texts: List[str], document_title: str = None) -> List[Chunk]:
+        time.sleep(llm_latency)
+        return [Chunk(text=text, chunk_index=i) for i, text in enumerate(texts) if text.strip()]
+
+    DocumentProcessor._analyze_image_with_vlm = analyze_image
+    DocumentTextChunker.chunk_text = chunk_text
+    document_processor.get_storage = lambda: _NullStorage()
+
+
+def ingest(processor: DocumentProcessor, paths: List[str]) -> Dict[str, Any]:
+    """Queue all paths and wait until each has been ingested"""
+    before = processor._ingest_tracker.get_status()
+    for path in paths:
+        processor.process(
+            RawContextProperties(
+                content_format=ContentFormat.FILE,
+                source=ContextSource.LOCAL_FILE,
+                create_time=datetime.datetime.now(),
+                content_path=path,
+            )
+        )
+    while True:
+        status = processor._ingest_tracker.get_status()
+        done = status["completed"] + status["failed"] - before["completed"] - before["failed"]
+        if done >= len(paths):
+            status["failed"] -= before["failed"]
+            return status
+        time.sleep(0.05)
+
+
+def run_ingest(paths: List[str], processor_config: Dict[str, Any]) -> Dict[str, float]:
+    original_get_config = global_config.get_config
+
+    def get_config(path=None):
+        if path == "processing.document_processor":
+            # Every configuration ingests the same corpus, so nothing may be reused between runs
+            return {**processor_config, "incremental": False}
+        if path == "document_processing":
+            return {"render_workers": processor_config.get("parse_workers", 0)}
+        return original_get_config(path)
+
+    global_config.get_config = get_config
+    try:
+        processor = DocumentProcessor()
+    finally:
+        global_config.get_config = original_get_config
+
+    # Warm up first, so process pool start-up is not counted against the measured run
+    ingest(processor, paths[:3])
+    started = time.perf_counter()
+    status = ingest(processor, paths)
+    elapsed = time.perf_counter() - started
+    processor.shutdown()
+
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    return {
+        "seconds": elapsed,
+        "docs_per_s": len(paths) / elapsed,
+        "mb_per_s": total_bytes / elapsed / 1e6,
+        "failed": status["failed"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--documents", type=int, default=60, help="Synthetic documents")
+    parser.add_argument("--llm-latency-ms", type=float, default=200, help="Per model call")
+    parser.add_argument("--workers", type=int, default=4, help="Ingest worker threads")
+    parser.add_argument("--parse-workers", type=int, default=2, help="Parse processes")
+    args = parser.parse_args()
+
+    install_stand_ins(args.llm_latency_ms / 1000)
+    configurations = [
+        ("sequential", {"workers": 1, "parse_workers": 0, "ingest_order": "fifo"}),
+        ("workers", {"workers": args.workers, "parse_workers": 0}),
+        (
+            "workers+processes",
+            {"workers": args.workers, "parse_workers": args.parse_workers},
+        ),
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = build_corpus(directory, args.documents)
+        print(f"{'configuration':>18} {'seconds':>9} {'docs/s':>8} {'MB/s':>8} {'failed':>7}")
+        for name, config in configurations:
+            result = run_ingest(paths, config)
+            print(
+                f"{name:>18} {result['seconds']:>9.2f} {result['docs_per_s']:>8.2f} "
+                f"{result['mb_per_s']:>8.2f} {result['failed']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
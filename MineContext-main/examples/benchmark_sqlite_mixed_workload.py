@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: SQLiteBackend under mixed read/write traffic
+Runs streaming-chat style writers (append_message_content) next to dashboard style readers
+(get_conversation_messages, get_conversation_list, query_monitoring_token_usage) against a
+throwaway database, and reports throughput and read latency percentiles.
+
+Each configuration is run twice: with a pool of reader connections, and with
+reader_pool_size=0 where every read shares the single writer connection.
+
+Usage:
+    python benchmark_sqlite_mixed_workload.py
+    python benchmark_sqlite_mixed_workload.py --writers 4 --readers 16 --seconds 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path to import opencontext modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from opencontext.storage.backends.sqlite_backend import SQLiteBackend
+from opencontext.utils.logging_utils import setup_logging
+
+setup_logging({"level": "WARNING", "log_path": None})
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))] * 1000
+
+
+def run_workload(path: str, reader_pool_size: int, writers: int, readers: int, seconds: float):
+    backend = SQLiteBackend()
+    backend.initialize({"config": {"path": path, "reader_pool_size": reader_pool_size}})
+
+    conversations = [
+        backend.create_conversation(page_name="benchmark", title=f"conversation {i}")["id"]
+        for i in range(max(writers, 1))
+    ]
+    stop = threading.Event()
+    write_count = [0] * writers
+    read_latencies: List[List[float]] = [[] for _ in range(readers)]
+
+    def writer(index: int):
+        conversation_id = conversations[index]
+        while not stop.is_set():
+            message = backend.create_streaming_message(conversation_id, role="assistant")
+            for _ in range(20):
+                backend.append_message_content(message["id"], "token ", token_count=1)
+                write_count[index] += 1
+            backend.mark_message_finished(message["id"])
+
+    def reader(index: int):
+        queries = (
+            lambda: backend.get_conversation_messages(conversations[index % len(conversations)]),
+            lambda: backend.get_conversation_list(limit=20),
+            lambda: backend.query_monitoring_token_usage(hours=24),
+        )
+        i = 0
+        while not stop.is_set():
+            started = time.perf_counter()
+            queries[i % len(queries)]()
+            read_latencies[index].append(time.perf_counter() - started)
+            i += 1
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    backend.close()
+
+    latencies = [latency for per_reader in read_latencies for latency in per_reader]
+    return {
+        "writes_per_s": sum(write_count) / seconds,
+        "reads_per_s": len(latencies) / seconds,
+        "read_p50_ms": percentile(latencies, 0.5),
+        "read_p99_ms": percentile(latencies, 0.99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--writers", type=int, default=2, help="Streaming writer threads")
+    parser.add_argument("--readers", type=int, default=8, help="Dashboard reader threads")
+    parser.add_argument("--seconds", type=float, default=5, help="Duration of each run")
+    parser.add_argument("--pool-size", type=int, default=8, help="Reader connections")
+    args = parser.parse_args()
+
+    print(
+        f"{'readers pool':>14} {'writes/s':>10} {'reads/s':>10} "
+        f"{'read p50 ms':>12} {'read p99 ms':>12}"
+    )
+    for pool_size in (0, args.pool_size):
+        with tempfile.TemporaryDirectory() as directory:
+            result = run_workload(
+                os.path.join(directory, "benchmark.db"),
+                pool_size,
+                args.writers,
+                args.readers,
+                args.seconds,
+            )
+        print(
+            f"{pool_size:>14} {result['writes_per_s']:>10.0f} {result['reads_per_s']:>10.0f} "
+            f"{result['read_p50_ms']:>12.2f} {result['read_p99_ms']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark: ChromaDB search throughput under concurrent readers
+Fills a throwaway local ChromaDB with random vectors and measures query throughput and
+latency percentiles as the number of concurrent searching threads grows.
+
+The same run is repeated with every search wrapped in one global lock, which is how the
+backend serialized reads before it moved to per-collection reader/writer locks.
+
+Usage:
+    python benchmark_vector_read_concurrency.py
+    python benchmark_vector_read_concurrency.py --contexts 20000 --dim 1024 --threads 1 4 16
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path to import opencontext modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from opencontext.models.context import (
+    ContextProperties,
+    ExtractedData,
+    ProcessedContext,
+    Vectorize,
+)
+from opencontext.models.enums import ContextType
+from opencontext.storage.backends.chromadb_backend import ChromaDBBackend
+from opencontext.utils.logging_utils import get_logger, setup_logging
+
+setup_logging({"level": "WARNING", "log_path": None})
+
+logger = get_logger(__name__)
+
+CONTEXT_TYPE = ContextType.ACTIVITY_CONTEXT
+
+
+def random_vector(dim: int) -> List[float]:
+    return [random.uniform(-1, 1) for _ in range(dim)]
+
+
+def fill_backend(backend: ChromaDBBackend, count: int, dim: int, batch_size: int = 500):
+    now = datetime.datetime.now()
+    for start in range(0, count, batch_size):
+        contexts = [
+            ProcessedContext(
+                properties=ContextProperties(create_time=now, event_time=now, update_time=now),
+                extracted_data=ExtractedData(
+                    title=f"context {i}",
+                    summary=f"benchmark context {i}",
+                    context_type=CONTEXT_TYPE,
+                ),
+                vectorize=Vectorize(text=f"benchmark context {i}", vector=random_vector(dim)),
+            )
+            for i in range(start, min(start + batch_size, count))
+        ]
+        backend.batch_upsert_processed_context(contexts)
+
+
+def run_searches(
+    backend: ChromaDBBackend, threads: int, queries: int, dim: int, global_lock=None
+) -> dict:
+    """Run `queries` searches per thread and collect latencies"""
+    query_vectors = [random_vector(dim) for _ in range(32)]
+    latencies: List[float] = []
+    latencies_lock = threading.Lock()
+
+    def worker():
+        local = []
+        for i in range(queries):
+            query = Vectorize(vector=query_vectors[i % len(query_vectors)])
+            started = time.perf_counter()
+            with global_lock or nullcontext():
+                backend.search(query, top_k=10, context_types=[CONTEXT_TYPE.value])
+            local.append(time.perf_counter() - started)
+        with latencies_lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(worker) for _ in range(threads)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "qps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--contexts", type=int, default=5000, help="Number of stored contexts")
+    parser.add_argument("--dim", type=int, default=512, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Searches per thread")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path:
+        backend = ChromaDBBackend()
+        if not backend.initialize({"config": {"mode": "local", "path": path}}):
+            logger.error("Failed to initialize ChromaDB backend")
+            return
+        print(f"Storing {args.contexts} contexts of dimension {args.dim}...")
+        fill_backend(backend, args.contexts, args.dim)
+
+        print(f"{'threads':>8} {'mode':>12} {'qps':>10} {'p50 ms':>10} {'p99 ms':>10}")
+        for threads in args.threads:
+            for mode, lock in (("global lock", threading.Lock()), ("rw lock", None)):
+                result = run_searches(backend, threads, args.queries, args.dim, lock)
+                print(
+                    f"{threads:>8} {mode:>12} {result['qps']:>10.1f} "
+                    f"{result['p50_ms']:>10.2f} {result['p99_ms']:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Command-line interface - provides the entry point for command-line tools
 """
 
 import argparse
+import multiprocessing
 import sys
 import time
 from contextlib import asynccontextmanager
@@ -280,4 +281,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # The PyInstaller build spawns document render/parse workers from this binary,
+    # they must run the worker instead of the CLI
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent state of files seen by the folder monitor
+Keeps mtime, size, content hash and the ids of the contexts produced from each file in
+SQLite, so a restart only processes files that changed while it was down, and deleted or
+updated files can have their contexts removed by id.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class FileStateIndex:
+    """
+    SQLite table of path -> (mtime, size, hash, context ids).
+
+    Without a path, or when the database file cannot be opened, the table lives in memory
+    and is lost on restart.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        if path:
+            self._open(path)
+        if self._conn is None:
+            self._open(":memory:")
+
+    def _open(self, path: str):
+        try:
+            if path != ":memory:":
+                dir_name = os.path.dirname(path)
+                if dir_name:
+                    os.makedirs(dir_name, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_state (
+                    path TEXT PRIMARY KEY,
+                    mtime REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    context_ids TEXT
+                )
+                """
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(file_state)")}
+            if "context_ids" not in columns:
+                self._conn.execute("ALTER TABLE file_state ADD COLUMN context_ids TEXT")
+            self._conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to open file state index at {path}, keeping it in memory: {e}")
+            self._conn = None
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """All stored file states, keyed by path"""
+        if self._conn is None:
+            return {}
+        with self._lock:
+            try:
+                rows = self._conn.execute("SELECT path, mtime, size, hash FROM file_state")
+                return {
+                    path: {"mtime": mtime, "size": size, "hash": file_hash}
+                    for path, mtime, size, file_hash in rows
+                }
+            except Exception as e:
+                logger.error(f"Failed to load file state index: {e}")
+                return {}
+
+    def upsert(self, states: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Store file states, clearing their context ids until the new contexts are recorded"""
+        rows = [
+            (path, info["mtime"], info["size"], info.get("hash", ""), time.time())
+            for path, info in states
+        ]
+        self._execute(
+            "INSERT OR REPLACE INTO file_state (path, mtime, size, hash, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def delete(self, paths: Iterable[str]):
+        self._execute("DELETE FROM file_state WHERE path = ?", [(path,) for path in paths])
+
+    def get_context_ids(self, paths: Iterable[str]) -> Dict[str, List[str]]:
+        """Recorded context ids of the given paths, paths without any are left out"""
+        if self._conn is None:
+            return {}
+        result: Dict[str, List[str]] = {}
+        with self._lock:
+            try:
+                for path in paths:
+                    row = self._conn.execute(
+                        "SELECT context_ids FROM file_state WHERE path = ?", (path,)
+                    ).fetchone()
+                    if row and row[0]:
+                        result[path] = json.loads(row[0])
+            except Exception as e:
+                logger.error(f"Failed to read context ids from file state index: {e}")
+        return result
+
+    def set_context_ids(self, path: str, file_hash: str, context_ids: List[str]) -> bool:
+        """
+        Record the contexts produced from a file.
+
+        Returns:
+            False when the file is unknown or its hash changed since, the contexts are stale
+        """
+        if self._conn is None:
+            return False
+        with self._lock:
+            try:
+                cursor = self._conn.execute(
+                    "UPDATE file_state SET context_ids = ? WHERE path = ? AND hash = ?",
+                    (json.dumps(context_ids), path, file_hash),
+                )
+                self._conn.commit()
+                return cursor.rowcount > 0
+            except Exception as e:
+                logger.error(f"Failed to record context ids in file state index: {e}")
+                return False
+
+    def _execute(self, sql: str, rows: list):
+        if self._conn is None or not rows:
+            return
+        with self._lock:
+            try:
+                self._conn.executemany(sql, rows)
+                self._conn.commit()
+            except Exception as e:
+                logger.error(f"Failed to update file state index: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
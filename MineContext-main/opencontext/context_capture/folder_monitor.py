@@ -10,21 +10,58 @@ Folder monitoring component that monitors local folder changes and generates con
 
 import hashlib
 import os
+import stat
 import threading
 import time
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from opencontext.context_capture.base import BaseCaptureComponent
-from opencontext.context_processing.processor.document_processor import DocumentProcessor
+from opencontext.context_capture.file_state_index import FileStateIndex
+from opencontext.context_processing.processor.chunk_index import get_document_chunk_index
+from opencontext.context_processing.processor.document_processor import (
+    DocumentProcessor,
+    add_ingest_listener,
+    remove_ingest_listener,
+)
 from opencontext.models.context import RawContextProperties
 from opencontext.models.enums import ContentFormat, ContextSource, ContextType
 from opencontext.storage.global_storage import get_storage
 from opencontext.utils.logging_utils import get_logger
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional, the monitor falls back to periodic scanning
+    FileSystemEventHandler = object
+    Observer = None
+
 logger = get_logger(__name__)
 
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+class _FolderEventHandler(FileSystemEventHandler):
+    """Forwards filesystem events to the monitor as dirty paths"""
+
+    _IGNORED_EVENTS = {"opened", "closed_no_write"}
+
+    def __init__(self, monitor: "FolderMonitorCapture"):
+        super().__init__()
+        self._monitor = monitor
+
+    def on_any_event(self, event):
+        if event.event_type in self._IGNORED_EVENTS:
+            return
+        # A directory is modified whenever an entry inside it changes, the entry has its own event
+        if event.is_directory and event.event_type == "modified":
+            return
+        paths = [event.src_path]
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            paths.append(dest_path)
+        self._monitor._mark_dirty(paths, event.is_directory)
+
 
 class FolderMonitorCapture(BaseCaptureComponent):
     """
@@ -52,6 +89,17 @@ class FolderMonitorCapture(BaseCaptureComponent):
         self._monitor_thread = None
         self._stop_event = threading.Event()
 
+        # Filesystem events: dirty path -> (last event time, is directory)
+        self._use_fs_events = True
+        self._event_debounce = 1.0
+        self._reconcile_interval = 300
+        self._observer = None
+        self._dirty_paths: Dict[str, Tuple[float, bool]] = {}
+        self._dirty_lock = threading.Lock()
+        self._dirty_event = threading.Event()
+        self._next_reconcile = 0.0
+        self._state_index = FileStateIndex()
+
         self._total_processed = 0
         self._last_activity_time = None
         self._last_scan_time = None
@@ -67,9 +115,15 @@ class FolderMonitorCapture(BaseCaptureComponent):
             self._recursive = config.get("recursive", True)
             self._max_file_size = config.get("max_file_size", 104857600)
             self._initial_scan = config.get("initial_scan", True)  # Get initial_scan from config
+            self._use_fs_events = config.get("use_fs_events", True)
+            self._event_debounce = config.get("event_debounce_seconds", 1.0)
+            self._reconcile_interval = config.get("reconcile_interval", 300)
             self._supported_formats = set(DocumentProcessor.get_supported_formats())
 
-            self._file_info_cache.clear()
+            # Resume from the states persisted by the previous run
+            self._state_index = FileStateIndex(config.get("state_path"))
+            self._file_info_cache = self._state_index.load()
+            self._resumed = bool(self._file_info_cache)
             self._last_scan_time = datetime.now()
 
             logger.info(
@@ -85,8 +139,18 @@ class FolderMonitorCapture(BaseCaptureComponent):
         Start folder monitoring.
         """
         try:
-            if self._initial_scan:  # Use self._initial_scan
+            add_ingest_listener(self._on_document_ingested)
+            # Watch before the initial scan, so nothing changed during the scan is missed
+            if self._use_fs_events:
+                self._start_observer()
+            if self._resumed:
+                # Process what changed while the monitor was not running
+                self._scan_folder_file_changes()
+            elif self._initial_scan:  # Use self._initial_scan
                 self._scan_existing_folders()
+            self._next_reconcile = time.monotonic() + (
+                self._reconcile_interval if self._observer is not None else 0
+            )
 
             self._monitor_thread = threading.Thread(
                 target=self._monitor_loop, name="folder_monitor", daemon=True
@@ -104,9 +168,16 @@ class FolderMonitorCapture(BaseCaptureComponent):
         Stop folder monitoring.
         """
         try:
+            remove_ingest_listener(self._on_document_ingested)
             self._stop_event.set()
+            self._dirty_event.set()
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer.join(timeout=5)
+                self._observer = None
             if self._monitor_thread and self._monitor_thread.is_alive():
                 self._monitor_thread.join(timeout=10 if graceful else 1)
+            self._state_index.close()
             logger.info("Folder monitoring stopped")
             return True
         except Exception as e:
@@ -135,102 +206,230 @@ class FolderMonitorCapture(BaseCaptureComponent):
             return []
 
     def _monitor_loop(self):
-        """Monitor loop that periodically checks for folder changes."""
+        """
+        Monitor loop. With filesystem events it handles changed paths as they arrive and
+        runs a full reconciliation scan every reconcile_interval, otherwise it scans every
+        monitor_interval.
+        """
         while not self._stop_event.is_set():
             try:
-                self._scan_folder_file_changes()
-                time.sleep(self._monitor_interval)
+                if self._observer is None:
+                    self._scan_folder_file_changes()
+                    self._stop_event.wait(self._monitor_interval)
+                    continue
+
+                now = time.monotonic()
+                until_reconcile = max(0.0, self._next_reconcile - now)
+                until_due = self._seconds_until_dirty_due(now)
+                if until_due is None:
+                    self._dirty_event.wait(until_reconcile)
+                else:
+                    self._stop_event.wait(min(until_due, until_reconcile))
+                self._dirty_event.clear()
+                if self._stop_event.is_set():
+                    break
+
+                self._process_dirty_paths()
+                if time.monotonic() >= self._next_reconcile:
+                    self._scan_folder_file_changes()
+                    self._next_reconcile = time.monotonic() + self._reconcile_interval
             except Exception as e:
                 logger.exception(f"Monitor loop error: {e}")
-                time.sleep(self._monitor_interval * 2)  # Backoff on error
+                self._stop_event.wait(self._monitor_interval * 2)  # Backoff on error
+
+    def _start_observer(self):
+        """Subscribe to filesystem events, leaving the monitor in scan mode on failure"""
+        if Observer is None:
+            logger.warning("watchdog is not installed, folder monitor falls back to scanning")
+            return
+        try:
+            observer = Observer()
+            handler = _FolderEventHandler(self)
+            for folder_path in self._watch_folder_paths:
+                if os.path.isdir(folder_path):
+                    observer.schedule(
+                        handler, os.path.abspath(folder_path), recursive=self._recursive
+                    )
+                else:
+                    logger.warning(f"Folder does not exist or is not a directory: {folder_path}")
+            observer.start()
+            self._observer = observer
+            logger.info("Folder monitor is using filesystem events")
+        except Exception as e:
+            logger.warning(f"Failed to watch folder events, falling back to scanning: {e}")
+            self._observer = None
+
+    def _mark_dirty(self, paths: List[str], is_directory: bool):
+        """Called from the observer thread, the monitor loop handles the paths after debounce"""
+        now = time.monotonic()
+        with self._dirty_lock:
+            for path in paths:
+                self._dirty_paths[os.path.abspath(os.fsdecode(path))] = (now, is_directory)
+        self._dirty_event.set()
+
+    def _seconds_until_dirty_due(self, now: float) -> Optional[float]:
+        with self._dirty_lock:
+            if not self._dirty_paths:
+                return None
+            oldest = min(event_time for event_time, _ in self._dirty_paths.values())
+        return max(0.0, oldest + self._event_debounce - now)
+
+    def _process_dirty_paths(self):
+        """Check paths whose last event is older than the debounce window"""
+        now = time.monotonic()
+        with self._dirty_lock:
+            ready = {
+                path: is_directory
+                for path, (event_time, is_directory) in self._dirty_paths.items()
+                if now - event_time >= self._event_debounce
+            }
+            for path in ready:
+                del self._dirty_paths[path]
+        if not ready:
+            return
+
+        current_files: Dict[str, os.stat_result] = {}
+        gone_files: Set[str] = set()
+        for path, is_directory in ready.items():
+            if is_directory or os.path.isdir(path):
+                # Created, moved or deleted directory: reconcile everything below it
+                if self._recursive and os.path.isdir(path):
+                    current_files.update(self._scan_folder_files(path, self._recursive))
+                prefix = path + os.sep
+                gone_files.update(p for p in self._file_info_cache if p.startswith(prefix))
+                continue
+            if not self._is_supported_file_type(path):
+                continue
+            file_stat = self._stat_watched_file(path)
+            if file_stat is not None:
+                current_files[path] = file_stat
+            elif path in self._file_info_cache:
+                gone_files.add(path)
+
+        self._apply_changes(
+            current_files, [path for path in gone_files if path not in current_files]
+        )
+
+    def _stat_watched_file(self, file_path: str) -> Optional[os.stat_result]:
+        """Stat a file, None when it is gone, too large or not a regular file"""
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size > self._max_file_size:
+            return None
+        return file_stat
 
     def _scan_existing_folders(self):
         """Scan existing folders for initial state."""
         logger.info("Starting initial scan of watched folders.")
+        current_files: Dict[str, os.stat_result] = {}
         for folder_path in self._watch_folder_paths:
-            files = self._scan_folder_files(folder_path, self._recursive)
-            for file_path in files:
-                try:
-                    file_stat = os.stat(file_path)
-                    file_hash = self._get_file_hash(file_path)
-                    self._file_info_cache[file_path] = {
-                        "mtime": file_stat.st_mtime,
-                        "size": file_stat.st_size,
-                        "hash": file_hash,
-                    }
-                except OSError as e:
-                    logger.warning(f"Failed to get initial stats for {file_path}: {e}")
-        logger.info(f"Initial scan completed, found {len(self._file_info_cache)} files.")
+            current_files.update(self._scan_folder_files(folder_path, self._recursive))
+
+        # Files whose mtime and size match the persisted state keep their hash
+        changed_states = []
+        rehashed = 0
+        for file_path, file_stat in current_files.items():
+            cached_info = self._file_info_cache.get(file_path)
+            if (
+                cached_info is not None
+                and cached_info["mtime"] == file_stat.st_mtime
+                and cached_info["size"] == file_stat.st_size
+            ):
+                continue
+            file_info = self._file_info(file_path, file_stat)
+            self._file_info_cache[file_path] = file_info
+            changed_states.append((file_path, file_info))
+            rehashed += 1
+        removed = [path for path in self._file_info_cache if path not in current_files]
+        for file_path in removed:
+            del self._file_info_cache[file_path]
+
+        self._state_index.upsert(changed_states)
+        self._state_index.delete(removed)
+        logger.info(
+            f"Initial scan completed, found {len(self._file_info_cache)} files, hashed {rehashed}."
+        )
 
     def _scan_folder_file_changes(self):
         """Scan configured folders for file changes."""
         try:
-            current_time = datetime.now()
-            current_files = set()
+            current_files: Dict[str, os.stat_result] = {}
             for folder_path in self._watch_folder_paths:
-                folder_files = self._scan_folder_files(folder_path, self._recursive)
-                current_files.update(folder_files)
-
-            new_files, updated_files = self._detect_new_and_updated_files(current_files)
-            deleted_files = self._detect_deleted_files(current_files)
-
-            self._generate_events(new_files, "file_created", current_time)
-            self._generate_events(updated_files, "file_updated", current_time)
-            self._generate_events(deleted_files, "file_deleted", current_time)
-
-            self._last_scan_time = current_time
-            if new_files or updated_files or deleted_files:
-                self._last_activity_time = current_time
-                logger.info(
-                    f"File scan completed: {len(new_files)} new, {len(updated_files)} updated, {len(deleted_files)} deleted."
-                )
+                current_files.update(self._scan_folder_files(folder_path, self._recursive))
+
+            deleted_files = [path for path in self._file_info_cache if path not in current_files]
+            self._apply_changes(current_files, deleted_files)
+            self._last_scan_time = datetime.now()
         except Exception as e:
             logger.exception(f"Folder scan failed: {e}")
 
-    def _detect_new_and_updated_files(self, current_files: set) -> Tuple[List[str], List[str]]:
+    def _apply_changes(self, current_files: Dict[str, os.stat_result], deleted_files: List[str]):
+        """Compare files against the cache, then persist the changes and queue their events"""
+        current_time = datetime.now()
+        new_files, updated_files = self._detect_new_and_updated_files(current_files)
+        deleted_files = self._detect_deleted_files(deleted_files)
+
+        # Contexts produced from the previous version of each file, removed with its event
+        context_ids = self._state_index.get_context_ids(updated_files + deleted_files)
+        self._state_index.upsert(
+            (path, self._file_info_cache[path]) for path in new_files + updated_files
+        )
+        self._state_index.delete(deleted_files)
+
+        self._generate_events(new_files, "file_created", current_time)
+        self._generate_events(updated_files, "file_updated", current_time, context_ids)
+        self._generate_events(deleted_files, "file_deleted", current_time, context_ids)
+
+        if new_files or updated_files or deleted_files:
+            self._last_activity_time = current_time
+            logger.info(
+                f"File changes detected: {len(new_files)} new, {len(updated_files)} updated, {len(deleted_files)} deleted."
+            )
+
+    def _file_info(self, file_path: str, file_stat: os.stat_result) -> Dict[str, Any]:
+        return {
+            "mtime": file_stat.st_mtime,
+            "size": file_stat.st_size,
+            "hash": self._get_file_hash(file_path),
+        }
+
+    def _detect_new_and_updated_files(
+        self, current_files: Dict[str, os.stat_result]
+    ) -> Tuple[List[str], List[str]]:
         new_files, updated_files = [], []
-        for file_path in current_files:
-            try:
-                file_stat = os.stat(file_path)
-                file_mtime = file_stat.st_mtime
-                file_size = file_stat.st_size
-
-                if file_path not in self._file_info_cache:
-                    file_hash = self._get_file_hash(file_path)
-                    self._file_info_cache[file_path] = {
-                        "mtime": file_mtime,
-                        "size": file_size,
-                        "hash": file_hash,
-                    }
-                    new_files.append(file_path)
-                    logger.debug(f"Detected new file: {file_path}")
-                else:
-                    cached_info = self._file_info_cache[file_path]
-                    if file_mtime > cached_info["mtime"] or file_size != cached_info["size"]:
-                        file_hash = self._get_file_hash(file_path)
-                        if file_hash != cached_info["hash"]:
-                            self._file_info_cache[file_path] = {
-                                "mtime": file_mtime,
-                                "size": file_size,
-                                "hash": file_hash,
-                            }
-                            updated_files.append(file_path)
-                            logger.debug(f"Detected file update: {file_path}")
-            except OSError as e:
-                logger.warning(f"Failed to get file stats for {file_path}: {e}")
-                continue
+        for file_path, file_stat in current_files.items():
+            cached_info = self._file_info_cache.get(file_path)
+            if cached_info is None:
+                self._file_info_cache[file_path] = self._file_info(file_path, file_stat)
+                new_files.append(file_path)
+                logger.debug(f"Detected new file: {file_path}")
+            elif (
+                file_stat.st_mtime != cached_info["mtime"]
+                or file_stat.st_size != cached_info["size"]
+            ):
+                file_info = self._file_info(file_path, file_stat)
+                self._file_info_cache[file_path] = file_info
+                if file_info["hash"] != cached_info["hash"]:
+                    updated_files.append(file_path)
+                    logger.debug(f"Detected file update: {file_path}")
         return new_files, updated_files
 
-    def _detect_deleted_files(self, current_files: set) -> List[str]:
-        cached_files = set(self._file_info_cache.keys())
-        deleted_files = list(cached_files - current_files)
+    def _detect_deleted_files(self, deleted_files: List[str]) -> List[str]:
+        deleted_files = [path for path in deleted_files if path in self._file_info_cache]
         for file_path in deleted_files:
             del self._file_info_cache[file_path]
-            # todo 不仅仅要删cache，还要删除对应的向量信息等
             logger.debug(f"Detected file deletion: {file_path}")
         return deleted_files
 
-    def _generate_events(self, file_paths: List[str], event_type: str, timestamp: datetime):
+    def _generate_events(
+        self,
+        file_paths: List[str],
+        event_type: str,
+        timestamp: datetime,
+        context_ids: Optional[Dict[str, List[str]]] = None,
+    ):
         for file_path in file_paths:
             event = {
                 "event_type": event_type,
@@ -239,19 +438,61 @@ class FolderMonitorCapture(BaseCaptureComponent):
             }
             if event_type != "file_deleted":
                 event["file_info"] = self._file_info_cache.get(file_path, {})
+            if context_ids and file_path in context_ids:
+                event["context_ids"] = context_ids[file_path]
             with self._event_lock:
                 self._document_events.append(event)
 
     def _process_file_event(self, event: Dict[str, Any]):
-        """Process file events, handling deletions."""
+        """
+        Process file events, removing the contexts of deleted files. Contexts of updated
+        files are diffed against the new version by the document processor, which keeps
+        unchanged chunks and removes the rest once the new version is stored.
+        """
         if event["event_type"] == "file_deleted":
             file_path = event["file_path"]
             logger.info(f"File deleted, cleaning up context: {file_path}")
-            deleted_count = self._cleanup_file_context(file_path)
+            context_ids = set(event.get("context_ids") or [])
+            context_ids.update(get_document_chunk_index().pop(file_path))
+            deleted_count = self._cleanup_file_context(file_path, list(context_ids))
             logger.info(f"Cleaned up {deleted_count} context entries for deleted file: {file_path}")
 
-    def _cleanup_file_context(self, file_path: str) -> int:
-        """Clean up processed contexts associated with a deleted file."""
+    def _on_document_ingested(self, raw_context: RawContextProperties, context_ids: List[str]):
+        """Record the contexts produced from a watched file once they are stored"""
+        if raw_context.source != ContextSource.LOCAL_FILE or not raw_context.additional_info:
+            return
+        # Only files queued by this monitor carry the hash they were read at
+        file_path = raw_context.additional_info.get("file_path")
+        file_hash = (raw_context.additional_info.get("file_info") or {}).get("hash")
+        if not file_path or not file_hash or not context_ids:
+            return
+        if self._state_index.set_context_ids(file_path, file_hash, context_ids):
+            return
+        if file_path in self._file_info_cache:
+            # Changed again while it was processed, the newer version is diffed against these
+            return
+        # Deleted while it was processed, after the cleanup of the deletion already ran
+        logger.info(f"Removing {len(context_ids)} contexts of deleted file {file_path}")
+        get_document_chunk_index().pop(file_path)
+        self._delete_contexts(context_ids)
+
+    def _delete_contexts(self, context_ids: List[str]) -> int:
+        try:
+            if self._storage.batch_delete_processed_contexts(
+                {ContextType.KNOWLEDGE_CONTEXT.value: context_ids}
+            ):
+                return len(context_ids)
+        except Exception as e:
+            logger.exception(f"Failed to delete contexts {context_ids}: {e}")
+        return 0
+
+    def _cleanup_file_context(self, file_path: str, context_ids: Optional[List[str]] = None) -> int:
+        """
+        Clean up processed contexts associated with a file, by the ids recorded when it was
+        ingested or, for files ingested before ids were recorded, by a file path query.
+        """
+        if context_ids:
+            return self._delete_contexts(context_ids)
         try:
             # Find contexts by file_path
             contexts_dict = self._storage.get_all_processed_contexts(
@@ -319,6 +560,7 @@ class FolderMonitorCapture(BaseCaptureComponent):
                     "file_type": file_ext,
                     "event_type": event_type,
                     "file_info": event.get("file_info", {}),
+                    "previous_context_ids": event.get("context_ids", []),
                 },
                 enable_merge=False,
             )
@@ -344,23 +586,29 @@ class FolderMonitorCapture(BaseCaptureComponent):
             return ContentFormat.TEXT
         return None
 
-    def _scan_folder_files(self, folder_path: str, recursive: bool) -> List[str]:
-        """Scan a folder for supported files."""
-        files = []
+    def _scan_folder_files(self, folder_path: str, recursive: bool) -> Dict[str, os.stat_result]:
+        """Scan a folder for supported files, returning their stats keyed by absolute path."""
+        files: Dict[str, os.stat_result] = {}
         try:
-            folder_path = Path(folder_path)
-            if not folder_path.exists() or not folder_path.is_dir():
+            if not os.path.isdir(folder_path):
                 logger.warning(f"Folder does not exist or is not a directory: {folder_path}")
                 return files
 
-            iterator = folder_path.rglob("*") if recursive else folder_path.iterdir()
-            for file_path in iterator:
-                if file_path.is_file() and self._is_supported_file_type(str(file_path)):
-                    try:
-                        if file_path.stat().st_size <= self._max_file_size:
-                            files.append(str(file_path.absolute()))
-                    except OSError as e:
-                        logger.warning(f"Failed to get file stats for {file_path}: {e}")
+            pending = [os.path.abspath(folder_path)]
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(entry.path)
+                        elif entry.is_file() and self._is_supported_file_type(entry.name):
+                            try:
+                                file_stat = entry.stat()
+                            except OSError as e:
+                                logger.warning(f"Failed to get file stats for {entry.path}: {e}")
+                                continue
+                            if file_stat.st_size <= self._max_file_size:
+                                files[entry.path] = file_stat
         except Exception as e:
             logger.exception(f"Error scanning folder {folder_path}: {e}")
         return files
@@ -373,9 +621,14 @@ class FolderMonitorCapture(BaseCaptureComponent):
         """Calculate the SHA-256 hash of a file."""
         try:
             hash_sha256 = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
+            buffer = bytearray(_HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            with open(file_path, "rb", buffering=0) as f:
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    hash_sha256.update(view[:read])
             return hash_sha256.hexdigest()
         except Exception as e:
             logger.warning(f"Failed to calculate hash for file {file_path}: {e}")
@@ -419,13 +672,39 @@ class FolderMonitorCapture(BaseCaptureComponent):
                     "minimum": 1,
                     "default": 104857600,  # 100MB
                 },
+                "use_fs_events": {
+                    "type": "boolean",
+                    "description": "React to filesystem events instead of scanning every interval",
+                    "default": True,
+                },
+                "event_debounce_seconds": {
+                    "type": "number",
+                    "description": "Quiet time after the last event on a file before it is checked",
+                    "minimum": 0,
+                    "default": 1.0,
+                },
+                "reconcile_interval": {
+                    "type": "integer",
+                    "description": "Full scan interval (seconds) catching events that were missed",
+                    "minimum": 1,
+                    "default": 300,
+                },
+                "state_path": {
+                    "type": "string",
+                    "description": "SQLite file persisting file states across restarts",
+                },
             }
         }
 
     def _validate_config_impl(self, config: Dict[str, Any]) -> bool:
         """Validate configuration implementation."""
         try:
-            for key in ["capture_interval", "monitor_interval", "max_file_size"]:
+            for key in [
+                "capture_interval",
+                "monitor_interval",
+                "max_file_size",
+                "reconcile_interval",
+            ]:
                 val = config.get(key)
                 if val is not None and (not isinstance(val, int) or val < 1):
                     logger.error(f"{key} must be an integer greater than 0")
@@ -450,6 +729,7 @@ class FolderMonitorCapture(BaseCaptureComponent):
             "pending_events": len(self._document_events),
             "last_scan_time": self._last_scan_time.isoformat() if self._last_scan_time else None,
             "is_monitoring": not self._stop_event.is_set(),
+            "mode": "events" if self._observer is not None else "scan",
             "watched_folders": self._watch_folder_paths,
             "cached_files": len(self._file_info_cache),
         }
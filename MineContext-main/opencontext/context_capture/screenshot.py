@@ -11,8 +11,8 @@ Screenshot capture component for periodic screen capturing
 
 import os
 import threading
+import time
 from datetime import datetime
-from io import BytesIO
 from typing import Any, Dict, List
 
 from PIL import Image
@@ -20,6 +20,8 @@ from PIL import Image
 from opencontext.context_capture import BaseCaptureComponent
 from opencontext.models.context import RawContextProperties
 from opencontext.models.enums import ContentFormat, ContextSource
+from opencontext.utils.async_file_writer import get_file_writer
+from opencontext.utils.image import calculate_image_dhash, downscale_image, encode_image
 from opencontext.utils.logger import LogManager
 
 logger = LogManager.get_logger(__name__)
@@ -183,9 +185,9 @@ class ScreenshotCapture(BaseCaptureComponent):
             timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S_%f")
             filename = f"screenshot_{monitor_id}_{timestamp_str}.{self._screenshot_format}"
             filepath = os.path.join(self._screenshot_dir, filename)
-            with open(filepath, "wb") as f:
-                f.write(screenshot_bytes)
             screenshot_path = os.path.abspath(filepath)
+            # Persisted in the background, processing uses the in-memory frame
+            get_file_writer().write(screenshot_path, screenshot_bytes, "screenshot.persist")
             self._last_screenshot_path = screenshot_path
 
         metadata = {
@@ -210,6 +212,7 @@ class ScreenshotCapture(BaseCaptureComponent):
             source=ContextSource.SCREENSHOT,
             content_format=ContentFormat.IMAGE,
             content_path=screenshot_path,
+            content_bytes=screenshot_bytes,
             additional_info=metadata,
             create_time=timestamp,
         )
@@ -245,17 +248,19 @@ class ScreenshotCapture(BaseCaptureComponent):
 
     def _take_screenshot(self) -> list:
         """
-        Capture screen screenshots using configured library
+        Capture screen screenshots using configured library.
+        Each frame is decoded once from the raw capture buffer, then downscaled, hashed and
+        encoded in memory.
 
         Returns:
             list: (screenshot binary data, format, details_dict)
         """
         try:
             screenshots = []
+            stage_ms = {"grab": 0.0, "downscale": 0.0, "hash": 0.0, "encode": 0.0}
 
             if self._screenshot_lib == "mss":
                 import mss
-                from PIL import Image
 
                 with mss.mss() as sct:
                     monitors_to_capture = []
@@ -273,30 +278,54 @@ class ScreenshotCapture(BaseCaptureComponent):
                         monitors_to_capture.extend(sct.monitors[1:])
 
                     for i, monitor in enumerate(monitors_to_capture):
+                        started = time.perf_counter()
                         sct_img = sct.grab(monitor)
                         img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+                        stage_ms["grab"] += time.perf_counter() - started
 
-                        # Convert to binary data
-                        buffer = BytesIO()
-                        if self._screenshot_format in ["jpg", "jpeg"]:
-                            img.save(buffer, format="JPEG", quality=self._screenshot_quality)
-                            format_name = "jpeg"
-                        else:
-                            img.save(buffer, format="PNG")
-                            format_name = "png"
+                        started = time.perf_counter()
+                        img = downscale_image(img, self._max_image_size)
+                        stage_ms["downscale"] += time.perf_counter() - started
 
-                        details = {"monitor": f"monitor_{i+1}", "coordinates": monitor}
-                        screenshots.append((buffer.getvalue(), format_name, details))
+                        started = time.perf_counter()
+                        phash = calculate_image_dhash(img)
+                        stage_ms["hash"] += time.perf_counter() - started
+
+                        # Single encode, used both for the saved file and the VLM request
+                        started = time.perf_counter()
+                        screenshot_bytes, format_name = encode_image(
+                            img, self._screenshot_format, self._screenshot_quality
+                        )
+                        stage_ms["encode"] += time.perf_counter() - started
+
+                        details = {
+                            "monitor": f"monitor_{i+1}",
+                            "coordinates": monitor,
+                            "phash": phash,
+                            "frame_size": [img.width, img.height],
+                        }
+                        screenshots.append((screenshot_bytes, format_name, details))
 
             else:
                 logger.error(f"Unsupported screenshot library: {self._screenshot_lib}")
                 return []
 
+            self._record_stage_timings(stage_ms)
             return screenshots
         except Exception as e:
             logger.exception(f"Screenshot failed: {str(e)}")
             return []
 
+    def _record_stage_timings(self, stage_ms: Dict[str, float]):
+        """Report the time spent per capture stage, summed over all monitors"""
+        try:
+            from opencontext.monitoring import record_processing_stage
+
+            for stage, seconds in stage_ms.items():
+                record_processing_stage(f"screenshot.{stage}", int(seconds * 1000))
+        except Exception as e:
+            logger.debug(f"Failed to record screenshot stage timings: {e}")
+
     def _get_config_schema_impl(self) -> Dict[str, Any]:
         """
         Get configuration schema implementation
@@ -336,7 +365,16 @@ class ScreenshotCapture(BaseCaptureComponent):
                     },
                     "required": ["left", "top", "width", "height"],
                 },
-                "storage_path": {"type": "string", "description": "Screenshot save directory"},
+                "storage_path": {
+                    "type": "string",
+                    "description": "Screenshot save directory, frames are only kept in memory if empty",
+                },
+                "max_image_size": {
+                    "type": "integer",
+                    "description": "Downscale frames so neither side exceeds this size (0 keeps full size)",
+                    "default": 2048,
+                    "minimum": 0,
+                },
                 "dedup_enabled": {
                     "type": "boolean",
                     "description": "Whether to enable screenshot deduplication (skip screenshots identical to the previous one)",
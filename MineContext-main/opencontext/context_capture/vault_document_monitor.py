@@ -6,22 +6,32 @@
 
 """
 Vault document monitoring component that monitors changes in the vaults table and generates context capture events
+
+Changes are read from the vault_changes log that triggers on the vaults table append to,
+starting at a cursor persisted in storage, so each scan costs O(changes) and a restart
+resumes where the previous run stopped.
 """
 
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
 from opencontext.context_capture import BaseCaptureComponent
+from opencontext.context_processing.processor.chunk_index import (
+    get_document_chunk_index,
+    vault_document_key,
+)
 from opencontext.models.context import RawContextProperties
-from opencontext.models.enums import ContentFormat, ContextSource
+from opencontext.models.enums import ContentFormat, ContextSource, ContextType
 from opencontext.storage.global_storage import get_storage
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+_CURSOR_NAME = "vault_document_monitor"
+
 
 class VaultDocumentMonitor(BaseCaptureComponent):
     """
@@ -33,12 +43,14 @@ class VaultDocumentMonitor(BaseCaptureComponent):
         super().__init__(
             name="VaultDocumentMonitor",
             description="Monitor document changes in vaults table",
-            source_type=ContextSource.TEXT,
+            source_type=ContextSource.VAULT,
         )
         self._storage = None
         self._monitor_interval = 5  # Monitor interval (seconds)
+        self._batch_size = 500
         self._last_scan_time = None
-        self._processed_vault_ids: Set[int] = set()
+        self._change_cursor: Optional[int] = None
+        self._cursor_lock = threading.Lock()
         self._document_events = []
         self._event_lock = threading.RLock()
         self._monitor_thread = None
@@ -61,6 +73,10 @@ class VaultDocumentMonitor(BaseCaptureComponent):
         try:
             self._storage = get_storage()
             self._monitor_interval = config.get("monitor_interval", 5)
+            self._batch_size = config.get("batch_size", 500)
+
+            # Resume from the change log position persisted by the previous run
+            self._change_cursor = self._storage.get_change_cursor(_CURSOR_NAME)
 
             # Set initial scan time to current time
             self._last_scan_time = datetime.now()
@@ -81,9 +97,15 @@ class VaultDocumentMonitor(BaseCaptureComponent):
             bool: Whether startup was successful
         """
         try:
-            # If initial scan is configured, scan existing documents first
-            if self._config.get("initial_scan", True):
-                self._scan_existing_documents()
+            if self._change_cursor is None:
+                # First run: everything logged so far is covered by the initial scan, which
+                # reads the table after the position is taken so no change falls in between.
+                # The cursor is stored first, changes are only logged once a consumer exists
+                latest_seq = self._storage.get_latest_vault_change_seq()
+                self._storage.set_change_cursor(_CURSOR_NAME, latest_seq)
+                if self._config.get("initial_scan", True):
+                    self._scan_existing_documents()
+                self._change_cursor = latest_seq
 
             # Start monitoring thread
             self._monitor_thread = threading.Thread(
@@ -132,11 +154,18 @@ class VaultDocumentMonitor(BaseCaptureComponent):
                 self._document_events.clear()
 
             for event in events:
+                if event["event_type"] == "deleted":
+                    self._cleanup_vault_context(event["vault_id"])
                 context_data = self._create_context_from_event(event)
                 if context_data:
                     result.append(context_data)
                     self._total_processed += 1
 
+            # Persist the position only once its changes are handed over for processing
+            handed_over = [event["seq"] for event in events if "seq" in event]
+            if handed_over:
+                self._storage.set_change_cursor(_CURSOR_NAME, max(handed_over))
+
             return result
         except Exception as e:
             logger.exception(f"Document capture failed: {str(e)}")
@@ -156,10 +185,13 @@ class VaultDocumentMonitor(BaseCaptureComponent):
         """Scan existing documents (initial scan)"""
         try:
             logger.info("Starting initial scan of existing vault documents")
-            documents = self._storage.get_vaults(limit=1000, offset=0, is_deleted=False)
-
-            for doc in documents:
-                if doc["id"] not in self._processed_vault_ids:
+            total = 0
+            offset = 0
+            while True:
+                documents = self._storage.get_vaults(
+                    limit=self._batch_size, offset=offset, is_deleted=False
+                )
+                for doc in documents:
                     event = {
                         "event_type": "existing",
                         "vault_id": doc["id"],
@@ -169,85 +201,113 @@ class VaultDocumentMonitor(BaseCaptureComponent):
 
                     with self._event_lock:
                         self._document_events.append(event)
+                total += len(documents)
+                if len(documents) < self._batch_size:
+                    break
+                offset += self._batch_size
 
-                    self._processed_vault_ids.add(doc["id"])
-
-            logger.info(f"Initial scan completed, found {len(documents)} documents")
+            logger.info(f"Initial scan completed, found {total} documents")
         except Exception as e:
             logger.exception(f"Initial scan failed: {e}")
 
     def _scan_vault_changes(self):
-        """Scan changes in the vaults table"""
+        """Consume changes of the vaults table logged since the cursor"""
         try:
-            # Get recent documents (based on created_at and updated_at)
             current_time = datetime.now()
-            documents = self._storage.get_vaults(limit=100, offset=0, is_deleted=False)
-
-            new_documents = []
-            updated_documents = []
-
-            for doc in documents:
-                vault_id = doc["id"]
-                created_at = datetime.fromisoformat(doc["created_at"].replace("Z", "+00:00"))
-                updated_at = (
-                    datetime.fromisoformat(doc["updated_at"].replace("Z", "+00:00"))
-                    if doc.get("updated_at")
-                    else created_at
-                )
-
-                # Check if it's a new document
-                if vault_id not in self._processed_vault_ids:
-                    if created_at > self._last_scan_time:
-                        new_documents.append(doc)
-                    self._processed_vault_ids.add(vault_id)
-                # Check if it's an updated document
-                elif updated_at > self._last_scan_time:
-                    updated_documents.append(doc)
-
-            # Process new documents
-            for doc in new_documents:
-                event = {
-                    "event_type": "created",
-                    "vault_id": doc["id"],
-                    "document_data": doc,
-                    "timestamp": current_time,
-                }
-
-                with self._event_lock:
-                    self._document_events.append(event)
+            new_documents = updated_documents = deleted_documents = 0
 
-                logger.debug(
-                    f"Detected new document: vault_id={doc['id']}, title={doc.get('title', '')}"
+            while not self._stop_event.is_set():
+                with self._cursor_lock:
+                    after_seq = self._change_cursor or 0
+                changes = self._storage.get_vault_changes(
+                    after_seq=after_seq, limit=self._batch_size
                 )
-
-            # Process updated documents
-            for doc in updated_documents:
-                event = {
-                    "event_type": "updated",
-                    "vault_id": doc["id"],
-                    "document_data": doc,
-                    "timestamp": current_time,
-                }
-
+                if not changes:
+                    break
+
+                # Several changes of one vault in a batch collapse into a single event with
+                # its current row; a vault created in this batch stays "created"
+                latest: Dict[int, Dict[str, Any]] = {}
+                for change in changes:
+                    previous = latest.get(change["vault_id"])
+                    if previous is not None and previous["operation"] == "insert":
+                        if change["operation"] != "delete":
+                            change["operation"] = "insert"
+                    latest[change["vault_id"]] = change
+
+                events = []
+                for change in latest.values():
+                    # The row is gone, or soft deleted (also when updated after the delete)
+                    if (
+                        change["operation"] == "delete"
+                        or change["created_at"] is None
+                        or change.get("is_deleted")
+                    ):
+                        event_type = "deleted"
+                        deleted_documents += 1
+                    elif change["operation"] == "insert":
+                        event_type = "created"
+                        new_documents += 1
+                    else:
+                        event_type = "updated"
+                        updated_documents += 1
+
+                    document_data = {
+                        key: value
+                        for key, value in change.items()
+                        if key not in ("seq", "vault_id", "operation")
+                    }
+                    document_data["id"] = change["vault_id"]
+                    events.append(
+                        {
+                            "event_type": event_type,
+                            "vault_id": change["vault_id"],
+                            "document_data": document_data,
+                            "timestamp": current_time,
+                        }
+                    )
+
+                    logger.debug(
+                        f"Detected document {event_type}: vault_id={change['vault_id']}, "
+                        f"title={change.get('title') or ''}"
+                    )
+
+                # The last event of the batch carries the position to persist once captured
+                events[-1]["seq"] = changes[-1]["seq"]
                 with self._event_lock:
-                    self._document_events.append(event)
+                    self._document_events.extend(events)
+                with self._cursor_lock:
+                    self._change_cursor = changes[-1]["seq"]
 
-                logger.debug(
-                    f"Detected document update: vault_id={doc['id']}, title={doc.get('title', '')}"
-                )
+                if len(changes) < self._batch_size:
+                    break
 
             # Update scan time
             self._last_scan_time = current_time
             self._last_activity_time = current_time
 
-            if new_documents or updated_documents:
+            if new_documents or updated_documents or deleted_documents:
                 logger.info(
-                    f"Scan completed: {len(new_documents)} new documents, {len(updated_documents)} updated documents"
+                    f"Scan completed: {new_documents} new documents, {updated_documents} updated documents, {deleted_documents} deleted documents"
                 )
 
         except Exception as e:
             logger.exception(f"Failed to scan vault changes: {e}")
 
+    def _cleanup_vault_context(self, vault_id: int):
+        """Delete the contexts recorded for a deleted vault document"""
+        try:
+            context_ids = get_document_chunk_index().pop(vault_document_key(vault_id))
+            if context_ids:
+                self._storage.batch_delete_processed_contexts(
+                    {ContextType.KNOWLEDGE_CONTEXT.value: context_ids}
+                )
+                logger.info(
+                    f"Cleaned up {len(context_ids)} context entries for deleted vault {vault_id}"
+                )
+        except Exception as e:
+            logger.exception(f"Failed to clean up context for vault {vault_id}: {e}")
+
     def _create_context_from_event(self, event: Dict[str, Any]) -> Optional[RawContextProperties]:
         """
         Create RawContextProperties from event
@@ -259,6 +319,8 @@ class VaultDocumentMonitor(BaseCaptureComponent):
             RawContextProperties: Context properties object
         """
         try:
+            if event["event_type"] == "deleted":
+                return None
             doc = event["document_data"]
             vault_id = event["vault_id"]
 
@@ -324,9 +386,15 @@ class VaultDocumentMonitor(BaseCaptureComponent):
                 },
                 "initial_scan": {
                     "type": "boolean",
-                    "description": "Whether to perform initial scan",
+                    "description": "Whether to scan existing documents on the first run",
                     "default": True,
                 },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Changes read from the change log per query",
+                    "minimum": 1,
+                    "default": 500,
+                },
             }
         }
 
@@ -346,6 +414,11 @@ class VaultDocumentMonitor(BaseCaptureComponent):
                 logger.error("monitor_interval must be an integer greater than 0")
                 return False
 
+            batch_size = config.get("batch_size", 500)
+            if not isinstance(batch_size, int) or batch_size < 1:
+                logger.error("batch_size must be an integer greater than 0")
+                return False
+
             return True
         except Exception as e:
             logger.exception(f"Configuration validation failed: {e}")
@@ -360,7 +433,7 @@ class VaultDocumentMonitor(BaseCaptureComponent):
         """
         return {
             "monitor_interval": self._monitor_interval,
-            "processed_vault_count": len(self._processed_vault_ids),
+            "change_cursor": self._change_cursor,
             "pending_events": len(self._document_events),
             "last_scan_time": self._last_scan_time.isoformat() if self._last_scan_time else None,
             "is_monitoring": not self._stop_event.is_set(),
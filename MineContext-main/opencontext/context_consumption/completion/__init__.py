@@ -10,6 +10,18 @@ Context Consumption - Completion Module
 """
 
 from .completion_cache import CompletionCache, get_completion_cache
-from .completion_service import CompletionService, get_completion_service
+from .completion_service import (
+    CompletionBatch,
+    CompletionService,
+    CompletionSuperseded,
+    get_completion_service,
+)
 
-__all__ = ["CompletionService", "get_completion_service", "CompletionCache", "get_completion_cache"]
+__all__ = [
+    "CompletionService",
+    "CompletionBatch",
+    "CompletionSuperseded",
+    "get_completion_service",
+    "CompletionCache",
+    "get_completion_cache",
+]
@@ -9,15 +9,26 @@ Intelligent Completion Service
 An intelligent completion system based on vector retrieval and LLM generation
 """
 
+import asyncio
+import contextvars
 import hashlib
 import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set
 
-from opencontext.config.global_config import get_prompt_manager
+from opencontext.config.global_config import get_config, get_prompt_manager
 from opencontext.context_consumption.completion.completion_cache import get_completion_cache
-from opencontext.llm.global_vlm_client import generate_with_messages
+from opencontext.llm.global_vlm_client import (
+    generate_with_messages,
+    generate_with_messages_async,
+)
+from opencontext.llm.request_scheduler import RequestPriority, with_priority
 from opencontext.models.enums import CompletionType
 from opencontext.storage.global_storage import get_storage
 from opencontext.tools.retrieval_tools.semantic_context_tool import SemanticContextTool
@@ -53,6 +64,32 @@ class CompletionSuggestion:
         }
 
 
+@dataclass
+class CompletionBatch:
+    """Suggestions of one completion source, yielded as soon as the source finished"""
+
+    source: str  # "cache", "template", "reference" or "semantic"
+    suggestions: List[CompletionSuggestion]
+    elapsed_ms: float
+
+
+class CompletionSuperseded(Exception):
+    """A newer completion request of the same editor session replaced this one"""
+
+
+class _PendingCompletion:
+    """Source tasks of an asynchronous completion request, cancelled when it is superseded"""
+
+    def __init__(self):
+        self.tasks: Set[asyncio.Future] = set()
+        self.superseded = False
+
+    def cancel(self):
+        self.superseded = True
+        for task in self.tasks:
+            task.cancel()
+
+
 class CompletionService:
     """Core class for the intelligent completion service"""
 
@@ -70,6 +107,27 @@ class CompletionService:
         self.min_trigger_length = 3  # Minimum trigger length
         self.similarity_threshold = 0.7  # Similarity threshold
 
+        # Deadlines of the asynchronous sources, a source missing its deadline is dropped
+        self.reference_timeout = 0.5  # Seconds, mostly the query embedding round trip
+        self.semantic_timeout = 3.0  # Seconds, the LLM continuation follows when it is ready
+        self.reference_workers = 2  # Concurrent reference searches, more requests skip them
+
+        # Pending asynchronous request of each editor session
+        self._active_requests: Dict[str, _PendingCompletion] = {}
+
+        # Reference searches cannot be interrupted, so they run on a small pool of their own
+        # and a request finding it busy skips them instead of queueing behind stale searches
+        self._reference_pool: Optional[ThreadPoolExecutor] = None
+        self._reference_slots: Optional[threading.BoundedSemaphore] = None
+
+        # Recent latencies of the asynchronous sources and how often they were cut short
+        self._source_latencies: Dict[str, Deque[float]] = {
+            "reference": deque(maxlen=200),
+            "semantic": deque(maxlen=200),
+        }
+        self._source_counts = {"reference_skipped": 0, "reference_late": 0, "semantic_late": 0}
+        self._stats_lock = threading.Lock()
+
         self._initialize()
 
     def _initialize(self):
@@ -80,6 +138,19 @@ class CompletionService:
 
             self.prompt_manager = get_prompt_manager()
 
+            config = get_config("completion") or {}
+            self.reference_timeout = (
+                config.get("reference_timeout_ms", self.reference_timeout * 1000) / 1000
+            )
+            self.semantic_timeout = (
+                config.get("semantic_timeout_ms", self.semantic_timeout * 1000) / 1000
+            )
+            self.reference_workers = max(1, config.get("reference_workers", self.reference_workers))
+            self._reference_pool = ThreadPoolExecutor(
+                max_workers=self.reference_workers, thread_name_prefix="completion-reference"
+            )
+            self._reference_slots = threading.BoundedSemaphore(self.reference_workers)
+
             # Initialize SemanticContextTool
             self.semantic_search_tool = SemanticContextTool()
 
@@ -89,6 +160,7 @@ class CompletionService:
             logger.error(f"CompletionService initialization failed: {e}")
             raise
 
+    @with_priority(RequestPriority.INTERACTIVE)
     def get_completions(
         self,
         current_text: str,
@@ -156,6 +228,200 @@ class CompletionService:
             logger.error(f"Failed to get completion suggestions: {e}")
             return []
 
+    @with_priority(RequestPriority.INTERACTIVE)
+    async def stream_completions(
+        self,
+        current_text: str,
+        cursor_position: int,
+        document_id: Optional[int] = None,
+        user_context: Dict[str, Any] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[CompletionBatch]:
+        """
+        Get completion suggestions without blocking the event loop, source by source
+
+        Template suggestions are yielded at once, reference and semantic suggestions as their
+        source finishes within its deadline. A newer request of the same editor session (the
+        document when no session is given) cancels this one's pending sources.
+
+        Args:
+            current_text: Current document content
+            cursor_position: Cursor position
+            document_id: Document ID (optional)
+            user_context: User context information (optional)
+            session_id: Editor session ID (optional)
+
+        Yields:
+            CompletionBatch: Suggestions of a source, or the ranked suggestions from cache
+
+        Raises:
+            CompletionSuperseded: A newer request of the same session was started
+        """
+        started = time.perf_counter()
+        session_key = session_id or (f"document:{document_id}" if document_id is not None else None)
+        request = self._start_request(session_key)
+
+        def elapsed_ms() -> float:
+            return round((time.perf_counter() - started) * 1000, 1)
+
+        try:
+            if not self._should_trigger_completion(current_text, cursor_position):
+                return
+
+            context = self._extract_context(current_text, cursor_position)
+            cache_key = self._generate_cache_key(context, document_id)
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                logger.debug("Returning completion suggestions from cache")
+                yield CompletionBatch("cache", cached_result, elapsed_ms())
+                return
+
+            suggestions = self._get_template_completions(context)
+            if suggestions:
+                yield CompletionBatch("template", list(suggestions), elapsed_ms())
+
+            sources = {
+                asyncio.ensure_future(self._timed_semantic_continuations(started, context)): (
+                    "semantic",
+                    started + self.semantic_timeout,
+                ),
+            }
+            reference = self._submit_reference_search(context)
+            if reference is not None:
+                sources[reference] = ("reference", started + self.reference_timeout)
+            request.tasks.update(sources)
+            remaining = set(sources)
+            semantic_complete = True
+            while remaining:
+                deadline = min(sources[task][1] for task in remaining)
+                done, _ = await asyncio.wait(
+                    remaining,
+                    timeout=max(deadline - time.perf_counter(), 0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if request.superseded:
+                    raise CompletionSuperseded()
+
+                for task in done:
+                    remaining.discard(task)
+                    source = sources[task][0]
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        logger.error(f"Completion source {source} failed: {task.exception()}")
+                        continue
+                    if task.result():
+                        suggestions.extend(task.result())
+                        yield CompletionBatch(source, task.result(), elapsed_ms())
+
+                now = time.perf_counter()
+                for task in [task for task in remaining if sources[task][1] <= now]:
+                    task.cancel()
+                    remaining.discard(task)
+                    source = sources[task][0]
+                    semantic_complete = semantic_complete and source != "semantic"
+                    with self._stats_lock:
+                        self._source_counts[f"{source}_late"] += 1
+                    logger.debug(f"Completion source {source} missed its deadline")
+
+            suggestions = self._rank_and_filter_suggestions(suggestions)
+
+            # Cache unless the LLM continuation, the expensive part, is missing; a late
+            # reference search only costs the reference suggestions until the entry expires
+            if suggestions and semantic_complete:
+                confidence_score = sum(s.confidence for s in suggestions) / len(suggestions)
+                context_hash = hashlib.md5(str(context).encode()).hexdigest()
+                self.cache.put(cache_key, suggestions, context_hash, confidence_score)
+
+            logger.info(
+                f"Generated {len(suggestions)} completion suggestions in {elapsed_ms():.1f}ms"
+            )
+
+        finally:
+            request.cancel()
+            if session_key and self._active_requests.get(session_key) is request:
+                del self._active_requests[session_key]
+
+    async def get_completions_async(
+        self,
+        current_text: str,
+        cursor_position: int,
+        document_id: Optional[int] = None,
+        user_context: Dict[str, Any] = None,
+        session_id: Optional[str] = None,
+    ) -> List[CompletionSuggestion]:
+        """
+        Get ranked completion suggestions without blocking the event loop
+
+        Raises:
+            CompletionSuperseded: A newer request of the same session was started
+        """
+        suggestions = []
+        async for batch in self.stream_completions(
+            current_text, cursor_position, document_id, user_context, session_id
+        ):
+            suggestions.extend(batch.suggestions)
+        return self._rank_and_filter_suggestions(suggestions)
+
+    def _submit_reference_search(self, context: Dict[str, Any]) -> Optional[asyncio.Future]:
+        """Start the reference search on its pool, None when the pool is busy"""
+        if self._reference_pool is None or not self._reference_slots.acquire(blocking=False):
+            with self._stats_lock:
+                self._source_counts["reference_skipped"] += 1
+            return None
+
+        def search() -> List[CompletionSuggestion]:
+            started = time.perf_counter()
+            try:
+                return self._get_reference_suggestions(context)
+            finally:
+                # Released when the search ends, also when its request stopped waiting
+                self._reference_slots.release()
+                self._record_latency("reference", started)
+
+        # Copy the context so the request priority carries over to the pool thread
+        return asyncio.get_running_loop().run_in_executor(
+            self._reference_pool, contextvars.copy_context().run, search
+        )
+
+    async def _timed_semantic_continuations(
+        self, started: float, context: Dict[str, Any]
+    ) -> List[CompletionSuggestion]:
+        suggestions = await self._get_semantic_continuations_async(context)
+        if self.chat_client:
+            self._record_latency("semantic", started)
+        return suggestions
+
+    def _record_latency(self, source: str, started: float):
+        with self._stats_lock:
+            self._source_latencies[source].append((time.perf_counter() - started) * 1000)
+
+    def get_source_stats(self) -> Dict[str, Any]:
+        """Latency percentiles of the asynchronous sources, to tune their deadlines"""
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._source_counts)
+            latencies = {
+                source: sorted(values) for source, values in self._source_latencies.items()
+            }
+        for source, values in latencies.items():
+            stats[f"{source}_samples"] = len(values)
+            if values:
+                stats[f"{source}_p50_ms"] = round(values[len(values) // 2], 1)
+                stats[f"{source}_p90_ms"] = round(values[int(len(values) * 0.9)], 1)
+        stats["reference_timeout_ms"] = self.reference_timeout * 1000
+        stats["semantic_timeout_ms"] = self.semantic_timeout * 1000
+        return stats
+
+    def _start_request(self, session_key: Optional[str]) -> _PendingCompletion:
+        """Register a request, cancelling the pending one of the same session"""
+        request = _PendingCompletion()
+        if session_key:
+            previous = self._active_requests.get(session_key)
+            if previous is not None:
+                previous.cancel()
+            self._active_requests[session_key] = request
+        return request
+
     def _should_trigger_completion(self, text: str, cursor_pos: int) -> bool:
         """Determine if completion should be triggered"""
         if cursor_pos < self.min_trigger_length:
@@ -240,58 +506,74 @@ class CompletionService:
             "line_number": current_line_idx + 1,
         }
 
-    def _get_semantic_continuations(self, context: Dict[str, Any]) -> List[CompletionSuggestion]:
-        """Get semantic continuation suggestions"""
+    def _build_semantic_messages(self, context: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Build the LLM messages of a semantic continuation"""
+        # Get prompt group
+        prompt_group = self.prompt_manager.get_prompt_group(
+            "completion_service.semantic_continuation"
+        )
+        system_prompt = prompt_group.get("system", "")
+
+        # Build user prompt
+        context_text = context.get("context_before", "")
+        current_line = context.get("current_line", "")
+        user_prompt_template = prompt_group.get(
+            "user", "Please provide continuation suggestions for the text"
+        )
+        prompt = user_prompt_template.format(context_text=context_text, current_line=current_line)
+
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _parse_semantic_continuations(self, content: Optional[str]) -> List[CompletionSuggestion]:
+        """Parse the continuations of an LLM response"""
         suggestions = []
+        if not content:
+            return suggestions
 
+        # Parse multiple suggestions (separated by newlines)
+        continuations = [c.strip() for c in content.strip().split("\n") if c.strip()]
+
+        for continuation in continuations[:2]:  # At most 2 semantic continuation suggestions
+            if continuation and len(continuation) > 3:
+                suggestions.append(
+                    CompletionSuggestion(
+                        text=continuation,
+                        completion_type=CompletionType.SEMANTIC_CONTINUATION,
+                        confidence=0.8,
+                    )
+                )
+        return suggestions
+
+    def _get_semantic_continuations(self, context: Dict[str, Any]) -> List[CompletionSuggestion]:
+        """Get semantic continuation suggestions"""
         try:
             if not self.chat_client:
-                return suggestions
+                return []
 
-            # Get prompt group
-            prompt_group = self.prompt_manager.get_prompt_group(
-                "completion_service.semantic_continuation"
-            )
-            system_prompt = prompt_group.get("system", "")
+            content = generate_with_messages(self._build_semantic_messages(context))
+            return self._parse_semantic_continuations(content)
 
-            # Build user prompt
-            context_text = context.get("context_before", "")
-            current_line = context.get("current_line", "")
-            user_prompt_template = prompt_group.get(
-                "user", "Please provide continuation suggestions for the text"
-            )
-            prompt = user_prompt_template.format(
-                context_text=context_text, current_line=current_line
-            )
+        except Exception as e:
+            logger.error(f"Failed to generate semantic continuations: {e}")
+            return []
 
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ]
-            response = generate_with_messages(messages)
-
-            if response and response.choices:
-                content = response.choices[0].message.content.strip()
-
-                # Parse multiple suggestions (separated by newlines)
-                continuations = [c.strip() for c in content.split("\n") if c.strip()]
-
-                for continuation in continuations[
-                    :2
-                ]:  # At most 2 semantic continuation suggestions
-                    if continuation and len(continuation) > 3:
-                        suggestions.append(
-                            CompletionSuggestion(
-                                text=continuation,
-                                completion_type=CompletionType.SEMANTIC_CONTINUATION,
-                                confidence=0.8,
-                            )
-                        )
+    async def _get_semantic_continuations_async(
+        self, context: Dict[str, Any]
+    ) -> List[CompletionSuggestion]:
+        """Get semantic continuation suggestions without blocking the event loop"""
+        try:
+            if not self.chat_client:
+                return []
+
+            content = await generate_with_messages_async(self._build_semantic_messages(context))
+            return self._parse_semantic_continuations(content)
 
         except Exception as e:
             logger.error(f"Failed to generate semantic continuations: {e}")
-
-        return suggestions
+            return []
 
     def _get_template_completions(self, context: Dict[str, Any]) -> List[CompletionSuggestion]:
         """Get template completion suggestions"""
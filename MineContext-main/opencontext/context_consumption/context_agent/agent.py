@@ -13,6 +13,7 @@ from opencontext.context_consumption.context_agent.core.state import StateManage
 from opencontext.context_consumption.context_agent.core.streaming import StreamingManager
 from opencontext.context_consumption.context_agent.core.workflow import WorkflowEngine
 from opencontext.context_consumption.context_agent.models.events import EventType, StreamEvent
+from opencontext.llm.request_scheduler import RequestPriority, with_priority
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger("ContextAgent")
@@ -35,6 +36,7 @@ class ContextAgent:
         )
         self.enable_streaming = enable_streaming
 
+    @with_priority(RequestPriority.INTERACTIVE)
     async def process(self, **kwargs) -> Dict[str, Any]:
         """
         Process user queries
@@ -43,6 +45,7 @@ class ContextAgent:
         state = await self.workflow_engine.execute(streaming=self.enable_streaming, **kwargs)
         return self._format_result(state)
 
+    @with_priority(RequestPriority.INTERACTIVE)
     async def process_stream(self, **kwargs) -> AsyncIterator[StreamEvent]:
         async for event in self.workflow_engine.execute_stream(**kwargs):
             yield event
@@ -227,8 +227,19 @@ class LLMContextStrategy:
         """
         Execute tool calls concurrently and convert the results to ContextItem
         """
+        results, _ = await self.execute_tool_calls_with_timings(tool_calls)
+        return results
+
+    async def execute_tool_calls_with_timings(
+        self, tool_calls: List[Dict[str, Any]]
+    ) -> tuple[List[ContextItem], List[Dict[str, Any]]]:
+        """
+        Execute tool calls concurrently, the round takes as long as its slowest call
+        Returns:
+            Tuple of (context_items, per-call timings from ToolsExecutor.run_with_timing_async)
+        """
         if not tool_calls:
-            return []
+            return [], []
 
         tasks = []
         for call in tool_calls:
@@ -236,27 +247,34 @@ class LLMContextStrategy:
             function_args = call.get("function", {}).get("arguments", {})
             # self.logger.info(f"Tool call {function_name} args {function_args}")
             if function_name:
-                task = self.tools_executor.run_async(function_name, function_args)
+                task = self.tools_executor.run_with_timing_async(function_name, function_args)
                 tasks.append((function_name, task))
 
         # Execute concurrently
         results = []
+        timings = []
         if tasks:
             completed_tasks = await asyncio.gather(
                 *[task for _, task in tasks], return_exceptions=True
             )
 
-            for i, result in enumerate(completed_tasks):
+            for i, completed in enumerate(completed_tasks):
                 function_name = tasks[i][0]
 
-                if isinstance(result, Exception):
+                if isinstance(completed, Exception):
+                    self.logger.error(f"Tool call failed {function_name}: {completed}")
+                    continue
+
+                result, timing = completed
+                timings.append(timing)
+                if timing["status"] != "ok":
                     self.logger.error(f"Tool call failed {function_name}: {result}")
                     continue
 
                 # Convert tool execution result to ContextItem
                 context_items = self._convert_tool_result_to_context_items(function_name, result)
                 results.extend(context_items)
-        return results
+        return results, timings
 
     def _convert_tool_result_to_context_items(
         self, tool_name: str, tool_result: Any
@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from opencontext.tools.query_cache import QueryCache
+
 from ..models.enums import WorkflowStage
 from ..models.events import EventBuffer, StreamEvent
 from ..models.schemas import (
@@ -56,6 +58,9 @@ class WorkflowState:
     # Tool call history - track all tool calls and validations
     tool_history: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Query embeddings and retrieval results of this turn, kept across retries
+    query_cache: QueryCache = field(default_factory=QueryCache)
+
     # Streaming processing
     event_buffer: EventBuffer = field(default_factory=EventBuffer)
     streaming_enabled: bool = True
@@ -148,6 +153,7 @@ class WorkflowState:
             "has_reflection": self.reflection is not None,
             "error_count": len(self.errors),
             "retry_count": self.retry_count,
+            "query_cache": self.query_cache.get_stats(),
             "created_at": self.metadata.created_at.isoformat(),
             "updated_at": self.metadata.updated_at.isoformat(),
         }
@@ -10,6 +10,7 @@ import asyncio
 from datetime import datetime
 from typing import Any, AsyncIterator, Dict, Optional
 
+from opencontext.tools.query_cache import use_query_cache
 from opencontext.utils.logging_utils import get_logger
 
 from ..models.enums import ContextSufficiency, EventType, ReflectionType, WorkflowStage
@@ -77,8 +78,12 @@ class WorkflowEngine:
                     content=f"Starting to process query: {state.query.text}...",
                 )
             )
-            state = await self._execute_workflow(state)
-            self.logger.info(f"Workflow execution completed, current stage: {state.stage.value}")
+            with use_query_cache(state.query_cache):
+                state = await self._execute_workflow(state)
+            self.logger.info(
+                f"Workflow execution completed, current stage: {state.stage.value}, "
+                f"query cache: {state.query_cache.get_stats()}"
+            )
             if streaming:
                 await self.streaming_manager.emit(
                     StreamEvent(
@@ -192,8 +197,8 @@ class WorkflowEngine:
 
         if state.stage == WorkflowStage.INSUFFICIENT_INFO and user_input:
             state.query.text += f" {user_input}"
+        with use_query_cache(state.query_cache):
             return await self._execute_workflow(state)
-        return await self._execute_workflow(state)
 
     def get_state(self, workflow_id: str) -> Optional[WorkflowState]:
         """Get the workflow state."""
@@ -7,6 +7,7 @@ Intelligently collects and judges context information
 """
 
 import json
+import time
 from typing import Any, Dict, List, Optional
 
 from ..core.llm_context_strategy import LLMContextStrategy
@@ -124,7 +125,37 @@ class ContextNode(BaseNode):
                     stage=WorkflowStage.CONTEXT_GATHERING,
                 )
             )
-            new_context_items = await self.strategy.execute_tool_calls_parallel(tool_calls)
+            round_started = time.perf_counter()
+            new_context_items, tool_timings = await self.strategy.execute_tool_calls_with_timings(
+                tool_calls
+            )
+            round_ms = round((time.perf_counter() - round_started) * 1000, 1)
+            cache_stats = state.query_cache.get_stats()
+            await self.streaming_manager.emit(
+                StreamEvent(
+                    type=EventType.RUNNING,
+                    content=f"{len(tool_timings)} tools finished in {round_ms:.0f} ms",
+                    stage=WorkflowStage.CONTEXT_GATHERING,
+                    metadata={
+                        "tool_timings": tool_timings,
+                        "round_ms": round_ms,
+                        "sequential_ms": round(sum(t["total_ms"] for t in tool_timings), 1),
+                        "query_cache": cache_stats,
+                    },
+                )
+            )
+            if cache_stats["result_hits"] or cache_stats["embedding_hits"]:
+                await self.streaming_manager.emit(
+                    StreamEvent(
+                        type=EventType.THINKING,
+                        content=(
+                            f"Reused {cache_stats['result_hits']} retrievals and "
+                            f"{cache_stats['embedding_hits']} query embeddings from this turn"
+                        ),
+                        stage=WorkflowStage.CONTEXT_GATHERING,
+                        metadata={"query_cache": cache_stats},
+                    )
+                )
 
             # 4. Validate and filter tool results
             await self.streaming_manager.emit(
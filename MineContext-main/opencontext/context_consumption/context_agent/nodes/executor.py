@@ -6,6 +6,7 @@ Execution Node
 Executes specific tasks
 """
 
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any, Dict
 
@@ -141,22 +142,23 @@ class ExecutorNode(BaseNode):
         # Use streaming generation
         full_content = ""
         chunk_index = 0
-        async for chunk in generate_stream_for_agent(messages):
-            if chunk.choices and len(chunk.choices) > 0:
-                delta = chunk.choices[0].delta
-                if hasattr(delta, "content") and delta.content:
-                    full_content += delta.content
-                    # Emit streaming chunk event
-                    await self.streaming_manager.emit(
-                        StreamEvent(
-                            type=EventType.STREAM_CHUNK,
-                            content=delta.content,
-                            stage=WorkflowStage.EXECUTION,
-                            progress=0.5,  # Progress is unknown during streaming
-                            metadata={"index": chunk_index},
+        async with aclosing(generate_stream_for_agent(messages)) as stream:
+            async for chunk in stream:
+                if chunk.choices and len(chunk.choices) > 0:
+                    delta = chunk.choices[0].delta
+                    if hasattr(delta, "content") and delta.content:
+                        full_content += delta.content
+                        # Emit streaming chunk event
+                        await self.streaming_manager.emit(
+                            StreamEvent(
+                                type=EventType.STREAM_CHUNK,
+                                content=delta.content,
+                                stage=WorkflowStage.EXECUTION,
+                                progress=0.5,  # Progress is unknown during streaming
+                                metadata={"index": chunk_index},
+                            )
                         )
-                    )
-                    chunk_index += 1
+                        chunk_index += 1
 
         return {"success": True, "output": {"type": "generated_content", "content": full_content}}
 
@@ -183,22 +185,23 @@ class ExecutorNode(BaseNode):
         # Use streaming generation
         full_content = ""
         chunk_index = 0
-        async for chunk in generate_stream_for_agent(messages):
-            if chunk.choices and len(chunk.choices) > 0:
-                delta = chunk.choices[0].delta
-                if hasattr(delta, "content") and delta.content:
-                    full_content += delta.content
-                    # Emit streaming chunk event
-                    await self.streaming_manager.emit(
-                        StreamEvent(
-                            type=EventType.STREAM_CHUNK,
-                            content=delta.content,
-                            stage=WorkflowStage.EXECUTION,
-                            progress=0.5,
-                            metadata={"index": chunk_index},
+        async with aclosing(generate_stream_for_agent(messages)) as stream:
+            async for chunk in stream:
+                if chunk.choices and len(chunk.choices) > 0:
+                    delta = chunk.choices[0].delta
+                    if hasattr(delta, "content") and delta.content:
+                        full_content += delta.content
+                        # Emit streaming chunk event
+                        await self.streaming_manager.emit(
+                            StreamEvent(
+                                type=EventType.STREAM_CHUNK,
+                                content=delta.content,
+                                stage=WorkflowStage.EXECUTION,
+                                progress=0.5,
+                                metadata={"index": chunk_index},
+                            )
                         )
-                    )
-                    chunk_index += 1
+                        chunk_index += 1
 
         return {"success": True, "output": {"type": "edited_content", "content": full_content}}
 
@@ -255,21 +258,22 @@ class ExecutorNode(BaseNode):
         # Use streaming generation
         full_content = ""
         chunk_index = 0
-        async for chunk in generate_stream_for_agent(messages):
-            if chunk.choices and len(chunk.choices) > 0:
-                delta = chunk.choices[0].delta
-                if hasattr(delta, "content") and delta.content:
-                    full_content += delta.content
-                    # Emit streaming chunk event
-                    await self.streaming_manager.emit(
-                        StreamEvent(
-                            type=EventType.STREAM_CHUNK,
-                            content=delta.content,
-                            stage=WorkflowStage.EXECUTION,
-                            progress=0.5,
-                            metadata={"index": chunk_index},
+        async with aclosing(generate_stream_for_agent(messages)) as stream:
+            async for chunk in stream:
+                if chunk.choices and len(chunk.choices) > 0:
+                    delta = chunk.choices[0].delta
+                    if hasattr(delta, "content") and delta.content:
+                        full_content += delta.content
+                        # Emit streaming chunk event
+                        await self.streaming_manager.emit(
+                            StreamEvent(
+                                type=EventType.STREAM_CHUNK,
+                                content=delta.content,
+                                stage=WorkflowStage.EXECUTION,
+                                progress=0.5,
+                                metadata={"index": chunk_index},
+                            )
                         )
-                    )
-                    chunk_index += 1
+                        chunk_index += 1
 
         return {"success": True, "output": {"type": "answer", "content": full_content}}
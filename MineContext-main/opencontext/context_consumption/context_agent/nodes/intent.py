@@ -7,6 +7,7 @@ Analyzes user intent and enhances the query
 """
 
 import json
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any, Dict, List
 
@@ -121,22 +122,23 @@ class IntentNode(BaseNode):
         # Use streaming generation
         full_content = ""
         chunk_index = 0
-        async for chunk in generate_stream_for_agent(messages):
-            if chunk.choices and len(chunk.choices) > 0:
-                delta = chunk.choices[0].delta
-                if hasattr(delta, "content") and delta.content:
-                    full_content += delta.content
-                    # Emit streaming chunk event
-                    await self.streaming_manager.emit(
-                        StreamEvent(
-                            type=EventType.STREAM_CHUNK,
-                            content=delta.content,
-                            stage=WorkflowStage.INTENT_ANALYSIS,
-                            progress=0.5,
-                            metadata={"index": chunk_index},
+        async with aclosing(generate_stream_for_agent(messages)) as stream:
+            async for chunk in stream:
+                if chunk.choices and len(chunk.choices) > 0:
+                    delta = chunk.choices[0].delta
+                    if hasattr(delta, "content") and delta.content:
+                        full_content += delta.content
+                        # Emit streaming chunk event
+                        await self.streaming_manager.emit(
+                            StreamEvent(
+                                type=EventType.STREAM_CHUNK,
+                                content=delta.content,
+                                stage=WorkflowStage.INTENT_ANALYSIS,
+                                progress=0.5,
+                                metadata={"index": chunk_index},
+                            )
                         )
-                    )
-                    chunk_index += 1
+                        chunk_index += 1
 
         state.execution_result = ExecutionResult(
             success=True,
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 from opencontext.config.global_config import get_prompt_group
 from opencontext.context_consumption.generation.debug_helper import DebugHelper
 from opencontext.llm.global_vlm_client import generate_with_messages_async
+from opencontext.llm.request_scheduler import RequestPriority, with_priority
 from opencontext.models.enums import ContextType
 from opencontext.storage.global_storage import get_storage
 from opencontext.tools.tool_definitions import ALL_TOOL_DEFINITIONS
@@ -73,6 +74,7 @@ class ReportGenerator:
             return f"Error generating activity report: {str(e)}"
 
 
+    @with_priority(RequestPriority.BACKGROUND)
     async def _process_chunks_concurrently(self, start_time: int, end_time: int) -> list:
         """Process all time chunks concurrently."""
         import asyncio
@@ -89,14 +91,8 @@ class ReportGenerator:
         for chunk_start, chunk_end in hour_chunks:
             task = self._process_single_chunk_async(chunk_start, chunk_end)
             tasks.append(task)
-        semaphore = asyncio.Semaphore(5)
-
-        async def limited_task(task):
-            async with semaphore:
-                return await task
-
-        limited_tasks = [limited_task(task) for task in tasks]
-        results = await asyncio.gather(*limited_tasks, return_exceptions=True)
+        # Concurrency is bounded by the LLM request scheduler
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         hourly_summaries = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
@@ -21,6 +21,7 @@ from opencontext.models.context import ContextType, Vectorize
 from opencontext.storage.global_storage import get_storage
 from opencontext.utils.json_parser import parse_json_from_response
 from opencontext.utils.logging_utils import get_logger
+from opencontext.utils.vector_math import similarity_matrix
 
 logger = get_logger(__name__)
 
@@ -371,7 +372,7 @@ class SmartTodoManager:
         self, new_tasks: List[Dict], similarity_threshold: float = 0.85
     ) -> List[Dict]:
         """Deduplicate new todos using vector similarity search"""
-        from opencontext.llm.global_embedding_client import do_vectorize
+        from opencontext.llm.global_embedding_client import do_vectorize_batch
         from opencontext.models.context import Vectorize
         from opencontext.storage.global_storage import get_storage
 
@@ -382,15 +383,33 @@ class SmartTodoManager:
         filtered_tasks = []
         filtered_count = 0
 
+        # Embed all task descriptions with batched requests instead of one call per task
+        task_vectorizes = {
+            id(task): Vectorize(text=task.get("description", ""))
+            for task in new_tasks
+            if task.get("description", "").strip()
+        }
+        try:
+            do_vectorize_batch(list(task_vectorizes.values()))
+        except Exception as e:
+            logger.warning(f"Batch embedding for todos failed: {e}")
+
+        # Pairwise similarities of the whole batch as one matrix product
+        task_keys = list(task_vectorizes.keys())
+        task_rows = {key: row for row, key in enumerate(task_keys)}
+        batch_similarity, _ = similarity_matrix(
+            [task_vectorizes[key].vector for key in task_keys]
+        )
+        approved_rows = []
+
         for task in new_tasks:
             task_text = task.get("description", "")
             if not task_text.strip():
                 continue
 
-            # Generate embedding for the task
+            # Get the precomputed embedding for the task
             try:
-                todo_vectorize = Vectorize(text=task_text)
-                do_vectorize(todo_vectorize)
+                todo_vectorize = task_vectorizes[id(task)]
                 if not todo_vectorize.vector:
                     # If embedding generation fails, conservatively keep the task
                     logger.warning(f"Unable to generate embedding for todo: {task_text[:50]}...")
@@ -421,48 +440,26 @@ class SmartTodoManager:
                 continue
 
             # Compare with already approved todos in this batch
-            is_duplicate_in_batch = False
-            for existing_task in filtered_tasks:
-                existing_text = existing_task.get("description", "")
-                try:
-                    # Reuse the embedding that was already computed and cached
-                    existing_embedding = existing_task.get("_embedding")
-                    if not existing_embedding:
-                        continue
-                    similarity = self._cosine_similarity(task_embedding, existing_embedding)
-
-                    if similarity >= similarity_threshold:
-                        logger.info(
-                            f"🚫 Todo filtered (duplicate within batch): "
-                            f"'{task_text}' vs '{existing_text}' | "
-                            f"Similarity={similarity:.3f}"
-                        )
-                        is_duplicate_in_batch = True
-                        filtered_count += 1
-                        break
-                except Exception as e:
+            row = task_rows[id(task)]
+            if approved_rows:
+                approved_sims = batch_similarity[row, approved_rows]
+                best = int(approved_sims.argmax())
+                similarity = float(approved_sims[best])
+                if similarity >= similarity_threshold:
+                    existing_text = filtered_tasks[best].get("description", "")
+                    logger.info(
+                        f"🚫 Todo filtered (duplicate within batch): "
+                        f"'{task_text}' vs '{existing_text}' | "
+                        f"Similarity={similarity:.3f}"
+                    )
+                    filtered_count += 1
                     continue
 
-            if not is_duplicate_in_batch:
-                task["_embedding"] = task_embedding
-                filtered_tasks.append(task)
+            task["_embedding"] = task_embedding
+            filtered_tasks.append(task)
+            approved_rows.append(row)
         return filtered_tasks
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        try:
-            import numpy as np
-
-            v1 = np.array(vec1)
-            v2 = np.array(vec2)
-            norm_product = np.linalg.norm(v1) * np.linalg.norm(v2)
-            if norm_product == 0:
-                return 0.0
-            return float(np.dot(v1, v2) / norm_product)
-        except Exception as e:
-            logger.error(f"Failed to calculate cosine similarity: {e}")
-            return 0.0
-
     def _process_task_people(self, task: Dict) -> Dict:
         """Process task personnel information."""
         try:
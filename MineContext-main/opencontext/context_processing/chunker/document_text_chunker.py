@@ -16,7 +16,9 @@ import re
 from typing import Iterator, List, Optional
 
 from opencontext.context_processing.chunker.chunkers import BaseChunker, ChunkingConfig
+from opencontext.llm.request_scheduler import RequestPriority, run_with_priority
 from opencontext.models.context import Chunk
+from opencontext.utils.async_loop import BackgroundEventLoop
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -32,17 +34,49 @@ class DocumentTextChunker(BaseChunker):
     3. Preserve section information (if available)
     """
 
-    def __init__(self, config: Optional[ChunkingConfig] = None):
-        """Initialize document text chunker"""
+    def __init__(
+        self,
+        config: Optional[ChunkingConfig] = None,
+        event_loop: Optional[BackgroundEventLoop] = None,
+    ):
+        """
+        Initialize document text chunker
+
+        Args:
+            config: Chunking configuration
+            event_loop: Long-lived loop to run LLM calls on, the calling thread's loop if None
+        """
         super().__init__(config)
+        self._event_loop = event_loop
+
+    def _run_async(self, coro):
+        """Run a coroutine to completion on the configured loop"""
+        coro = run_with_priority(coro, RequestPriority.BACKGROUND)
+        if self._event_loop is not None:
+            return self._event_loop.run(coro)
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
 
-    def chunk_text(self, texts: List[str], document_title: str = None) -> List[Chunk]:
+    async def _gather_results(self, tasks: List) -> List:
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def chunk_text(
+        self, texts: List[str], document_title: str = None, split_cache=None
+    ) -> List[Chunk]:
         """
         Split text list into multiple semantic chunks (intelligent semantic chunking)
 
         Strategy:
         1. Short documents (<10000 characters): Global semantic chunking - LLM analyzes entire document at once
         2. Long documents (≥10000 characters): Fallback to original paragraph-based chunking strategy
+
+        Args:
+            split_cache: Optional object with get_split(text) and put_split(text, parts),
+                LLM splits of texts found in it are reused instead of requested again
         """
         if not texts or all(not t.strip() for t in texts):
             logger.warning(f"Empty texts provided for chunking document")
@@ -53,11 +87,11 @@ class DocumentTextChunker(BaseChunker):
 
         # Choose strategy based on document length
         if len(full_document) < 10000:
-            chunks = self._global_semantic_chunking(full_document, document_title)
+            chunks = self._global_semantic_chunking(full_document, document_title, split_cache)
         else:
             logger.info(f"Document too long ({len(full_document)} chars), using fallback strategy")
             # Fallback to original paragraph-based chunking strategy
-            chunks = self._fallback_chunking(texts)
+            chunks = self._fallback_chunking(texts, split_cache)
 
         logger.info(f"Created {len(chunks)} chunks from {len(texts)} text elements")
         return chunks
@@ -130,31 +164,34 @@ class DocumentTextChunker(BaseChunker):
 
         return buffers_to_split, direct_chunks, oversized_elements
 
-    def _batch_split_with_llm(self, buffers: List[str]) -> List[List[str]]:
+    def _batch_split_with_llm(self, buffers: List[str], split_cache=None) -> List[List[str]]:
         """
-        Phase 2: Batch concurrent LLM calls
+        Phase 2: Batch concurrent LLM calls, only for buffers without a cached split
         """
-        # Create async tasks
-        tasks = [self._split_with_llm_async(buf) for buf in buffers]
+        processed_results = [
+            split_cache.get_split(buf) if split_cache is not None else None for buf in buffers
+        ]
+        pending = [i for i, result in enumerate(processed_results) if result is None]
+        if len(pending) < len(buffers):
+            logger.info(f"Reusing {len(buffers) - len(pending)}/{len(buffers)} cached splits")
+        if not pending:
+            return processed_results
 
-        # Run event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        # Create async tasks
+        tasks = [self._split_with_llm_async(buffers[i]) for i in pending]
 
         # Execute all tasks concurrently
-        results = loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        results = self._run_async(self._gather_results(tasks))
 
         # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
+        for i, result in zip(pending, results):
             if isinstance(result, Exception):
                 logger.error(f"Error splitting buffer {i}: {result}, falling back to mechanical split")
-                processed_results.append(self._split_oversized_element(buffers[i]))
+                processed_results[i] = self._split_oversized_element(buffers[i])
             else:
-                processed_results.append(result)
+                processed_results[i] = result
+                if split_cache is not None:
+                    split_cache.put_split(buffers[i], result)
 
         return processed_results
 
@@ -252,13 +289,20 @@ class DocumentTextChunker(BaseChunker):
         logger.info(f"Split oversized element in half at position {mid_point}")
         return [text[:mid_point], text[mid_point:]]
 
-    def _global_semantic_chunking(self, full_document: str, document_title: str = None) -> List[Chunk]:
+    def _global_semantic_chunking(
+        self, full_document: str, document_title: str = None, split_cache=None
+    ) -> List[Chunk]:
         """
         Global semantic chunking - LLM analyzes and chunks entire document at once
 
         Suitable for short documents (<10000 characters)
         """
         try:
+            chunk_texts = split_cache.get_split(full_document) if split_cache is not None else None
+            if chunk_texts is not None:
+                logger.info("Document unchanged since it was last chunked, reusing its chunks")
+                return self._chunks_from_texts(chunk_texts)
+
             from opencontext.config.global_config import get_prompt_group
             from opencontext.llm.global_vlm_client import generate_with_messages_async
             from opencontext.utils.json_parser import parse_json_from_response
@@ -279,15 +323,8 @@ class DocumentTextChunker(BaseChunker):
                 {"role": "user", "content": user_prompt},
             ]
 
-            # Create async event loop
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
             # Async LLM call
-            response = loop.run_until_complete(
+            response = self._run_async(
                 generate_with_messages_async(
                     messages=messages,
                 )
@@ -298,26 +335,32 @@ class DocumentTextChunker(BaseChunker):
 
             if not isinstance(chunk_texts, list):
                 logger.warning(f"LLM returned non-list response, falling back")
-                return self._fallback_chunking([full_document])
+                return self._fallback_chunking([full_document], split_cache)
 
-            # Create Chunk objects
-            chunks = []
-            for idx, text in enumerate(chunk_texts):
-                if len(text.strip()) >= self.config.min_chunk_size:
-                    chunk = Chunk(
-                        text=text.strip(),
-                        chunk_index=idx,
-                    )
-                    chunks.append(chunk)
+            chunks = self._chunks_from_texts(chunk_texts)
+            if split_cache is not None:
+                split_cache.put_split(full_document, chunk_texts)
 
             logger.info(f"Global semantic chunking created {len(chunks)} chunks")
             return chunks
 
         except Exception as e:
             logger.error(f"Error in global semantic chunking: {e}, falling back to default strategy")
-            return self._fallback_chunking([full_document])
+            return self._fallback_chunking([full_document], split_cache)
 
-    def _fallback_chunking(self, texts: List[str]) -> List[Chunk]:
+    def _chunks_from_texts(self, chunk_texts: List[str]) -> List[Chunk]:
+        # Create Chunk objects
+        chunks = []
+        for idx, text in enumerate(chunk_texts):
+            if len(text.strip()) >= self.config.min_chunk_size:
+                chunk = Chunk(
+                    text=text.strip(),
+                    chunk_index=idx,
+                )
+                chunks.append(chunk)
+        return chunks
+
+    def _fallback_chunking(self, texts: List[str], split_cache=None) -> List[Chunk]:
         """
         Fallback chunking strategy - used when document is too long or global chunking fails
 
@@ -330,7 +373,9 @@ class DocumentTextChunker(BaseChunker):
         llm_split_results = []
         if buffers_to_split:
             logger.info(f"Fallback: Batch splitting {len(buffers_to_split)} buffers with LLM")
-            llm_split_results = self._batch_split_with_llm([buf for buf, _ in buffers_to_split])
+            llm_split_results = self._batch_split_with_llm(
+                [buf for buf, _ in buffers_to_split], split_cache
+            )
 
         # Phase 3: Assemble chunks
         chunks = self._assemble_chunks(buffers_to_split, llm_split_results, direct_chunks, oversized_elements)
@@ -9,6 +9,7 @@ Merger module for context processing.
 Contains merge-related functionality including context merging, strategies, and cross-type relationships.
 """
 
+from .compression_engine import CompressionStats, MemoryCompressionEngine
 from .context_merger import ContextMerger
 from .cross_type_relationships import CrossTypeRelationshipManager
 from .merge_strategies import (
@@ -24,6 +25,8 @@ from .merge_strategies import (
 
 __all__ = [
     "ContextMerger",
+    "MemoryCompressionEngine",
+    "CompressionStats",
     "ContextTypeAwareStrategy",
     "ProfileContextStrategy",
     "ActivityContextStrategy",
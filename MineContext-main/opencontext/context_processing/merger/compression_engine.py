@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Memory compression engine - clusters a whole time window of contexts in one pass
+and merges each cluster through a bounded worker pool.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from opencontext.models.context import ProcessedContext
+from opencontext.models.enums import ContextType
+from opencontext.monitoring import record_processing_metrics
+from opencontext.utils.logging_utils import get_logger
+from opencontext.utils.vector_math import leader_clusters
+
+if TYPE_CHECKING:
+    from opencontext.context_processing.merger.context_merger import ContextMerger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CompressionStats:
+    """Statistics of a single compression run"""
+
+    contexts_scanned: int = 0
+    clusters_found: int = 0
+    merges_done: int = 0
+    merges_failed: int = 0
+    contexts_deleted: int = 0
+    wall_time_ms: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class MemoryCompressionEngine:
+    """
+    Compresses contexts of a time window per context type.
+
+    All matching contexts of a type are loaded with their vectors and grouped with
+    single-pass leader clustering, so contexts are clustered across the whole window
+    instead of per page. Clusters are merged concurrently, and the results are written
+    back with one batched upsert and one batched delete per run.
+    """
+
+    def __init__(self, merger: "ContextMerger", config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        self.merger = merger
+        self.max_workers = max(1, int(config.get("compression_max_workers", 4)))
+        self.page_size = max(1, int(config.get("compression_page_size", 1000)))
+        self.max_window_contexts = max(1, int(config.get("compression_max_window_contexts", 20000)))
+        self.max_cluster_size = int(config.get("compression_max_cluster_size", 20))
+
+    def compress(self, filter: Dict[str, Any], threshold: float) -> CompressionStats:
+        """Cluster and merge every context matching `filter`"""
+        stats = CompressionStats()
+        start = time.time()
+        storage = self.merger.storage
+
+        clusters: List[List[ProcessedContext]] = []
+        for context_type, contexts in self._load_window(storage, filter).items():
+            stats.contexts_scanned += len(contexts)
+            if len(contexts) < 2:
+                continue
+            contexts.sort(key=lambda c: c.properties.create_time)
+            index_clusters = leader_clusters(
+                [ctx.vectorize.vector if ctx.vectorize else None for ctx in contexts],
+                threshold,
+                self.max_cluster_size,
+            )
+            type_clusters = [[contexts[i] for i in c] for c in index_clusters if len(c) > 1]
+            logger.info(
+                f"Found {len(type_clusters)} clusters among {len(contexts)} {context_type} contexts"
+            )
+            clusters.extend(type_clusters)
+        stats.clusters_found = len(clusters)
+
+        if clusters:
+            merged_contexts, ids_by_type = self._merge_clusters(clusters, stats)
+            if merged_contexts and storage.batch_upsert_processed_context(merged_contexts):
+                storage.batch_delete_processed_contexts(ids_by_type)
+                stats.contexts_deleted = sum(len(ids) for ids in ids_by_type.values())
+            elif merged_contexts:
+                logger.error("Failed to store merged contexts, keeping their sources")
+                stats.merges_failed += stats.merges_done
+                stats.merges_done = 0
+
+        stats.wall_time_ms = int((time.time() - start) * 1000)
+        record_processing_metrics(
+            "merger",
+            "memory_compression",
+            stats.wall_time_ms,
+            context_count=stats.contexts_scanned,
+        )
+        logger.info(f"Memory compression finished: {stats.to_dict()}")
+        return stats
+
+    def _load_window(self, storage, filter: Dict[str, Any]) -> Dict[str, List[ProcessedContext]]:
+        """Stream every matching context of each type with cursor pagination"""
+        window: Dict[str, List[ProcessedContext]] = {}
+        for context_type in [ct.value for ct in ContextType]:
+            loaded = []
+            for context in storage.iter_processed_contexts(
+                context_types=[context_type],
+                filter=filter,
+                page_size=self.page_size,
+                need_vector=True,
+            ):
+                loaded.append(context)
+                if len(loaded) >= self.max_window_contexts:
+                    logger.warning(
+                        f"Compression window for {context_type} capped at "
+                        f"{self.max_window_contexts} contexts"
+                    )
+                    break
+            if loaded:
+                window[context_type] = loaded
+        return window
+
+    def _merge_clusters(
+        self, clusters: List[List[ProcessedContext]], stats: CompressionStats
+    ) -> Tuple[List[ProcessedContext], Dict[str, List[str]]]:
+        """Merge every cluster into its newest context using a bounded thread pool"""
+        merged_contexts: List[ProcessedContext] = []
+        ids_by_type: Dict[str, List[str]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.merger.merge_multiple, cluster[-1], cluster[:-1]): cluster
+                for cluster in clusters
+            }
+            for future in as_completed(futures):
+                cluster = futures[future]
+                try:
+                    merged = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to merge cluster into {cluster[-1].id}: {e}")
+                    merged = None
+                if not merged:
+                    stats.merges_failed += 1
+                    continue
+                stats.merges_done += 1
+                merged_contexts.append(merged)
+                for ctx in cluster:
+                    if ctx.id != merged.id:
+                        context_type = ctx.extracted_data.context_type.value
+                        ids_by_type.setdefault(context_type, []).append(ctx.id)
+        return merged_contexts, ids_by_type
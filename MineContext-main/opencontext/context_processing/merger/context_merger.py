@@ -8,11 +8,14 @@
 Context merge processor - Responsible for merging similar contexts into one.
 """
 import json
-import math
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from opencontext.config import GlobalConfig
+from opencontext.context_processing.merger.compression_engine import (
+    CompressionStats,
+    MemoryCompressionEngine,
+)
 from opencontext.context_processing.merger.cross_type_relationships import (
     CrossTypeRelationshipManager,
 )
@@ -23,11 +26,13 @@ from opencontext.context_processing.merger.merge_strategies import (
 from opencontext.context_processing.processor.base_processor import BaseContextProcessor
 from opencontext.llm.global_embedding_client import do_vectorize
 from opencontext.llm.global_vlm_client import generate_with_messages
+from opencontext.llm.request_scheduler import RequestPriority, with_priority
 from opencontext.models.context import *
 from opencontext.models.enums import ContextType, MergeType
 from opencontext.storage.global_storage import get_storage
 from opencontext.utils.json_parser import parse_json_from_response
 from opencontext.utils.logging_utils import get_logger
+from opencontext.utils.vector_math import cosine_similarity, greedy_similarity_groups
 
 logger = get_logger(__name__)
 
@@ -52,6 +57,9 @@ class ContextMerger(BaseContextProcessor):
         # Intelligent merging switch
         self.use_intelligent_merging = config.get("use_intelligent_merging", True)
 
+        self.compression_engine = MemoryCompressionEngine(self, config)
+        self._last_compression_stats: Optional[CompressionStats] = None
+
     @property
     def storage(self):
         """Get storage from global singleton"""
@@ -121,11 +129,10 @@ class ContextMerger(BaseContextProcessor):
             best_target = None
             best_score = 0.0
 
-            for candidate in candidates:
-                if candidate.id == context.id:
-                    continue
-
-                can_merge, score = strategy.can_merge(candidate, context)
+            candidates = [c for c in candidates if c.id != context.id]
+            # Vector similarities of all candidates are computed in one matrix product
+            merge_checks = strategy.can_merge_candidates(candidates, context)
+            for candidate, (can_merge, score) in zip(candidates, merge_checks):
                 if can_merge and score > best_score:
                     best_target = candidate
                     best_score = score
@@ -325,6 +332,7 @@ class ContextMerger(BaseContextProcessor):
             logger.info("Falling back to LLM-based merge")
             return self._merge_with_llm(target, sources)
 
+    @with_priority(RequestPriority.BACKGROUND)
     def _merge_with_llm(
         self, target: ProcessedContext, sources: List[ProcessedContext]
     ) -> Optional[ProcessedContext]:
@@ -462,88 +470,34 @@ class ContextMerger(BaseContextProcessor):
     def get_statistics(self):
         return self._statistics
 
-    def periodic_memory_compression(self, interval_seconds: int):
+    def periodic_memory_compression(self, interval_seconds: int) -> Optional[CompressionStats]:
         """
         定期对上下文进行记忆压缩
-        1. 获取指定时间窗口内、未压缩、可合并的上下文。
-        2. 对这些上下文按相似度进行分组。
-        3. 在每个分组内部，将较早的上下文合并到最新的一个上下文中。
-        4. 更新合并后的上下文，并删除被合并的源上下文。
+        1. 获取指定时间窗口内、未压缩、可合并的全部上下文。
+        2. 按类型对整个时间窗口做单遍 leader 聚类。
+        3. 在每个簇内部，将较早的上下文合并到最新的一个上下文中（有界线程池并发）。
+        4. 批量写入合并后的上下文，并批量删除被合并的源上下文。
         """
         if interval_seconds <= 0:
             logger.warning("interval_seconds must be greater than 0.")
-            return
+            return None
         logger.info("Starting periodic memory compression...")
         try:
-            # 1. 获取所有截图上下文
+            window_end = datetime.now() - timedelta(minutes=5)
             filter = {
                 "update_time_ts": {
-                    "$gte": int(
-                        (
-                            datetime.datetime.now()
-                            - timedelta(seconds=interval_seconds)
-                            - timedelta(minutes=5)
-                        ).timestamp()
-                    ),
-                    "$lte": int((datetime.datetime.now() - timedelta(minutes=5)).timestamp()),
+                    "$gte": int((window_end - timedelta(seconds=interval_seconds)).timestamp()),
+                    "$lte": int(window_end.timestamp()),
                 },
                 "has_compression": False,
                 "enable_merge": True,
             }
-            limit = 1000
-            offset = 0
-            while True:
-                contexts_by_backend = self.storage.get_all_processed_contexts(
-                    limit=limit, offset=offset, filter=filter
-                )
-
-                if not any(contexts_by_backend.values()):
-                    logger.info("No more recent contexts to process in this iteration.")
-                    break
-                has_merge = False
-                for backend_name, backend_contexts in contexts_by_backend.items():
-                    if len(backend_contexts) < 2:
-                        continue
-                    has_merge = True
-                    logger.info(
-                        f"Processing {len(backend_contexts)} contexts from backend '{backend_name}'."
-                    )
-
-                    groups = self._group_contexts_by_similarity(
-                        backend_contexts, self._similarity_threshold
-                    )
-
-                    for group in groups:
-                        if len(group) > 1:
-                            group.sort(key=lambda c: c.properties.create_time)
-                            target_candidate = group[-1]
-                            sources = group[:-1]
-
-                            logger.info(
-                                f"Merging {len(sources)} contexts into {target_candidate.id} within the group."
-                            )
-                            merged_context = self.merge_multiple(target_candidate, sources)
-                            if merged_context:
-                                self.storage.upsert_processed_context(merged_context)
-                                self.storage.delete_processed_context(
-                                    target_candidate.id,
-                                    target_candidate.extracted_data.context_type.value,
-                                )
-                                for ctx in sources:
-                                    self.storage.delete_processed_context(
-                                        ctx.id, ctx.extracted_data.context_type.value
-                                    )
-                                logger.info(
-                                    f"Successfully merged within group and cleaned up {len(sources)} source contexts."
-                                )
-
-                if not has_merge:
-                    break
-                offset += limit
-
-            logger.info("Periodic memory compression finished.")
+            stats = self.compression_engine.compress(filter, self._similarity_threshold)
+            self._last_compression_stats = stats
+            return stats
         except Exception as e:
             logger.exception(f"Error during periodic memory compression: {e}")
+            return None
 
     def _group_contexts_by_similarity(
         self, contexts: List[ProcessedContext], threshold: float
@@ -552,46 +506,14 @@ class ContextMerger(BaseContextProcessor):
         if not contexts:
             return []
 
-        groups = []
-        remaining_contexts = list(contexts)
-
-        while remaining_contexts:
-            seed = remaining_contexts.pop(0)
-            new_group = [seed]
-
-            # Use a list comprehension to build the list of contexts to remove, then iterate
-            to_remove = []
-            seed_embedding = seed.vectorize.vector
-            for i, ctx in enumerate(remaining_contexts):
-                ctx_embedding = ctx.vectorize.vector
-                if self._calculate_similarity(seed_embedding, ctx_embedding) > threshold:
-                    new_group.append(ctx)
-                    to_remove.append(i)
-
-            # Remove items in reverse index order to avoid index shifting issues
-            for i in sorted(to_remove, reverse=True):
-                remaining_contexts.pop(i)
-
-            groups.append(new_group)
-
-        return groups
+        index_groups = greedy_similarity_groups(
+            [ctx.vectorize.vector if ctx.vectorize else None for ctx in contexts], threshold
+        )
+        return [[contexts[i] for i in group] for group in index_groups]
 
     def _calculate_similarity(self, emb1: List[float], emb2: List[float]) -> float:
         """Calculates cosine similarity between two embeddings."""
-        if emb1 is None or emb2 is None or not emb1 or not emb2:
-            return 0.0
-
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(emb1, emb2))
-
-        # Calculate norms
-        norm_emb1 = math.sqrt(sum(a * a for a in emb1))
-        norm_emb2 = math.sqrt(sum(b * b for b in emb2))
-
-        if norm_emb1 == 0 or norm_emb2 == 0:
-            return 0.0
-
-        return dot_product / (norm_emb1 * norm_emb2)
+        return cosine_similarity(emb1, emb2)
 
     def intelligent_memory_cleanup(self):
         """
@@ -627,38 +549,26 @@ class ContextMerger(BaseContextProcessor):
         stats = {"checked": 0, "cleaned": 0, "errors": 0}
 
         try:
-            # 获取该类型的所有上下文
-            backend = self.storage._get_or_create_backend(context_type.value)
-            if not backend:
-                return stats
-
-            # 分批获取上下文进行清理
-            limit = 100
-            offset = 0
-
-            while True:
-                contexts = self._get_contexts_for_cleanup(context_type.value, limit, offset)
-                if not contexts:
-                    break
+            # 以游标分页流式遍历该类型的上下文，扫描结束后批量删除，避免删除打乱分页
+            expired_ids = []
+            for context in self.storage.iter_processed_contexts(
+                context_types=[context_type.value], page_size=100
+            ):
+                stats["checked"] += 1
 
-                for context in contexts:
-                    stats["checked"] += 1
-
-                    try:
-                        if strategy.should_cleanup(context):
-                            self.storage.delete_processed_context(context.id, context_type.value)
-                            stats["cleaned"] += 1
-                            logger.debug(
-                                f"Cleaned up context {context.id} of type {context_type.value}"
-                            )
+                try:
+                    if strategy.should_cleanup(context):
+                        expired_ids.append(context.id)
 
-                    except Exception as e:
-                        stats["errors"] += 1
-                        logger.error(f"Error cleaning up context {context.id}: {e}")
+                except Exception as e:
+                    stats["errors"] += 1
+                    logger.error(f"Error checking context {context.id} for cleanup: {e}")
 
-                if len(contexts) < limit:
-                    break
-                offset += limit
+            if expired_ids:
+                if self.storage.batch_delete_processed_contexts({context_type.value: expired_ids}):
+                    stats["cleaned"] += len(expired_ids)
+                else:
+                    stats["errors"] += len(expired_ids)
 
             logger.info(
                 f"Cleanup for {context_type.value}: checked {stats['checked']}, cleaned {stats['cleaned']}"
@@ -670,21 +580,6 @@ class ContextMerger(BaseContextProcessor):
 
         return stats
 
-    def _get_contexts_for_cleanup(
-        self, context_type_value: str, limit: int, offset: int
-    ) -> List[ProcessedContext]:
-        """获取需要清理检查的上下文"""
-        try:
-            contexts_dict = self.storage.get_all_processed_contexts(
-                limit=limit, offset=offset, filter={}
-            )
-
-            return contexts_dict.get(context_type_value, [])
-
-        except Exception as e:
-            logger.error(f"Error getting contexts for cleanup: {e}")
-            return []
-
     def memory_reinforcement(self, context_ids: List[str]):
         """
         记忆强化：重置指定上下文的遗忘状态，提升重要性
@@ -814,6 +709,9 @@ class ContextMerger(BaseContextProcessor):
 
         stats["strategy_configurations"] = strategy_stats
 
+        if self._last_compression_stats:
+            stats["last_compression"] = self._last_compression_stats.to_dict()
+
         # 添加跨类型关联统计
         if self.enable_cross_type_processing:
             stats["cross_type_statistics"] = self.cross_type_manager.get_conversion_statistics()
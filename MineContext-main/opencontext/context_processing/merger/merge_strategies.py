@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from opencontext.models.context import ExtractedData, ProcessedContext
 from opencontext.models.enums import ContextType, MergeType
 from opencontext.utils.logging_utils import get_logger
+from opencontext.utils.vector_math import cosine_similarity, similarities_to_query
 
 logger = get_logger(__name__)
 
@@ -42,9 +43,15 @@ class ContextTypeAwareStrategy(ABC):
         pass
 
     @abstractmethod
-    def can_merge(self, target: ProcessedContext, source: ProcessedContext) -> Tuple[bool, float]:
+    def can_merge(
+        self,
+        target: ProcessedContext,
+        source: ProcessedContext,
+        vector_similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
-        Determine if two contexts can be merged, return (can_merge, similarity_score)
+        Determine if two contexts can be merged, return (can_merge, similarity_score).
+        vector_similarity is the target/source vector similarity when already computed.
         """
         pass
 
@@ -105,6 +112,31 @@ class ContextTypeAwareStrategy(ABC):
         """Get type-specific merge prompt name"""
         return f"merging.{self.context_type.value}_merging"
 
+    def can_merge_candidates(
+        self, targets: List[ProcessedContext], source: ProcessedContext
+    ) -> List[Tuple[bool, float]]:
+        """
+        Run can_merge for several candidate targets against one source.
+        Vector similarities are computed up front as one matrix product.
+        """
+        source_vector = source.vectorize.vector if source.vectorize else None
+        target_vectors = [t.vectorize.vector if t.vectorize else None for t in targets]
+        sims = similarities_to_query(source_vector, target_vectors)
+        results = []
+        for target, target_vector, sim in zip(targets, target_vectors, sims.tolist()):
+            if target_vector is None or source_vector is None:
+                sim = None
+            results.append(self.can_merge(target, source, sim))
+        return results
+
+    def _calculate_cosine_similarity(
+        self, vec1: List[float], vec2: List[float], precomputed: Optional[float] = None
+    ) -> float:
+        """计算余弦相似度"""
+        if precomputed is not None:
+            return precomputed
+        return cosine_similarity(vec1, vec2)
+
 
 class ProfileContextStrategy(ContextTypeAwareStrategy):
     """Personal identity profile merge strategy"""
@@ -112,7 +144,12 @@ class ProfileContextStrategy(ContextTypeAwareStrategy):
     def get_context_type(self) -> ContextType:
         return ContextType.ENTITY_CONTEXT
 
-    def can_merge(self, target: ProcessedContext, source: ProcessedContext) -> Tuple[bool, float]:
+    def can_merge(
+        self,
+        target: ProcessedContext,
+        source: ProcessedContext,
+        vector_similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
         Profile type merge criteria:
         1. High entity overlap (same person)
@@ -136,7 +173,7 @@ class ProfileContextStrategy(ContextTypeAwareStrategy):
         # Vector similarity check
         if target.vectorize and source.vectorize:
             vector_sim = self._calculate_cosine_similarity(
-                target.vectorize.vector, source.vectorize.vector
+                target.vectorize.vector, source.vectorize.vector, vector_similarity
             )
 
             # Profile type requires higher similarity threshold
@@ -211,20 +248,6 @@ class ProfileContextStrategy(ContextTypeAwareStrategy):
         # 简化的摘要合并，实际应该用LLM进行智能融合
         return f"综合{len(summaries)}项记录的身份信息: " + "; ".join(summaries[:3])
 
-    def _calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """计算余弦相似度"""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
-
     def _create_merged_context(
         self, target: ProcessedContext, sources: List[ProcessedContext], merged_data: Dict[str, Any]
     ) -> ProcessedContext:
@@ -267,7 +290,12 @@ class ActivityContextStrategy(ContextTypeAwareStrategy):
     def get_context_type(self) -> ContextType:
         return ContextType.ACTIVITY_CONTEXT
 
-    def can_merge(self, target: ProcessedContext, source: ProcessedContext) -> Tuple[bool, float]:
+    def can_merge(
+        self,
+        target: ProcessedContext,
+        source: ProcessedContext,
+        vector_similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
         Activity类型的合并判断：
         1. 时间窗口内的活动
@@ -307,7 +335,7 @@ class ActivityContextStrategy(ContextTypeAwareStrategy):
             # 向量相似度检查
             if target.vectorize and source.vectorize:
                 vector_sim = self._calculate_cosine_similarity(
-                    target.vectorize.vector, source.vectorize.vector
+                    target.vectorize.vector, source.vectorize.vector, vector_similarity
                 )
 
                 if vector_sim > 0.7:  # Activity相似度阈值
@@ -386,20 +414,6 @@ class ActivityContextStrategy(ContextTypeAwareStrategy):
 
         return f"包含{len(contexts)}个活动的序列: " + " -> ".join(key_activities[:5])
 
-    def _calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """计算余弦相似度"""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
-
     def _create_merged_context(
         self, target: ProcessedContext, sources: List[ProcessedContext], merged_data: Dict[str, Any]
     ) -> ProcessedContext:
@@ -445,7 +459,12 @@ class StateContextStrategy(ContextTypeAwareStrategy):
     def get_context_type(self) -> ContextType:
         return ContextType.STATE_CONTEXT
 
-    def can_merge(self, target: ProcessedContext, source: ProcessedContext) -> Tuple[bool, float]:
+    def can_merge(
+        self,
+        target: ProcessedContext,
+        source: ProcessedContext,
+        vector_similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
         State类型的合并判断：
         1. 很短的时间窗口（分钟级）
@@ -634,7 +653,12 @@ class IntentContextStrategy(ContextTypeAwareStrategy):
     def get_context_type(self) -> ContextType:
         return ContextType.INTENT_CONTEXT
 
-    def can_merge(self, target: ProcessedContext, source: ProcessedContext) -> Tuple[bool, float]:
+    def can_merge(
+        self,
+        target: ProcessedContext,
+        source: ProcessedContext,
+        vector_similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
         Intent类型的合并判断：
         1. 相同目标或项目的意图
@@ -666,7 +690,7 @@ class IntentContextStrategy(ContextTypeAwareStrategy):
             # 向量相似度检查
             if target.vectorize and source.vectorize:
                 vector_sim = self._calculate_cosine_similarity(
-                    target.vectorize.vector, source.vectorize.vector
+                    target.vectorize.vector, source.vectorize.vector, vector_similarity
                 )
 
                 if vector_sim > 0.75:  # Intent相似度阈值
@@ -798,20 +822,6 @@ class IntentContextStrategy(ContextTypeAwareStrategy):
             # 未完成的意图需要保留
             return base_prob * 0.7
 
-    def _calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """计算余弦相似度"""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
-
     def _create_merged_context(
         self, target: ProcessedContext, sources: List[ProcessedContext], merged_data: Dict[str, Any]
     ) -> ProcessedContext:
@@ -857,7 +867,12 @@ class SemanticContextStrategy(ContextTypeAwareStrategy):
     def get_context_type(self) -> ContextType:
         return ContextType.SEMANTIC_CONTEXT
 
-    def can_merge(self, target: ProcessedContext, source: ProcessedContext) -> Tuple[bool, float]:
+    def can_merge(
+        self,
+        target: ProcessedContext,
+        source: ProcessedContext,
+        vector_similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
         Semantic类型的合并判断：
         1. 概念相关性
@@ -889,7 +904,7 @@ class SemanticContextStrategy(ContextTypeAwareStrategy):
             # 向量相似度检查
             if target.vectorize and source.vectorize:
                 vector_sim = self._calculate_cosine_similarity(
-                    target.vectorize.vector, source.vectorize.vector
+                    target.vectorize.vector, source.vectorize.vector, vector_similarity
                 )
 
                 if vector_sim > 0.72:  # Semantic相似度阈值
@@ -1009,20 +1024,6 @@ class SemanticContextStrategy(ContextTypeAwareStrategy):
 
         return f"知识整合的{len(all_contexts)}个相关概念: " + "; ".join(key_concepts)
 
-    def _calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """计算余弦相似度"""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
-
     def _create_merged_context(
         self, target: ProcessedContext, sources: List[ProcessedContext], merged_data: Dict[str, Any]
     ) -> ProcessedContext:
@@ -1065,7 +1066,12 @@ class ProceduralContextStrategy(ContextTypeAwareStrategy):
     def get_context_type(self) -> ContextType:
         return ContextType.PROCEDURAL_CONTEXT
 
-    def can_merge(self, target: ProcessedContext, source: ProcessedContext) -> Tuple[bool, float]:
+    def can_merge(
+        self,
+        target: ProcessedContext,
+        source: ProcessedContext,
+        vector_similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
         Procedural类型的合并判断：
         1. 相同工具或方法
@@ -1097,7 +1103,7 @@ class ProceduralContextStrategy(ContextTypeAwareStrategy):
             # 向量相似度检查
             if target.vectorize and source.vectorize:
                 vector_sim = self._calculate_cosine_similarity(
-                    target.vectorize.vector, source.vectorize.vector
+                    target.vectorize.vector, source.vectorize.vector, vector_similarity
                 )
 
                 if vector_sim > 0.75:  # Procedural相似度阈值
@@ -1217,20 +1223,6 @@ class ProceduralContextStrategy(ContextTypeAwareStrategy):
 
         return f"包含{len(all_contexts)}个相关操作流程的整合指南: " + "; ".join(key_procedures[:5])
 
-    def _calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """计算余弦相似度"""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
-
     def _create_merged_context(
         self, target: ProcessedContext, sources: List[ProcessedContext], merged_data: Dict[str, Any]
     ) -> ProcessedContext:
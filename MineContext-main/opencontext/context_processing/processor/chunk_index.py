@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Document chunk index for incremental re-processing
+Records, per document, the content hash and context id of every stored chunk, together with
+the LLM splits and VLM page texts that produced them, so an updated document only pays for
+the parts that changed.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from opencontext.models.context import RawContextProperties
+from opencontext.models.enums import ContextSource
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Kinds of cached intermediate results
+FRAGMENT_SPLIT = "split"
+FRAGMENT_PAGE = "page"
+
+
+def content_hash(content: Any) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def vault_document_key(vault_id: Any) -> str:
+    return f"vault:{vault_id}"
+
+
+def document_key(raw_context: RawContextProperties) -> Optional[str]:
+    """Identity of a document across versions, None for one-off inputs"""
+    if raw_context.source == ContextSource.VAULT:
+        vault_id = (raw_context.additional_info or {}).get("vault_id")
+        return vault_document_key(vault_id) if vault_id is not None else None
+    if raw_context.source in (ContextSource.LOCAL_FILE, ContextSource.WEB_LINK):
+        return raw_context.content_path or None
+    return None
+
+
+@dataclass
+class DocumentRevision:
+    """
+    The previous version of a document as recorded in the index, and the version being built.
+
+    Chunks are matched by text hash: a chunk whose text was already stored keeps its
+    context, everything left unmatched in the previous version is stale once the new
+    version has been stored.
+    """
+
+    document_key: str
+    previous_chunks: Dict[str, List[str]] = field(default_factory=dict)
+    previous_fragments: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    chunks: List[Tuple[str, str]] = field(default_factory=list)
+    fragments: Dict[str, Dict[str, Any]] = field(default_factory=lambda: defaultdict(dict))
+    reuse: bool = True
+    reused_chunks: int = 0
+    fragment_hits: int = 0
+
+    @property
+    def known(self) -> bool:
+        return bool(self.previous_chunks)
+
+    def reuse_chunk(self, chunk_hash: str) -> Optional[str]:
+        """Context id of an unchanged chunk, claimed so a duplicate cannot take it again"""
+        if not self.reuse:
+            return None
+        ids = self.previous_chunks.get(chunk_hash)
+        if not ids:
+            return None
+        context_id = ids.pop(0)
+        self.chunks.append((chunk_hash, context_id))
+        self.reused_chunks += 1
+        return context_id
+
+    def add_chunk(self, chunk_hash: str, context_id: str):
+        self.chunks.append((chunk_hash, context_id))
+
+    def stale_context_ids(self) -> List[str]:
+        return [context_id for ids in self.previous_chunks.values() for context_id in ids]
+
+    def context_ids(self) -> List[str]:
+        return [context_id for _, context_id in self.chunks]
+
+    def get_fragment(self, kind: str, key: str) -> Optional[Any]:
+        """Result computed for the same input by the previous version"""
+        if not self.reuse:
+            return None
+        value = self.previous_fragments.get(kind, {}).get(key)
+        if value is not None:
+            self.fragments[kind][key] = value
+            self.fragment_hits += 1
+        return value
+
+    def put_fragment(self, kind: str, key: str, value: Any):
+        self.fragments[kind][key] = value
+
+    # Split cache interface of DocumentTextChunker
+    def get_split(self, text: str) -> Optional[List[str]]:
+        return self.get_fragment(FRAGMENT_SPLIT, content_hash(text))
+
+    def put_split(self, text: str, parts: List[str]):
+        self.put_fragment(FRAGMENT_SPLIT, content_hash(text), parts)
+
+
+class DocumentChunkIndex:
+    """
+    SQLite record of the chunks and cached intermediate results of each document's latest
+    stored version. Without a path, or when the database file cannot be opened, the index
+    lives in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        if path:
+            self._open(path)
+        if self._conn is None:
+            self._open(":memory:")
+
+    def _open(self, path: str):
+        try:
+            if path != ":memory:":
+                dir_name = os.path.dirname(path)
+                if dir_name:
+                    os.makedirs(dir_name, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS document_chunks (
+                    document_key TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    chunk_hash TEXT NOT NULL,
+                    context_id TEXT NOT NULL,
+                    PRIMARY KEY (document_key, position)
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS document_fragments (
+                    document_key TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    fragment_hash TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (document_key, kind, fragment_hash)
+                )
+                """
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.error(
+                f"Failed to open document chunk index at {path}, keeping it in memory: {e}"
+            )
+            self._conn = None
+
+    def load(self, key: str, reuse: bool = True) -> DocumentRevision:
+        revision = DocumentRevision(document_key=key, reuse=reuse)
+        if self._conn is None:
+            return revision
+        with self._lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT chunk_hash, context_id FROM document_chunks "
+                    "WHERE document_key = ? ORDER BY position",
+                    (key,),
+                )
+                for chunk_hash, context_id in rows:
+                    revision.previous_chunks.setdefault(chunk_hash, []).append(context_id)
+                rows = self._conn.execute(
+                    "SELECT kind, fragment_hash, value FROM document_fragments "
+                    "WHERE document_key = ?",
+                    (key,),
+                )
+                for kind, fragment_hash, value in rows:
+                    revision.previous_fragments.setdefault(kind, {})[fragment_hash] = json.loads(
+                        value
+                    )
+            except Exception as e:
+                logger.error(f"Failed to load chunk index of {key}: {e}")
+        return revision
+
+    def save(self, revision: DocumentRevision):
+        """Replace the recorded version of a document with a newly stored one"""
+        if self._conn is None:
+            return
+        key = revision.document_key
+        chunk_rows = [
+            (key, position, chunk_hash, context_id)
+            for position, (chunk_hash, context_id) in enumerate(revision.chunks)
+        ]
+        fragment_rows = [
+            (key, kind, fragment_hash, json.dumps(value, ensure_ascii=False))
+            for kind, values in revision.fragments.items()
+            for fragment_hash, value in values.items()
+        ]
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM document_chunks WHERE document_key = ?", (key,))
+                    self._conn.execute(
+                        "DELETE FROM document_fragments WHERE document_key = ?", (key,)
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO document_chunks VALUES (?, ?, ?, ?)", chunk_rows
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO document_fragments VALUES (?, ?, ?, ?)", fragment_rows
+                    )
+            except Exception as e:
+                logger.error(f"Failed to save chunk index of {key}: {e}")
+
+    def pop(self, key: str) -> List[str]:
+        """Forget a document, returning the context ids recorded for it"""
+        if self._conn is None:
+            return []
+        with self._lock:
+            try:
+                with self._conn:
+                    ids = [
+                        row[0]
+                        for row in self._conn.execute(
+                            "SELECT context_id FROM document_chunks WHERE document_key = ?",
+                            (key,),
+                        )
+                    ]
+                    self._conn.execute("DELETE FROM document_chunks WHERE document_key = ?", (key,))
+                    self._conn.execute(
+                        "DELETE FROM document_fragments WHERE document_key = ?", (key,)
+                    )
+                return ids
+            except Exception as e:
+                logger.error(f"Failed to remove {key} from chunk index: {e}")
+                return []
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_chunk_index: Optional[DocumentChunkIndex] = None
+_chunk_index_lock = threading.Lock()
+
+
+def get_document_chunk_index() -> DocumentChunkIndex:
+    """Process-wide chunk index, shared by the document processor and the monitors"""
+    global _chunk_index
+    if _chunk_index is None:
+        with _chunk_index_lock:
+            if _chunk_index is None:
+                from opencontext.config.global_config import get_config
+
+                config = get_config("processing.document_processor") or {}
+                _chunk_index = DocumentChunkIndex(config.get("chunk_index_path"))
+    return _chunk_index
@@ -12,10 +12,14 @@ Provides document conversion and analysis functions:
 - Page-by-page analysis (PDF/DOCX): Extract text + detect visual elements
 """
 
+import multiprocessing
 import os
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
 
 from PIL import Image
 
@@ -23,6 +27,52 @@ from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# PDFium is not thread-safe, even across documents: every in-process call holds this lock
+_pdfium_lock = threading.Lock()
+
+# Document opened by a render worker process, reused while it renders pages of one file
+_worker_document: Optional[Tuple[Tuple[str, float, int], Any]] = None
+
+
+def _page_render_scale(width: float, height: float, dpi: int, max_image_size: int) -> float:
+    """pdfium scale (1 = 72 DPI) for `dpi`, reduced so the longer side fits max_image_size"""
+    scale = dpi / 72.0
+    longest = max(width, height)
+    if max_image_size > 0 and longest > 0:
+        scale = min(scale, max_image_size / longest)
+    return scale
+
+
+def _render_page(pdf: Any, page_index: int, dpi: int, max_image_size: int) -> Image.Image:
+    page = pdf[page_index]
+    try:
+        width, height = page.get_size()
+        scale = _page_render_scale(width, height, dpi, max_image_size)
+        image = page.render(scale=scale).to_pil()
+    finally:
+        page.close()
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image
+
+
+def _render_pdf_page_worker(
+    pdf_path: str, page_index: int, dpi: int, max_image_size: int
+) -> Tuple[Tuple[int, int], bytes]:
+    """Render one page in a worker process, returning raw RGB pixels"""
+    global _worker_document
+    import pypdfium2 as pdfium
+
+    stat = os.stat(pdf_path)
+    key = (pdf_path, stat.st_mtime, stat.st_size)
+    if _worker_document is None or _worker_document[0] != key:
+        if _worker_document is not None:
+            _worker_document[1].close()
+            _worker_document = None
+        _worker_document = (key, pdfium.PdfDocument(pdf_path))
+    image = _render_page(_worker_document[1], page_index, dpi, max_image_size)
+    return image.size, image.tobytes()
+
 
 class PageInfo:
     """Page information container"""
@@ -46,8 +96,39 @@ class PageInfo:
 class DocumentConverter:
     """Document Converter - read once, provide all information"""
 
-    def __init__(self, dpi: int = 200):
+    def __init__(self, dpi: int = 200, max_image_size: int = 0, render_workers: int = 0):
+        """
+        Args:
+            dpi: Target resolution for rendering PDF pages
+            max_image_size: Upper bound for the longer side of a rendered page in pixels,
+                the DPI is lowered for large pages (0 = no limit)
+            render_workers: Processes rendering PDF pages off the calling thread
+                (0 = render in the calling thread)
+        """
         self.dpi = dpi
+        self.max_image_size = max_image_size or 0
+        self.render_workers = max(0, int(render_workers or 0))
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self._render_pool_lock = threading.Lock()
+
+    def close(self):
+        """Shut down the page render processes"""
+        with self._render_pool_lock:
+            if self._render_pool is not None:
+                self._render_pool.shutdown(wait=False, cancel_futures=True)
+                self._render_pool = None
+
+    def _get_render_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.render_workers <= 0:
+            return None
+        with self._render_pool_lock:
+            if self._render_pool is None:
+                # spawn: forking a process that runs other threads can deadlock the child
+                self._render_pool = ProcessPoolExecutor(
+                    max_workers=self.render_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._render_pool
 
     def convert_to_images(self, file_path: str) -> List[Image.Image]:
         """Convert document to image list"""
@@ -69,26 +150,82 @@ class DocumentConverter:
     def _convert_pdf_to_images(self, pdf_path: str) -> List[Image.Image]:
         """Convert PDF to image list (using pypdfium2)"""
         try:
-            import pypdfium2 as pdfium
-
-            pdf = pdfium.PdfDocument(pdf_path)
-            images = []
-            for page_index in range(len(pdf)):
-                page = pdf[page_index]
-                # Render page as PIL Image
-                # scale parameter controls resolution: scale=1 corresponds to 72 DPI
-                scale = self.dpi / 72.0
-                pil_image = page.render(scale=scale).to_pil()
-                if pil_image.mode != "RGB":
-                    pil_image = pil_image.convert("RGB")
-                images.append(pil_image)
-            pdf.close()
-            return images
-
+            return [image for _, image in self.iter_pdf_pages(pdf_path)]
         except Exception as e:
             logger.exception(f"Error converting PDF: {e}")
             raise
 
+    def iter_pdf_pages(
+        self,
+        pdf_path: str,
+        page_numbers: Optional[Iterable[int]] = None,
+        prefetch: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Lazily render PDF pages, yielding (page_number, image) in the requested order.
+
+        Only the requested pages are rendered. With render workers, up to `prefetch` pages
+        (default: one per worker) are rendered ahead of the consumer, so memory stays bounded
+        no matter how long the document is.
+
+        Args:
+            pdf_path: PDF file path
+            page_numbers: 1-based page numbers, all pages when None
+        """
+        import pypdfium2 as pdfium
+
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"File not found: {pdf_path}")
+
+        if page_numbers is None:
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(pdf_path)
+                try:
+                    page_numbers = range(1, len(pdf) + 1)
+                finally:
+                    pdf.close()
+
+        pool = self._get_render_pool()
+        if pool is None:
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                for page_number in page_numbers:
+                    # Locked per page, not across the yield, so other ingest threads interleave
+                    with _pdfium_lock:
+                        image = _render_page(pdf, page_number - 1, self.dpi, self.max_image_size)
+                    yield page_number, image
+            finally:
+                with _pdfium_lock:
+                    pdf.close()
+            return
+
+        prefetch = max(1, prefetch if prefetch is not None else self.render_workers)
+        pending: Deque[Tuple[int, Future]] = deque()
+        page_iter = iter(page_numbers)
+        try:
+            while True:
+                while len(pending) < prefetch:
+                    page_number = next(page_iter, None)
+                    if page_number is None:
+                        break
+                    future = pool.submit(
+                        _render_pdf_page_worker,
+                        pdf_path,
+                        page_number - 1,
+                        self.dpi,
+                        self.max_image_size,
+                    )
+                    pending.append((page_number, future))
+                if not pending:
+                    return
+                page_number, future = pending.popleft()
+                size, pixels = future.result()
+                yield page_number, Image.frombytes("RGB", size, pixels)
+        finally:
+            for _, future in pending:
+                future.cancel()
+
     def _load_image(self, image_path: str) -> List[Image.Image]:
         """Load single image"""
         logger.info(f"Loading image: {image_path}")
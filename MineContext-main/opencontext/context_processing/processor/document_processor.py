@@ -9,13 +9,18 @@ Document Processor
 """
 
 import asyncio
+import contextlib
 import datetime
+import itertools
+import multiprocessing
 import os
 import queue
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from PIL import Image
 
@@ -26,17 +31,82 @@ from opencontext.context_processing.chunker import (
     StructuredFileChunker,
 )
 from opencontext.context_processing.processor.base_processor import BaseContextProcessor
+from opencontext.context_processing.processor.chunk_index import (
+    FRAGMENT_PAGE,
+    DocumentRevision,
+    content_hash,
+    document_key,
+    get_document_chunk_index,
+)
 from opencontext.context_processing.processor.document_converter import DocumentConverter, PageInfo
+from opencontext.context_processing.processor.ingest_progress import DocumentIngestTracker
 from opencontext.llm.global_vlm_client import generate_with_messages_async
+from opencontext.llm.request_scheduler import RequestPriority, with_priority
 from opencontext.models.context import *
 from opencontext.models.enums import *
 from opencontext.monitoring.monitor import record_processing_error
 from opencontext.storage.global_storage import get_storage
+from opencontext.utils.async_loop import BackgroundEventLoop
 from opencontext.utils.json_parser import parse_json_from_response
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Called with (raw_context, context_ids) after a document's contexts have been stored
+_ingest_listeners: List[Callable[[RawContextProperties, List[str]], None]] = []
+_ingest_listeners_lock = threading.Lock()
+
+
+def add_ingest_listener(listener: Callable[[RawContextProperties, List[str]], None]):
+    """Register a callback told which contexts each ingested document produced"""
+    with _ingest_listeners_lock:
+        _ingest_listeners.append(listener)
+
+
+def remove_ingest_listener(listener: Callable[[RawContextProperties, List[str]], None]):
+    with _ingest_listeners_lock:
+        if listener in _ingest_listeners:
+            _ingest_listeners.remove(listener)
+
+
+def _notify_ingest_listeners(raw_context: RawContextProperties, context_ids: List[str]):
+    with _ingest_listeners_lock:
+        listeners = list(_ingest_listeners)
+    for listener in listeners:
+        try:
+            listener(raw_context, context_ids)
+        except Exception as e:
+            logger.exception(f"Document ingest listener failed: {e}")
+
+
+def _image_hash(image: Image.Image) -> str:
+    return content_hash(f"{image.mode}:{image.size}:".encode("utf-8") + image.tobytes())
+
+
+def _process_pool_size(value: Any) -> int:
+    """Resolve a process count setting, "auto" leaves one core to the worker threads"""
+    if value is None or value == "auto":
+        return min(2, max(0, (os.cpu_count() or 1) - 1))
+    return max(0, int(value))
+
+
+def _analyze_document_pages(file_path: str, file_ext: str, text_threshold: int) -> List[PageInfo]:
+    """Page analysis (text extraction and visual element detection), run in a parse worker"""
+    converter = DocumentConverter()
+    if file_ext == ".pdf":
+        return converter.analyze_pdf_pages(file_path, text_threshold)
+    if file_ext in [".docx", ".doc"]:
+        return converter.analyze_docx_pages(file_path)
+    if file_ext == ".md":
+        return converter.analyze_markdown_pages(file_path)
+    raise ValueError(f"Unsupported file type for page-by-page: {file_ext}")
+
+
+def _chunk_structured_document(raw_context: RawContextProperties, faq: bool) -> List[Chunk]:
+    """Structured file chunking (CSV/XLSX/JSONL), run in a parse worker"""
+    chunker = FAQChunker() if faq else StructuredFileChunker()
+    return list(chunker.chunk(raw_context))
+
 
 class DocumentProcessor(BaseContextProcessor):
     """
@@ -52,11 +122,18 @@ class DocumentProcessor(BaseContextProcessor):
         # Configuration parameters
         self._batch_size = self.config.get("batch_size", 5)
         self._batch_timeout = self.config.get("batch_timeout", 30)
+        self._workers = max(1, self.config.get("workers", 4))
+        self._parse_workers = _process_pool_size(self.config.get("parse_workers"))
+        self._smallest_first = self.config.get("ingest_order", "smallest_first") == "smallest_first"
+        self._max_queued_documents = self.config.get("max_queued_documents", 1000)
+        self._incremental = self.config.get("incremental", True)
 
         # Get document processing config
         doc_processing_config = get_config("document_processing") or {}
         self._enabled = doc_processing_config.get("enabled", True)
         self._dpi = doc_processing_config.get("dpi", 200)
+        self._max_image_size = doc_processing_config.get("max_image_size", 0)
+        self._render_workers = _process_pool_size(doc_processing_config.get("render_workers"))
         self._vlm_batch_size = doc_processing_config.get(
             "vlm_batch_size", doc_processing_config.get("batch_size", 6)
         )
@@ -65,33 +142,74 @@ class DocumentProcessor(BaseContextProcessor):
         # Thread control
         self._stop_event = threading.Event()
 
-        # Queue and background thread
-        self._input_queue = queue.Queue(maxsize=self._batch_size * 2)
-        self._processing_task = threading.Thread(target=self._run_processing_loop, daemon=True)
-        self._processing_task.start()
+        # VLM requests of every batch run on one long-lived loop, reusing client connections
+        self._event_loop = BackgroundEventLoop("document-processor-loop")
+
+        # Priority queue of (priority, sequence, context), drained by a pool of worker threads
+        self._input_queue = queue.PriorityQueue(
+            maxsize=max(self._batch_size * 2, self._max_queued_documents)
+        )
+        self._sequence = itertools.count()
+        self._ingest_tracker = DocumentIngestTracker(workers=self._workers)
+        self._local = threading.local()
+
+        # Chunks of each document's last stored version, diffed against on re-ingest.
+        # Versions of one document are processed one at a time so the diffs do not race.
+        self._chunk_index = get_document_chunk_index()
+        self._document_locks: Dict[str, list] = {}
+        self._document_locks_guard = threading.Lock()
+
+        # CPU-bound parsing and structured chunking run in processes, off the worker threads
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+
         # Document converter
-        self._document_converter = DocumentConverter(dpi=self._dpi)
+        self._document_converter = DocumentConverter(
+            dpi=self._dpi,
+            max_image_size=self._max_image_size,
+            render_workers=self._render_workers,
+        )
 
-        # Structured document chunker
-        self._structured_chunker = StructuredFileChunker()
-        self._faq_chunker = FAQChunker()
+        # Document text chunker
         self._document_chunker = DocumentTextChunker(
             config=ChunkingConfig(
                 max_chunk_size=1000,
                 min_chunk_size=100,
                 chunk_overlap=100,
-            )
+            ),
+            event_loop=self._event_loop,
         )
 
-        logger.info("DocumentProcessor initialized ")
+        self._processing_tasks = [
+            threading.Thread(
+                target=self._run_processing_loop, name=f"document-ingest-{i}", daemon=True
+            )
+            for i in range(self._workers)
+        ]
+        for task in self._processing_tasks:
+            task.start()
+
+        logger.info(f"DocumentProcessor initialized with {self._workers} ingest workers")
 
     def shutdown(self, _graceful: bool = False):
         """Gracefully shutdown background processing task"""
         self._stop_event.set()
-        self._input_queue.put(None)
-        self._processing_task.join(timeout=10)
-        if self._processing_task.is_alive():
+        for _ in self._processing_tasks:
+            try:
+                self._input_queue.put_nowait((-1, next(self._sequence), None))
+            except queue.Full:
+                break
+        deadline = time.time() + 10
+        for task in self._processing_tasks:
+            task.join(timeout=max(0, deadline - time.time()))
+        if any(task.is_alive() for task in self._processing_tasks):
             logger.warning("UnifiedDocumentProcessor background task failed to stop in time.")
+        self._event_loop.close()
+        self._document_converter.close()
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=False, cancel_futures=True)
+                self._parse_pool = None
         logger.info("UnifiedDocumentProcessor has been shut down.")
 
     def get_name(self) -> str:
@@ -147,7 +265,7 @@ class DocumentProcessor(BaseContextProcessor):
         return file_type in STRUCTURED_FILE_TYPES
 
     def _is_text_content(self, context: RawContextProperties) -> bool:
-        return context.source == ContextSource.INPUT
+        return context.source in (ContextSource.INPUT, ContextSource.VAULT)
 
     def _is_visual_document(self, context: RawContextProperties) -> bool:
         if context.source not in [ContextSource.LOCAL_FILE, ContextSource.WEB_LINK]:
@@ -188,19 +306,32 @@ class DocumentProcessor(BaseContextProcessor):
         if not self.can_process(context):
             return False
         try:
-            self._input_queue.put(context)
+            size = self._document_size(context)
+            priority = size if self._smallest_first else 0
+            self._ingest_tracker.queued(context.object_id, context.content_path or "", size)
+            self._input_queue.put((priority, next(self._sequence), context))
             return True
         except Exception as e:
             logger.exception(f"Error queuing document {context.object_id}: {e}")
+            self._ingest_tracker.finished(context.object_id, success=False)
             return False
 
+    @staticmethod
+    def _document_size(context: RawContextProperties) -> int:
+        if context.content_path and os.path.exists(context.content_path):
+            return os.path.getsize(context.content_path)
+        return len(context.content_text or "")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = super().get_statistics()
+        stats["ingest"] = self._ingest_tracker.get_status()
+        return stats
+
     def _run_processing_loop(self):
-        """Background processing loop (consume documents from queue)"""
+        """Worker loop, consumes documents from the queue until shutdown"""
         while not self._stop_event.is_set():
-            unprocessed_context = None
             try:
-                raw_context = self._input_queue.get(timeout=self._batch_timeout)
-                unprocessed_context = raw_context
+                _, _, raw_context = self._input_queue.get(timeout=self._batch_timeout)
             except queue.Empty:
                 continue
             except Exception as e:
@@ -208,27 +339,126 @@ class DocumentProcessor(BaseContextProcessor):
                 time.sleep(3)
                 continue
 
-            if unprocessed_context:
-                time_start = int(time.time())
-                try:
-                    processed_contexts = self.real_process(unprocessed_context)
-                    if processed_contexts:
-                        get_storage().batch_upsert_processed_context(processed_contexts)
-                except Exception as e:
-                    logger.exception(f"Unexpected error in real_process: {e}")
+            if raw_context is None:
+                break
+            self._ingest_document(raw_context)
+
+    def _ingest_document(self, raw_context: RawContextProperties):
+        object_id = raw_context.object_id
+        time_start = time.time()
+        success = False
+        self._local.object_id = object_id
+        self._ingest_tracker.started(object_id)
+        key = document_key(raw_context)
+        try:
+            with self._document_lock(key):
+                revision = None
+                if key is not None:
+                    revision = self._chunk_index.load(key, reuse=self._incremental)
+                self._local.revision = revision
+                processed_contexts = self.real_process(raw_context)
+                if processed_contexts:
+                    self._set_ingest_stage("storing")
+                    get_storage().batch_upsert_processed_context(processed_contexts)
+                success = processed_contexts is not False
+                if success:
+                    context_ids = [ctx.id for ctx in processed_contexts]
+                    if revision is not None:
+                        self._commit_revision(raw_context, revision)
+                        context_ids = revision.context_ids()
+                    _notify_ingest_listeners(raw_context, context_ids)
+        except Exception as e:
+            logger.exception(f"Unexpected error in real_process: {e}")
+        finally:
+            self._local.object_id = None
+            self._local.revision = None
+            self._ingest_tracker.finished(object_id, success)
+
+        logger.info(f"Processed document {object_id} in {time.time() - time_start:.1f} seconds")
+
+    @contextlib.contextmanager
+    def _document_lock(self, key: Optional[str]):
+        if key is None:
+            yield
+            return
+        with self._document_locks_guard:
+            entry = self._document_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._document_locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._document_locks[key]
+
+    def _commit_revision(self, raw_context: RawContextProperties, revision: DocumentRevision):
+        """Remove chunks the new version no longer has, then record the new version"""
+        stale_ids = revision.stale_context_ids()
+        if not revision.known:
+            # Ingested before chunks were recorded, the caller may still know its contexts
+            stale_ids = (raw_context.additional_info or {}).get("previous_context_ids") or []
+        if stale_ids:
+            get_storage().batch_delete_processed_contexts(
+                {ContextType.KNOWLEDGE_CONTEXT.value: stale_ids}
+            )
+        self._chunk_index.save(revision)
+        if revision.known:
+            logger.info(
+                f"Re-processed {revision.document_key}: {revision.reused_chunks} chunks unchanged, "
+                f"{len(revision.chunks) - revision.reused_chunks} new, {len(stale_ids)} removed, "
+                f"{revision.fragment_hits} cached splits/pages reused"
+            )
+
+    def _current_revision(self) -> Optional[DocumentRevision]:
+        """Chunk index revision of the document being ingested by the calling worker thread"""
+        return getattr(self._local, "revision", None)
+
+    def _current_object_id(self) -> Optional[str]:
+        """Id of the document being ingested by the calling worker thread"""
+        return getattr(self._local, "object_id", None)
+
+    def _set_ingest_stage(self, stage: str, units_total: Optional[int] = None):
+        object_id = self._current_object_id()
+        if object_id is not None:
+            self._ingest_tracker.stage(object_id, stage, units_total)
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._parse_workers <= 0:
+            return None
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                # spawn: forking a process that runs other threads can deadlock the child
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self._parse_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._parse_pool
 
-                time_end = int(time.time())
-                logger.info(f"Processed 1 document in {time_end - time_start} seconds")
+    def _run_cpu_bound(self, func: Callable, *args) -> Any:
+        """Run a module-level function in the parse pool, or inline when there is none"""
+        pool = self._get_parse_pool()
+        if pool is None:
+            return func(*args)
+        try:
+            return pool.submit(func, *args).result()
+        except BrokenProcessPool:
+            logger.warning("Document parse pool broke, recreating it and parsing inline")
+            with self._parse_pool_lock:
+                if self._parse_pool is pool:
+                    self._parse_pool = None
+            return func(*args)
 
     def real_process(self, raw_context: RawContextProperties) -> List[ProcessedContext]:
         """处理文档"""
         start_time = time.time()
         try:
             all_processed_contexts = []
-            if self._is_structured_document(raw_context):
-                contexts = self._process_structured_document(raw_context)
-            elif self._is_text_content(raw_context):
+            if self._is_text_content(raw_context):
                 contexts = self._process_text_content(raw_context)
+            elif self._is_structured_document(raw_context):
+                contexts = self._process_structured_document(raw_context)
             else:
                 contexts = self._process_visual_document(raw_context)
             all_processed_contexts.extend(contexts)
@@ -249,14 +479,13 @@ class DocumentProcessor(BaseContextProcessor):
     ) -> List[ProcessedContext]:
         """Process structured documents (CSV/XLSX/JSONL)"""
         file_type = self._get_file_type(raw_context.content_path)
-        if file_type == FileType.FAQ_XLSX:
-            chunker = self._faq_chunker
-        elif file_type in STRUCTURED_FILE_TYPES:
-            chunker = self._structured_chunker
-        else:
+        if file_type not in STRUCTURED_FILE_TYPES and file_type != FileType.FAQ_XLSX:
             logger.warning(f"Unsupported structured file type: {file_type}")
             return []
-        chunks = list(chunker.chunk(raw_context))
+        self._set_ingest_stage("chunking")
+        chunks = self._run_cpu_bound(
+            _chunk_structured_document, raw_context, file_type == FileType.FAQ_XLSX
+        )
         return self._create_contexts_from_chunks(raw_context, chunks)
 
     def _create_contexts_from_chunks(
@@ -268,11 +497,16 @@ class DocumentProcessor(BaseContextProcessor):
         # TODO: semantic additional
         knowledge_metadata = KnowledgeContextMetadata(
             knowledge_source=raw_context.source,
-            knowledge_file_path=raw_context.content_path,
+            knowledge_file_path=raw_context.content_path or raw_context.filter_path or "",
             knowledge_raw_id=raw_context.object_id,
             # knowledge_title=raw_context.title,
         )
+        # Chunks already stored by the previous version of the document keep their context
+        revision = self._current_revision()
         for chunk in chunks:
+            chunk_hash = content_hash(chunk.text or "")
+            if revision is not None and revision.reuse_chunk(chunk_hash):
+                continue
             ctx = ProcessedContext(
                 properties=ContextProperties(
                     raw_properties=[raw_context],
@@ -297,6 +531,8 @@ class DocumentProcessor(BaseContextProcessor):
                 metadata=knowledge_metadata.model_dump(exclude_none=True),
             )
             contexts.append(ctx)
+            if revision is not None:
+                revision.add_chunk(chunk_hash, ctx.id)
 
         return contexts
 
@@ -304,8 +540,10 @@ class DocumentProcessor(BaseContextProcessor):
         """Process TEXT type (vaults text content)"""
         if not raw_context.content_text:
             return []
+        self._set_ingest_stage("chunking")
         chunks = self._document_chunker.chunk_text(
             texts=[raw_context.content_text],
+            split_cache=self._current_revision(),
         )
         return self._create_contexts_from_chunks(raw_context, chunks)
 
@@ -325,8 +563,10 @@ class DocumentProcessor(BaseContextProcessor):
             file_path = raw_context.content_path
             images = self._document_converter.convert_to_images(file_path)
             text_parts = self._analyze_document_with_vlm(images)
+            self._set_ingest_stage("chunking")
             chunks = self._document_chunker.chunk_text(
                 texts=text_parts,
+                split_cache=self._current_revision(),
             )
             return self._create_contexts_from_chunks(raw_context, chunks)
 
@@ -350,16 +590,11 @@ class DocumentProcessor(BaseContextProcessor):
         logger.info(f"Processing document page-by-page: {file_path}")
 
         # 1. Analyze pages
-        if file_ext == ".pdf":
-            page_infos = self._document_converter.analyze_pdf_pages(file_path, self._text_threshold)
-        elif file_ext in [".docx", ".doc"]:
-            page_infos = self._document_converter.analyze_docx_pages(file_path)
-        elif file_ext == ".md":
-            page_infos = self._document_converter.analyze_markdown_pages(file_path)
-        elif file_ext == ".txt":
+        if file_ext == ".txt":
             return self._process_txt_file(raw_context, file_path)
-        else:
-            raise ValueError(f"Unsupported file type for page-by-page: {file_ext}")
+        page_infos = self._run_cpu_bound(
+            _analyze_document_pages, file_path, file_ext, self._text_threshold
+        )
 
         # 2. Classify pages
         text_pages = [p for p in page_infos if not p.has_visual_elements]
@@ -395,27 +630,102 @@ class DocumentProcessor(BaseContextProcessor):
 
         # 5. Process all pages (using merged all_page_infos)
         text_list = [p.text for p in all_page_infos if p.text.strip()]
+        self._set_ingest_stage("chunking")
         chunks = self._document_chunker.chunk_text(
             texts=text_list,
+            split_cache=self._current_revision(),
         )
         all_contexts = self._create_contexts_from_chunks(raw_context, chunks)
         return all_contexts
 
+    def _windowed(self, tasks: List[Any]) -> List[Any]:
+        """
+        Wrap coroutines so at most vlm_batch_size of them run at once. A new request starts
+        as soon as any finishes, instead of waiting for a whole batch to drain.
+        """
+        window = asyncio.Semaphore(max(1, self._vlm_batch_size))
+
+        async def run(task):
+            async with window:
+                return await task
+
+        return [run(task) for task in tasks]
+
+    @with_priority(RequestPriority.BACKGROUND)
+    async def _gather_results(self, tasks: List[Any]) -> List[Any]:
+        return await asyncio.gather(*self._windowed(tasks), return_exceptions=True)
+
+    @with_priority(RequestPriority.BACKGROUND)
     async def _run_tasks_with_progress(
-        self, tasks: List[Any], start_index: int, total_count: int
+        self,
+        tasks: List[Any],
+        start_index: int,
+        total_count: int,
+        object_id: Optional[str] = None,
     ) -> List[Any]:
         results: List[Any] = []
         completed = 0
-        for coro in asyncio.as_completed(tasks):
+        for coro in asyncio.as_completed(self._windowed(tasks)):
             try:
                 r = await coro
                 results.append(r)
             except Exception as e:
                 results.append(e)
             completed += 1
-            logger.info(f"images {start_index + completed}/{total_count} processed")
+            if object_id is not None:
+                self._ingest_tracker.advance(object_id)
+            else:
+                logger.info(f"images {start_index + completed}/{total_count} processed")
         return results
 
+    @with_priority(RequestPriority.BACKGROUND)
+    async def _analyze_page_stream(
+        self,
+        pages: Iterator[Tuple[int, Image.Image]],
+        object_id: Optional[str] = None,
+        revision: Optional[DocumentRevision] = None,
+    ) -> List[Any]:
+        """
+        Analyze (page_number, image) pairs from a lazy page iterator with VLM.
+
+        The next page is only pulled from the iterator once a VLM slot is free, so at most
+        vlm_batch_size rendered pages (plus the iterator's prefetch) are held in memory.
+        Results are returned in page order, exceptions in place of failed pages.
+        """
+        loop = asyncio.get_running_loop()
+        window = asyncio.Semaphore(max(1, self._vlm_batch_size))
+        tasks: List[asyncio.Future] = []
+
+        async def analyze(image: Image.Image, page_number: int) -> dict:
+            try:
+                return await self._analyze_image_cached(image, page_number, revision)
+            finally:
+                window.release()
+                if object_id is not None:
+                    self._ingest_tracker.advance(object_id)
+
+        try:
+            while True:
+                await window.acquire()
+                # Rendering blocks, keep it off the event loop
+                page = await loop.run_in_executor(None, next, pages, None)
+                if page is None:
+                    window.release()
+                    break
+                page_number, image = page
+                tasks.append(asyncio.ensure_future(analyze(image, page_number)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            try:
+                pages.close()
+            except ValueError:
+                # Cancelled while the executor thread is still inside next()
+                pass
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
     def _extract_vlm_pages(self, file_path: str, page_infos: List[PageInfo]) -> List[str]:
         """Extract text from visual pages using VLM, returns extracted text list (in page order)"""
         file_ext = Path(file_path).suffix.lower()
@@ -423,40 +733,21 @@ class DocumentProcessor(BaseContextProcessor):
         if file_ext in [".docx", ".doc", ".md"]:
             return self._process_vlm_pages_with_doc_images(page_infos)
 
-        # For PDF and other formats, convert pages to images
-        # Convert document to images
-        all_images = self._document_converter.convert_to_images(file_path)
-
-        # Only process pages that need VLM
-        vlm_images = [all_images[p.page_number - 1] for p in page_infos]
+        # Render only the pages that need VLM, streaming them into VLM requests
         vlm_page_numbers = [p.page_number for p in page_infos]
+        self._set_ingest_stage("vlm", len(vlm_page_numbers))
+        pages = self._document_converter.iter_pdf_pages(file_path, vlm_page_numbers)
+        results = self._event_loop.run(
+            self._analyze_page_stream(pages, self._current_object_id(), self._current_revision())
+        )
 
-        # VLM analysis
         page_results = []
-        for i in range(0, len(vlm_images), self._vlm_batch_size):
-            batch = vlm_images[i : i + self._vlm_batch_size]
-            batch_page_nums = vlm_page_numbers[i : i + self._vlm_batch_size]
-
-            tasks = [
-                self._analyze_image_with_vlm(img, page_num)
-                for img, page_num in zip(batch, batch_page_nums)
-            ]
-
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            batch_results = loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
-
-            for idx, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    error_msg = f"Error processing page {batch_page_nums[idx]}: {result}"
-                    logger.error(error_msg)
-                    raise RuntimeError(error_msg) from result
-                else:
-                    page_results.append(result)
+        for page_num, result in zip(vlm_page_numbers, results):
+            if isinstance(result, Exception):
+                error_msg = f"Error processing page {page_num}: {result}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg) from result
+            page_results.append(result)
 
         # Collect result texts (as list)
         text_list = [
@@ -484,39 +775,25 @@ class DocumentProcessor(BaseContextProcessor):
         image_results = []
         if all_doc_images:
             logger.info(f"Processing {len(all_doc_images)} embedded images from DOCX with VLM")
+            self._set_ingest_stage("vlm", len(all_doc_images))
 
-            for i in range(0, len(all_doc_images), self._vlm_batch_size):
-                batch_images = all_doc_images[i : i + self._vlm_batch_size]
-                batch_page_nums = image_page_mapping[i : i + self._vlm_batch_size]
-
-                total = len(all_doc_images)
-                total_batches = (total + self._vlm_batch_size - 1) // self._vlm_batch_size
-                batch_index = i // self._vlm_batch_size + 1
-                logger.info(
-                    f"batch {batch_index}/{total_batches}, images {i+1}-{i+len(batch_images)} of {total}"
-                )
-
-                tasks = [
-                    self._analyze_image_with_vlm(img, page_num)
-                    for img, page_num in zip(batch_images, batch_page_nums)
-                ]
-
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                batch_results = loop.run_until_complete(
-                    self._run_tasks_with_progress(tasks, i, total)
+            revision = self._current_revision()
+            tasks = [
+                self._analyze_image_cached(img, page_num, revision)
+                for img, page_num in zip(all_doc_images, image_page_mapping)
+            ]
+            results = self._event_loop.run(
+                self._run_tasks_with_progress(
+                    tasks, 0, len(all_doc_images), self._current_object_id()
                 )
+            )
 
-                for idx, result in enumerate(batch_results):
-                    if isinstance(result, Exception):
-                        logger.warning(f"Error processing embedded image {i+idx+1}: {result}")
-                        continue
-                    else:
-                        image_results.append(result)
+            for idx, result in enumerate(results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error processing embedded image {idx+1}: {result}")
+                    continue
+                else:
+                    image_results.append(result)
 
         # Merge image analysis results and original text (save as list)
         all_page_texts = []
@@ -545,15 +822,11 @@ class DocumentProcessor(BaseContextProcessor):
 
     def _analyze_document_with_vlm(self, images: List[Image.Image]) -> List[str]:
         """Batch analyze document images using VLM, returns text list"""
-        tasks = [self._analyze_image_with_vlm(img, i + 1) for i, img in enumerate(images)]
-
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        page_results = loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._set_ingest_stage("vlm", len(images))
+        pages = ((i + 1, img) for i, img in enumerate(images))
+        page_results = self._event_loop.run(
+            self._analyze_page_stream(pages, self._current_object_id(), self._current_revision())
+        )
 
         text_parts = []
         for idx, result in enumerate(page_results):
@@ -567,6 +840,21 @@ class DocumentProcessor(BaseContextProcessor):
 
         return text_parts
 
+    async def _analyze_image_cached(
+        self, image: Image.Image, page_number: int, revision: Optional[DocumentRevision]
+    ) -> dict:
+        """Analyze an image with VLM unless the document's previous version had the same image"""
+        if revision is None:
+            return await self._analyze_image_with_vlm(image, page_number)
+        # Hashing a rendered page takes a few milliseconds, keep it off the event loop
+        image_hash = await asyncio.get_running_loop().run_in_executor(None, _image_hash, image)
+        text = revision.get_fragment(FRAGMENT_PAGE, image_hash)
+        if text is not None:
+            return {"text": text, "page_number": page_number}
+        result = await self._analyze_image_with_vlm(image, page_number)
+        revision.put_fragment(FRAGMENT_PAGE, image_hash, result["text"])
+        return result
+
     async def _analyze_image_with_vlm(self, image: Image.Image, page_number: int = 1) -> dict:
         """Analyze single image using VLM (generic method)"""
         import base64
@@ -628,7 +916,10 @@ class DocumentProcessor(BaseContextProcessor):
                 return []
 
             # Use text chunker for processing
-            chunks = self._document_chunker.chunk_text(texts=[content])
+            self._set_ingest_stage("chunking")
+            chunks = self._document_chunker.chunk_text(
+                texts=[content], split_cache=self._current_revision()
+            )
 
             return self._create_contexts_from_chunks(raw_context, chunks)
 
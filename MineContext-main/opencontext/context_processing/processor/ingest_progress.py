@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Document ingest progress tracking
+Per-document stage, page progress and ETA for the document processor's worker pool.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DocumentProgress:
+    object_id: str
+    path: str
+    size: int
+    queued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    stage: str = "queued"
+    units_total: int = 0
+    units_done: int = 0
+
+    def eta_seconds(self, now: float, seconds_per_byte: Optional[float]) -> Optional[float]:
+        """Remaining time from page progress, or from throughput of earlier documents"""
+        if self.started_at is None:
+            return self.size * seconds_per_byte if seconds_per_byte is not None else None
+        elapsed = now - self.started_at
+        if self.units_total > 0 and self.units_done > 0:
+            remaining = self.units_total - self.units_done
+            return elapsed / self.units_done * remaining
+        if seconds_per_byte is not None:
+            return max(0.0, self.size * seconds_per_byte - elapsed)
+        return None
+
+    def to_dict(self, now: float, seconds_per_byte: Optional[float]) -> Dict[str, Any]:
+        eta = self.eta_seconds(now, seconds_per_byte)
+        return {
+            "object_id": self.object_id,
+            "path": self.path,
+            "size": self.size,
+            "stage": self.stage,
+            "pages_done": self.units_done,
+            "pages_total": self.units_total,
+            "elapsed_seconds": round(now - self.started_at, 1) if self.started_at else 0,
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+        }
+
+
+class DocumentIngestTracker:
+    """
+    Tracks queued and in-flight documents of the document processor.
+
+    Throughput is learned as an exponential moving average of seconds per input byte over
+    finished documents, which gives an ETA for documents that have not reported page
+    progress yet and for the queue as a whole. Status is pushed to the monitor at most every
+    `report_interval` seconds, as building it walks every tracked document.
+    """
+
+    def __init__(self, workers: int = 1, smoothing: float = 0.2, report_interval: float = 1.0):
+        self.workers = max(1, workers)
+        self._smoothing = smoothing
+        self.report_interval = report_interval
+        self._last_report = 0.0
+        self._documents: Dict[str, DocumentProgress] = {}
+        self._seconds_per_byte: Optional[float] = None
+        self._completed = 0
+        self._failed = 0
+        self._bytes_done = 0
+        self._busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def queued(self, object_id: str, path: str, size: int):
+        with self._lock:
+            self._documents[object_id] = DocumentProgress(object_id, path, size)
+        self._report()
+
+    def started(self, object_id: str):
+        with self._lock:
+            progress = self._documents.get(object_id)
+            if progress is not None:
+                progress.started_at = time.time()
+                progress.stage = "parsing"
+        self._report()
+
+    def stage(self, object_id: str, stage: str, units_total: Optional[int] = None):
+        with self._lock:
+            progress = self._documents.get(object_id)
+            if progress is None:
+                return
+            progress.stage = stage
+            if units_total is not None:
+                progress.units_total = units_total
+                progress.units_done = 0
+        self._report()
+
+    def advance(self, object_id: str, units: int = 1):
+        now = time.time()
+        with self._lock:
+            progress = self._documents.get(object_id)
+            if progress is None:
+                return
+            progress.units_done += units
+            eta = progress.eta_seconds(now, self._seconds_per_byte)
+            message = (
+                f"Document {progress.path}: {progress.stage} "
+                f"{progress.units_done}/{progress.units_total}"
+            )
+        if eta is not None:
+            message += f", ETA {eta:.0f}s"
+        logger.info(message)
+        self._report()
+
+    def finished(self, object_id: str, success: bool):
+        now = time.time()
+        with self._lock:
+            progress = self._documents.pop(object_id, None)
+            if progress is None:
+                return
+            if not success:
+                self._failed += 1
+            else:
+                self._completed += 1
+                if progress.started_at is not None:
+                    duration = now - progress.started_at
+                    self._busy_seconds += duration
+                    self._bytes_done += progress.size
+                    if progress.size > 0:
+                        sample = duration / progress.size
+                        if self._seconds_per_byte is None:
+                            self._seconds_per_byte = sample
+                        else:
+                            self._seconds_per_byte += self._smoothing * (
+                                sample - self._seconds_per_byte
+                            )
+            idle = not self._documents
+        # The last document finishing always reports, so the final status is not left stale
+        self._report(force=idle)
+
+    def get_status(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            seconds_per_byte = self._seconds_per_byte
+            active: List[Dict[str, Any]] = []
+            queued_count = 0
+            remaining = 0.0
+            eta_known = seconds_per_byte is not None
+            for progress in self._documents.values():
+                eta = progress.eta_seconds(now, seconds_per_byte)
+                if eta is None:
+                    eta_known = False
+                else:
+                    remaining += eta
+                if progress.started_at is None:
+                    queued_count += 1
+                else:
+                    active.append(progress.to_dict(now, seconds_per_byte))
+            return {
+                "workers": self.workers,
+                "queued": queued_count,
+                "active": active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "bytes_per_second": (
+                    round(self._bytes_done / self._busy_seconds, 1) if self._busy_seconds else None
+                ),
+                "queue_eta_seconds": round(remaining / self.workers, 1) if eta_known else None,
+            }
+
+    def _report(self, force: bool = False):
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_report < self.report_interval:
+                return
+            self._last_report = now
+        try:
+            from opencontext.monitoring import record_document_ingest
+
+            record_document_ingest(self.get_status())
+        except Exception as e:
+            logger.debug(f"Failed to report document ingest progress: {e}")
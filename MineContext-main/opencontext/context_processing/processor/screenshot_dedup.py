@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Near-duplicate screenshot index
+Multi-index hashing over integer dHashes, with per-monitor indexes, time-window eviction
+and optional SQLite persistence.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class MultiIndexHashTable:
+    """
+    Hamming-distance index for fixed-width integer hashes.
+
+    The hash is split into `max_distance + 1` disjoint bit ranges with one exact-match
+    table each. Two hashes within `max_distance` bits must agree on at least one range
+    (pigeonhole), so a lookup only verifies the entries sharing a bucket with the query
+    instead of scanning every stored hash.
+    """
+
+    def __init__(self, max_distance: int, hash_bits: int = 64):
+        self.max_distance = max(0, int(max_distance))
+        self.hash_bits = hash_bits
+        parts = min(self.max_distance + 1, hash_bits)
+        self._ranges: List[Tuple[int, int]] = []
+        shift = 0
+        for i in range(parts):
+            width = hash_bits // parts + (1 if i < hash_bits % parts else 0)
+            self._ranges.append((shift, (1 << width) - 1))
+            shift += width
+        self._tables: List[Dict[int, Set[str]]] = [{} for _ in self._ranges]
+        self._hashes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def add(self, key: str, value: int):
+        self.remove(key)
+        self._hashes[key] = value
+        for table, (shift, mask) in zip(self._tables, self._ranges):
+            table.setdefault((value >> shift) & mask, set()).add(key)
+
+    def remove(self, key: str):
+        value = self._hashes.pop(key, None)
+        if value is None:
+            return
+        for table, (shift, mask) in zip(self._tables, self._ranges):
+            bucket_key = (value >> shift) & mask
+            bucket = table.get(bucket_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del table[bucket_key]
+
+    def nearest(self, value: int) -> Optional[Tuple[str, int]]:
+        """Closest stored (key, distance) within max_distance, or None"""
+        best: Optional[Tuple[str, int]] = None
+        seen: Set[str] = set()
+        for table, (shift, mask) in zip(self._tables, self._ranges):
+            for key in table.get((value >> shift) & mask, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                distance = (value ^ self._hashes[key]).bit_count()
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (key, distance)
+                    if distance == 0:
+                        return best
+        return best
+
+
+class ScreenshotDedupIndex:
+    """
+    Remembers recent screenshot hashes per monitor and reports near-duplicates.
+
+    A hit refreshes the matched entry, so a screen that stays unchanged keeps being
+    recognized. Entries not seen for `window_seconds` are evicted, and each monitor
+    keeps at most `max_entries` hashes (least recently seen are dropped first). With a
+    `persist_path` the index is stored in SQLite and reloaded on start.
+    """
+
+    def __init__(
+        self,
+        max_distance: int,
+        window_seconds: float = 1800,
+        max_entries: int = 2000,
+        persist_path: Optional[str] = None,
+    ):
+        self.max_distance = max(0, int(max_distance))
+        self.window_seconds = max(0.0, float(window_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._indexes: Dict[str, MultiIndexHashTable] = {}
+        # Per monitor: entry id -> last seen, ordered from least to most recently seen
+        self._last_seen: Dict[str, "OrderedDict[str, float]"] = {}
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._duplicates = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        if persist_path:
+            self._open(persist_path)
+
+    def _open(self, path: str):
+        try:
+            dir_name = os.path.dirname(path)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS screenshot_hashes (
+                    entry_id TEXT PRIMARY KEY,
+                    monitor TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    last_seen REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            rows = self._conn.execute(
+                "SELECT entry_id, monitor, hash, last_seen FROM screenshot_hashes "
+                "WHERE last_seen >= ? ORDER BY last_seen",
+                (time.time() - self.window_seconds,),
+            ).fetchall()
+            for entry_id, monitor, hash_hex, last_seen in rows:
+                self._insert(monitor, entry_id, int(hash_hex, 16), last_seen)
+            for monitor in list(self._last_seen):
+                self._evict(monitor, time.time())
+            logger.info(f"Screenshot dedup index loaded {len(rows)} hashes from {path}")
+        except Exception as e:
+            logger.error(
+                f"Failed to open screenshot dedup index at {path}, keeping it in memory: {e}"
+            )
+            self._conn = None
+
+    def check_and_add(
+        self, monitor: str, phash: str, entry_id: str, now: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Look up a hex dHash for `monitor`.
+
+        Returns:
+            The id of the near-duplicate entry (which is refreshed), or None after adding
+            the hash as a new entry
+        """
+        value = int(phash, 16)
+        now = time.time() if now is None else now
+        with self._lock:
+            self._lookups += 1
+            self._evict(monitor, now)
+            index = self._indexes.get(monitor)
+            match = index.nearest(value) if index is not None else None
+            if match is not None:
+                matched_id = match[0]
+                self._duplicates += 1
+                self._last_seen[monitor][matched_id] = now
+                self._last_seen[monitor].move_to_end(matched_id)
+                self._persist(
+                    "UPDATE screenshot_hashes SET last_seen = ? WHERE entry_id = ?",
+                    [(now, matched_id)],
+                )
+                return matched_id
+
+            self._insert(monitor, entry_id, value, now)
+            self._persist(
+                "INSERT OR REPLACE INTO screenshot_hashes (entry_id, monitor, hash, last_seen) "
+                "VALUES (?, ?, ?, ?)",
+                [(entry_id, monitor, phash, now)],
+            )
+            self._evict(monitor, now)
+            return None
+
+    def _insert(self, monitor: str, entry_id: str, value: int, last_seen: float):
+        if monitor not in self._indexes:
+            self._indexes[monitor] = MultiIndexHashTable(self.max_distance)
+            self._last_seen[monitor] = OrderedDict()
+        self._indexes[monitor].add(entry_id, value)
+        self._last_seen[monitor][entry_id] = last_seen
+        self._last_seen[monitor].move_to_end(entry_id)
+
+    def _evict(self, monitor: str, now: float):
+        """Drop expired and over-capacity entries of one monitor, caller holds the lock"""
+        last_seen = self._last_seen.get(monitor)
+        if not last_seen:
+            return
+        index = self._indexes[monitor]
+        cutoff = now - self.window_seconds
+        evicted = []
+        while last_seen:
+            entry_id, seen_at = next(iter(last_seen.items()))
+            if seen_at >= cutoff and len(last_seen) <= self.max_entries:
+                break
+            last_seen.popitem(last=False)
+            index.remove(entry_id)
+            evicted.append((entry_id,))
+        if evicted:
+            self._persist("DELETE FROM screenshot_hashes WHERE entry_id = ?", evicted)
+
+    def _persist(self, sql: str, rows: List[tuple]):
+        if self._conn is None:
+            return
+        try:
+            self._conn.executemany(sql, rows)
+            self._conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to persist screenshot dedup index: {e}")
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": sum(len(index) for index in self._indexes.values()),
+                "monitors": len(self._indexes),
+                "lookups": self._lookups,
+                "duplicates": self._duplicates,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -16,22 +16,31 @@ import os
 import queue
 import threading
 import time
-from collections import deque
 from typing import Any, Dict, List, Optional, Tuple
 
 from opencontext.context_processing.processor.base_processor import BaseContextProcessor
+from opencontext.context_processing.processor.screenshot_dedup import ScreenshotDedupIndex
 from opencontext.context_processing.processor.entity_processor import (
     refresh_entities,
     validate_and_clean_entities,
 )
 from opencontext.llm.global_embedding_client import do_vectorize_async
 from opencontext.llm.global_vlm_client import generate_with_messages_async
+from opencontext.llm.request_scheduler import RequestPriority, with_priority
 from opencontext.models.context import *
 from opencontext.models.enums import get_context_type_descriptions_for_extraction
 from opencontext.monitoring.monitor import record_processing_error
 from opencontext.storage.global_storage import get_storage
 from opencontext.tools.tool_definitions import ALL_TOOL_DEFINITIONS
-from opencontext.utils.image import calculate_phash, resize_image
+from opencontext.utils.async_file_writer import get_file_writer
+from opencontext.utils.async_loop import BackgroundEventLoop
+from opencontext.utils.image import (
+    IMAGE_MIME_TYPES,
+    calculate_bytes2phash,
+    calculate_phash,
+    resize_image,
+    resize_image_bytes,
+)
 from opencontext.utils.json_parser import parse_json_from_response
 from opencontext.utils.logging_utils import get_logger
 from opencontext.config.global_config import get_prompt_group
@@ -39,6 +48,7 @@ from opencontext.monitoring import (
     increment_data_count,
     increment_recording_stat,
     record_processing_metrics,
+    record_processing_stage,
 )
 
 logger = get_logger(__name__)
@@ -72,6 +82,9 @@ class ScreenshotProcessor(BaseContextProcessor):
 
         self._stop_event = threading.Event()
 
+        # Every batch runs on one long-lived loop, reusing the VLM client's connections
+        self._event_loop = BackgroundEventLoop("screenshot-processor-loop")
+
         # Pipeline related
         self._input_queue = queue.Queue(maxsize=self._batch_size * 3)
         self._processing_task = threading.Thread(target=self._run_processing_loop, daemon=True)
@@ -81,7 +94,12 @@ class ScreenshotProcessor(BaseContextProcessor):
         self._processed_cache = (
             {}
         )
-        self._current_screenshot = deque(maxlen=self._batch_size * 2)
+        self._dedup_index = ScreenshotDedupIndex(
+            self._similarity_hash_threshold,
+            window_seconds=self.config.get("dedup_window_seconds", 1800),
+            max_entries=self.config.get("dedup_cache_size", 2000),
+            persist_path=self.config.get("dedup_persist_path"),
+        )
 
     def shutdown(self, graceful: bool = False):
         """Gracefully shut down background processing tasks."""
@@ -92,6 +110,8 @@ class ScreenshotProcessor(BaseContextProcessor):
         self._processing_task.join(timeout=5)
         if self._processing_task.is_alive():
             logger.warning("ScreenshotProcessor background task failed to stop in time.")
+        self._event_loop.close()
+        self._dedup_index.close()
         logger.info("ScreenshotProcessor has been shut down.")
 
     def get_name(self) -> str:
@@ -122,30 +142,30 @@ class ScreenshotProcessor(BaseContextProcessor):
         Returns:
             bool: Returns True if it's a new image, False if it's a duplicate image.
         """
-        new_phash = calculate_phash(new_context.content_path)
+        # Frames from ScreenshotCapture are hashed at capture time
+        new_phash = (new_context.additional_info or {}).get("phash")
+        if new_phash is None and new_context.content_bytes is not None:
+            new_phash = calculate_bytes2phash(new_context.content_bytes)
+        elif new_phash is None:
+            new_phash = calculate_phash(new_context.content_path)
         if new_phash is None:
             raise ValueError("Failed to calculate screenshot pHash")
 
-        # To avoid modification during iteration
-        for item in list(self._current_screenshot):
-            diff = bin(int(str(new_phash), 16) ^ int(str(item["phash"]), 16)).count("1")
-            if diff <= self._similarity_hash_threshold:
-                # Find duplicate, move it to end of list (consider as most recently used)
-                self._current_screenshot.remove(item)
-                self._current_screenshot.append(item)
-
-                if self._enabled_delete:
-                    try:
-                        os.remove(new_context.content_path)
-                    except Exception as e:
-                        logger.error(f"Failed to delete duplicate screenshot file: {e}")
-                return True
-
-        # If no duplicate found, it's a new image
-        self._current_screenshot.append({"phash": new_phash, "id": new_context.object_id})
+        # Each monitor has its own index, a hit refreshes the matched screenshot
+        monitor = (new_context.additional_info or {}).get("monitor", "default")
+        if self._dedup_index.check_and_add(monitor, str(new_phash), new_context.object_id):
+            if self._enabled_delete and new_context.content_path:
+                # Also cancels the write if the file has not been persisted yet
+                get_file_writer().discard(new_context.content_path)
+            return True
 
         return False
 
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = super().get_statistics()
+        stats["dedup_index"] = self._dedup_index.get_statistics()
+        return stats
+
     def process(self, context: RawContextProperties) -> bool:
         """
         Process a single screenshot context.
@@ -155,8 +175,9 @@ class ScreenshotProcessor(BaseContextProcessor):
         if not self.can_process(context):
             return False
         try:
+            start_time = time.time()
             if self._max_image_size > 0:
-                resize_image(context.content_path, self._max_image_size, self._resize_quality)
+                self._fit_image_size(context)
             if not self._is_duplicate(context):
                 self._input_queue.put(context, timeout=2)
                 # Record screenshot path for UI display
@@ -164,11 +185,27 @@ class ScreenshotProcessor(BaseContextProcessor):
 
                 if context.content_path:
                     record_screenshot_path(context.content_path)
+            record_processing_stage("screenshot.dedup", int((time.time() - start_time) * 1000))
         except Exception as e:
             logger.exception(f"Error processing screenshot {context.content_path}: {e}")
             return False
         return True
 
+    def _fit_image_size(self, context: RawContextProperties):
+        """Downscale the screenshot to max_image_size, in memory when the frame is available"""
+        if context.content_bytes is None:
+            resize_image(context.content_path, self._max_image_size, self._resize_quality)
+            return
+        frame_size = (context.additional_info or {}).get("frame_size")
+        if frame_size and max(frame_size) <= self._max_image_size:
+            return
+        image_format = (context.additional_info or {}).get("format", "png")
+        resized = resize_image_bytes(
+            context.content_bytes, image_format, self._max_image_size, self._resize_quality
+        )
+        if resized is not None:
+            context.content_bytes = resized
+
     def _run_processing_loop(self):
         from opencontext.monitoring import (
             increment_data_count,
@@ -201,7 +238,7 @@ class ScreenshotProcessor(BaseContextProcessor):
             start_time = time.time()
             increment_data_count("screenshot", count=len(unprocessed_contexts))
             try:
-                processed_contexts =  asyncio.run(self.batch_process(unprocessed_contexts))
+                processed_contexts = self._event_loop.run(self.batch_process(unprocessed_contexts))
                 if processed_contexts:
                     get_storage().batch_upsert_processed_context(processed_contexts)
             except Exception as e:
@@ -246,22 +283,30 @@ class ScreenshotProcessor(BaseContextProcessor):
             logger.error("Failed to get complete prompt for screenshot_analyze.")
             raise ValueError("Missing prompt configuration for screenshot_analyze")
 
-        # Prepare image data
+        # Prepare image data, preferring the in-memory frame over the file
         image_path = raw_context.content_path
-        if not image_path or not os.path.exists(image_path):
-            logger.error(f"Screenshot path is invalid or does not exist: {image_path}")
-            raise ValueError(f"Screenshot path is invalid or does not exist: {image_path}")
-
-        base64_image = self._encode_image_to_base64(image_path)
-        if not base64_image:
-            logger.warning(f"Failed to encode image: {image_path}")
-            raise ValueError(f"Failed to encode image: {image_path}")
-
+        image_format = (raw_context.additional_info or {}).get("format", "png")
+        if raw_context.content_bytes is not None:
+            base64_image = base64.b64encode(raw_context.content_bytes).decode("utf-8")
+            # The frame is no longer needed once encoded, do not keep it alive in caches
+            raw_context.content_bytes = None
+        else:
+            if not image_path or not os.path.exists(image_path):
+                logger.error(f"Screenshot path is invalid or does not exist: {image_path}")
+                raise ValueError(f"Screenshot path is invalid or does not exist: {image_path}")
+
+            base64_image = self._encode_image_to_base64(image_path)
+            if not base64_image:
+                logger.warning(f"Failed to encode image: {image_path}")
+                raise ValueError(f"Failed to encode image: {image_path}")
+            image_format = os.path.splitext(image_path)[1].lstrip(".").lower() or image_format
+
+        mime_type = IMAGE_MIME_TYPES.get(image_format, "image/png")
         content = [
             {
                 "type": "image_url",
                 "image_url": {
-                    "url": f"data:image/png;base64,{base64_image}",
+                    "url": f"data:{mime_type};base64,{base64_image}",
                 },
             }
         ]
@@ -283,11 +328,16 @@ class ScreenshotProcessor(BaseContextProcessor):
         ]
 
         raw_llm_response = ''
+        start_time = time.time()
         try:
             raw_llm_response = await generate_with_messages_async(messages)
         except Exception as e:
+            record_processing_stage(
+                "screenshot.vlm", int((time.time() - start_time) * 1000), "error"
+            )
             logger.error(f"Failed to get VLM response. Error: {e}")
             raise ValueError(f"Failed to get VLM response. Error: {e}")
+        record_processing_stage("screenshot.vlm", int((time.time() - start_time) * 1000))
 
         raw_resp = parse_json_from_response(raw_llm_response)
         if not raw_resp:
@@ -495,6 +545,7 @@ class ScreenshotProcessor(BaseContextProcessor):
             else None,
         }
 
+    @with_priority(RequestPriority.BACKGROUND)
     async def batch_process(self, raw_contexts: List[RawContextProperties]) -> List[ProcessedContext]:
         """
         Batch process screenshots using Vision LLM with concurrent batch processing
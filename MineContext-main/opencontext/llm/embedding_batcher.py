@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Embedding request coalescer
+Collects concurrent async embedding calls for a short window and sends them as one batch request
+"""
+
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+BatchEmbedFunc = Callable[..., Awaitable[List[List[float]]]]
+
+
+class _LoopBatchState:
+    """Pending requests of a single event loop, grouped by embedding kwargs"""
+
+    def __init__(self):
+        self.pending: Dict[Tuple, List[Tuple[str, asyncio.Future]]] = {}
+        self.timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        self.tasks: Set[asyncio.Task] = set()
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batching coalescer for async embedding requests.
+
+    Requests arriving within `max_wait_ms` of the first pending one are merged into a
+    single call of `embed_batch_func`. A batch is flushed early once it reaches
+    `max_batch_size`. State is kept per event loop, so callers that spin up their own
+    loops (e.g. asyncio.run per batch) never share futures across loops.
+    """
+
+    def __init__(
+        self, embed_batch_func: BatchEmbedFunc, max_batch_size: int = 32, max_wait_ms: float = 5
+    ):
+        self._embed_batch_func = embed_batch_func
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopBatchState]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._statistics = {"requests": 0, "batches": 0, "max_batch": 0}
+
+    async def submit(self, text: str, **kwargs) -> List[float]:
+        """Queue a text for embedding and wait for its vector"""
+        try:
+            key = tuple(sorted(kwargs.items()))
+            hash(key)
+        except TypeError:
+            # Unhashable kwargs cannot be grouped, send them on their own
+            vectors = await self._embed_batch_func([text], **kwargs)
+            return vectors[0]
+
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopBatchState()
+            self._states[loop] = state
+
+        future = loop.create_future()
+        pending = state.pending.setdefault(key, [])
+        pending.append((text, future))
+        self._statistics["requests"] += 1
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(loop, key)
+        elif len(pending) == 1:
+            state.timers[key] = loop.call_later(self.max_wait, self._flush, loop, key)
+
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, key: Tuple):
+        """Detach the pending batch for `key` and dispatch it"""
+        state = self._states.get(loop)
+        if state is None:
+            return
+        timer = state.timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        batch = state.pending.pop(key, None)
+        if batch:
+            # Keep a strong reference so the in-flight batch is not garbage collected
+            task = loop.create_task(self._run_batch(batch, dict(key)))
+            state.tasks.add(task)
+            task.add_done_callback(state.tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]], kwargs: Dict[str, Any]):
+        # Identical texts in one window are embedded once
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        self._statistics["batches"] += 1
+        self._statistics["max_batch"] = max(self._statistics["max_batch"], len(unique_texts))
+        try:
+            vectors = await self._embed_batch_func(unique_texts, **kwargs)
+        except Exception as e:
+            logger.error(f"Coalesced embedding batch of {len(unique_texts)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        vector_by_text = dict(zip(unique_texts, vectors))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(vector_by_text.get(text))
+
+    def get_statistics(self) -> Dict[str, int]:
+        return dict(self._statistics)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent content-addressed embedding cache
+Stores embeddings in SQLite keyed by (model, output_dim, sha256 of the vectorized content)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache with LRU eviction.
+
+    Vectors are stored as float32 blobs. A hit refreshes the entry's access time when it
+    is older than `touch_interval` seconds, so hot entries don't turn every lookup into a
+    write. Once the table grows past `max_entries` the least recently used entries are
+    evicted down to `max_entries * evict_ratio`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 200000,
+        evict_ratio: float = 0.9,
+        touch_interval: float = 3600,
+    ):
+        self.path = path
+        self.max_entries = max(1, int(max_entries))
+        self.evict_ratio = min(max(float(evict_ratio), 0.1), 1.0)
+        self.touch_interval = max(0.0, float(touch_interval))
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                output_dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_access "
+            "ON embedding_cache (last_access)"
+        )
+        self._conn.commit()
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        logger.info(f"Embedding cache opened at {path} with {self._entries} entries")
+
+    @staticmethod
+    def make_key(model: str, output_dim: int, content: str) -> str:
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"{model}:{output_dim or 0}:{digest}"
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Look up several keys, returning only the hits"""
+        if not keys:
+            return {}
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+        stale: List[str] = []
+        now = time.time()
+        with self._lock:
+            # Stay well below SQLITE_MAX_VARIABLE_NUMBER
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT cache_key, vector, last_access FROM embedding_cache "
+                    f"WHERE cache_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for cache_key, blob, last_access in rows:
+                    found[cache_key] = array("f", blob).tolist()
+                    if now - last_access >= self.touch_interval:
+                        stale.append(cache_key)
+            if stale:
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_access = ? WHERE cache_key = ?",
+                    [(now, cache_key) for cache_key in stale],
+                )
+                self._conn.commit()
+            self._hits += sum(1 for key in keys if key in found)
+            self._misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def get(self, key: str) -> Optional[List[float]]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, model: str, output_dim: int, vectors: Dict[str, List[float]]):
+        """Store vectors by cache key, evicting old entries when over capacity"""
+        if not vectors:
+            return
+        now = time.time()
+        rows = [
+            (key, model, output_dim or 0, array("f", vector).tobytes(), now)
+            for key, vector in vectors.items()
+            if vector
+        ]
+        with self._lock:
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache "
+                "(cache_key, model, output_dim, vector, last_access) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._entries += max(cursor.rowcount, 0)
+            if self._entries > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries, caller must hold the lock"""
+        target = int(self.max_entries * self.evict_ratio)
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        overflow = self._entries - target
+        if overflow <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM embedding_cache WHERE cache_key IN ("
+            "SELECT cache_key FROM embedding_cache ORDER BY last_access ASC LIMIT ?)",
+            (overflow,),
+        )
+        self._entries -= overflow
+        self._evictions += overflow
+        logger.debug(f"Evicted {overflow} embedding cache entries")
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": self._entries,
+                "evictions": self._evictions,
+                "max_entries": self.max_entries,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -9,12 +9,17 @@ Global embedding client singleton wrapper
 Provides global access to embedding client instances
 """
 
+import asyncio
 import threading
 from typing import Dict, List, Optional
 
 from opencontext.config.global_config import get_config
+from opencontext.llm.embedding_batcher import EmbeddingBatcher
+from opencontext.llm.embedding_cache import EmbeddingCache
 from opencontext.llm.llm_client import LLMClient, LLMType
 from opencontext.models.context import Vectorize
+from opencontext.models.enums import ContentFormat
+from opencontext.monitoring import record_embedding_cache
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -43,6 +48,9 @@ class GlobalEmbeddingClient:
             with self._lock:
                 if not self._initialized:
                     self._embedding_client: Optional[LLMClient] = None
+                    self._batcher: Optional[EmbeddingBatcher] = None
+                    self._cache: Optional[EmbeddingCache] = None
+                    self._max_batch_size = 32
                     self._auto_initialized = False
                     GlobalEmbeddingClient._initialized = True
 
@@ -69,6 +77,8 @@ class GlobalEmbeddingClient:
                 return
 
             self._embedding_client = LLMClient(llm_type=LLMType.EMBEDDING, config=embedding_config)
+            self._configure_batching(embedding_config)
+            self._configure_cache()
             logger.info("GlobalEmbeddingClient auto-initialized successfully")
             self._auto_initialized = True
         except Exception as e:
@@ -92,12 +102,99 @@ class GlobalEmbeddingClient:
                 new_client = LLMClient(llm_type=LLMType.EMBEDDING, config=embedding_config)
                 old_client = self._embedding_client
                 self._embedding_client = new_client
+                self._configure_batching(embedding_config)
+                if self._cache is None:
+                    self._configure_cache()
                 logger.info("Embedding client reinitialization completed")
             except Exception as e:
                 logger.error(f"Failed to reinitialize embedding client: {e}")
                 return False
             return True
 
+    def _configure_batching(self, embedding_config: Dict):
+        """Set up batch size and the async request coalescer from embedding_model config"""
+        self._max_batch_size = max(1, int(embedding_config.get("batch_size", 32)))
+        if embedding_config.get("enable_batching", True):
+            self._batcher = EmbeddingBatcher(
+                self._embed_batch_async,
+                max_batch_size=self._max_batch_size,
+                max_wait_ms=embedding_config.get("batch_wait_ms", 5),
+            )
+        else:
+            self._batcher = None
+
+    def _configure_cache(self):
+        """Open the persistent embedding cache if enabled in embedding_cache config"""
+        cache_config = get_config("embedding_cache") or {}
+        if not cache_config.get("enabled", True):
+            return
+        try:
+            self._cache = EmbeddingCache(
+                path=cache_config.get("path", "./persist/embedding_cache/embeddings.db"),
+                max_entries=cache_config.get("max_entries", 200000),
+            )
+        except Exception as e:
+            logger.error(f"Failed to open embedding cache, continuing without it: {e}")
+            self._cache = None
+
+    def _cache_key(self, vectorize: Vectorize, **kwargs) -> Optional[str]:
+        if self._cache is None or vectorize.content_format != ContentFormat.TEXT:
+            return None
+        content = vectorize.get_vectorize_content()
+        if not content:
+            return None
+        return EmbeddingCache.make_key(
+            self._embedding_client.model, self._output_dim(**kwargs), content
+        )
+
+    def _output_dim(self, **kwargs) -> int:
+        return kwargs.get("output_dim", self._embedding_client.config.get("output_dim", 0))
+
+    def _load_cached(self, vectorizes: List[Vectorize], **kwargs) -> List[Vectorize]:
+        """Fill vectors from the cache, returning the objects that still need embedding"""
+        pending = [v for v in vectorizes if v and not v.vector]
+        if self._cache is None or not pending:
+            return pending
+        keys = {id(v): self._cache_key(v, **kwargs) for v in pending}
+        try:
+            found = self._cache.get_many([key for key in keys.values() if key])
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return pending
+
+        missing = []
+        for vectorize in pending:
+            vector = found.get(keys[id(vectorize)])
+            if vector:
+                vectorize.vector = vector
+            else:
+                missing.append(vectorize)
+        record_embedding_cache(
+            hits=len(pending) - len(missing),
+            misses=sum(1 for v in missing if keys[id(v)]),
+            entries=self._cache.get_statistics()["entries"],
+        )
+        return missing
+
+    def _store_cached(self, vectorizes: List[Vectorize], **kwargs):
+        if self._cache is None:
+            return
+        vectors = {}
+        for vectorize in vectorizes:
+            key = self._cache_key(vectorize, **kwargs)
+            if key and vectorize.vector:
+                vectors[key] = vectorize.vector
+        try:
+            self._cache.put_many(self._embedding_client.model, self._output_dim(**kwargs), vectors)
+        except Exception as e:
+            logger.warning(f"Failed to store embeddings in cache: {e}")
+
+    def get_cache_statistics(self) -> Dict[str, int]:
+        return self._cache.get_statistics() if self._cache else {}
+
+    async def _embed_batch_async(self, texts: List[str], **kwargs) -> List[List[float]]:
+        return await self._embedding_client.generate_embeddings_batch_async(texts, **kwargs)
+
     def do_embedding(self, text: str, **kwargs) -> List[float]:
         """
         Get text embeddings
@@ -108,18 +205,77 @@ class GlobalEmbeddingClient:
         """
         Vectorize a Vectorize object
         """
-        if vectorize.vector:
+        if not self._load_cached([vectorize], **kwargs):
             return
         self._embedding_client.vectorize(vectorize, **kwargs)
+        self._store_cached([vectorize], **kwargs)
         return
-    
+
     async def do_vectorize_async(self, vectorize: Vectorize, **kwargs):
         """
-        Vectorize a Vectorize object asynchronously
+        Vectorize a Vectorize object asynchronously.
+        Concurrent calls are coalesced into batch requests when batching is enabled.
+        """
+        if not self._load_cached([vectorize], **kwargs):
+            return
+        if self._batcher is None:
+            await self._embedding_client.vectorize_async(vectorize, **kwargs)
+        else:
+            vectorize.vector = await self._batcher.submit(
+                vectorize.get_vectorize_content(), **kwargs
+            )
+        self._store_cached([vectorize], **kwargs)
+        return
+
+    def do_embedding_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """
+        Get embeddings for several texts, split into requests of at most batch_size texts
+        """
+        embeddings = []
+        for start in range(0, len(texts), self._max_batch_size):
+            chunk = texts[start : start + self._max_batch_size]
+            embeddings.extend(self._embedding_client.generate_embeddings_batch(chunk, **kwargs))
+        return embeddings
+
+    async def do_embedding_batch_async(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """
+        Get embeddings for several texts asynchronously, chunks are requested concurrently
+        """
+        chunks = [
+            texts[start : start + self._max_batch_size]
+            for start in range(0, len(texts), self._max_batch_size)
+        ]
+        results = await asyncio.gather(
+            *[self._embed_batch_async(chunk, **kwargs) for chunk in chunks]
+        )
+        return [embedding for chunk_embeddings in results for embedding in chunk_embeddings]
+
+    def do_vectorize_batch(self, vectorizes: List[Vectorize], **kwargs):
+        """
+        Vectorize several Vectorize objects with as few requests as possible
+        """
+        pending = self._load_cached(vectorizes, **kwargs)
+        if not pending:
+            return
+        vectors = self.do_embedding_batch([v.get_vectorize_content() for v in pending], **kwargs)
+        for vectorize, vector in zip(pending, vectors):
+            vectorize.vector = vector
+        self._store_cached(pending, **kwargs)
+        return
+
+    async def do_vectorize_batch_async(self, vectorizes: List[Vectorize], **kwargs):
         """
-        if vectorize.vector:
+        Vectorize several Vectorize objects asynchronously with as few requests as possible
+        """
+        pending = self._load_cached(vectorizes, **kwargs)
+        if not pending:
             return
-        await self._embedding_client.vectorize_async(vectorize, **kwargs)
+        vectors = await self.do_embedding_batch_async(
+            [v.get_vectorize_content() for v in pending], **kwargs
+        )
+        for vectorize, vector in zip(pending, vectors):
+            vectorize.vector = vector
+        self._store_cached(pending, **kwargs)
         return
 
 
@@ -136,3 +292,17 @@ def do_vectorize(vectorize_obj: Vectorize, **kwargs):
   
 async def do_vectorize_async(vectorize_obj: Vectorize, **kwargs):
     return await GlobalEmbeddingClient.get_instance().do_vectorize_async(vectorize_obj, **kwargs)
+
+
+def do_embedding_batch(texts: List[str], **kwargs) -> List[List[float]]:
+    return GlobalEmbeddingClient.get_instance().do_embedding_batch(texts, **kwargs)
+
+
+def do_vectorize_batch(vectorize_objs: List[Vectorize], **kwargs):
+    return GlobalEmbeddingClient.get_instance().do_vectorize_batch(vectorize_objs, **kwargs)
+
+
+async def do_vectorize_batch_async(vectorize_objs: List[Vectorize], **kwargs):
+    return await GlobalEmbeddingClient.get_instance().do_vectorize_batch_async(
+        vectorize_objs, **kwargs
+    )
@@ -13,6 +13,7 @@ import asyncio
 import concurrent.futures
 import json
 import threading
+from contextlib import aclosing
 from typing import Any, Dict, Optional
 
 from opencontext.config.global_config import get_config
@@ -252,10 +253,11 @@ class GlobalVLMClient:
         """
         Agent-specific streaming generation method
         """
-        async for chunk in self._vlm_client._openai_chat_completion_stream_async(
-            messages, tools=tools, **kwargs
-        ):
-            yield chunk
+        async with aclosing(
+            self._vlm_client._openai_chat_completion_stream_async(messages, tools=tools, **kwargs)
+        ) as stream:
+            async for chunk in stream:
+                yield chunk
 
     async def execute_tool_async(self, tool_call):
         """
@@ -310,7 +312,8 @@ async def generate_for_agent_async(messages: list, tools: list = None, **kwargs)
 
 
 async def generate_stream_for_agent(messages: list, tools: list = None, **kwargs):
-    async for chunk in GlobalVLMClient.get_instance().generate_stream_for_agent(
-        messages, tools, **kwargs
-    ):
-        yield chunk
+    async with aclosing(
+        GlobalVLMClient.get_instance().generate_stream_for_agent(messages, tools, **kwargs)
+    ) as stream:
+        async for chunk in stream:
+            yield chunk
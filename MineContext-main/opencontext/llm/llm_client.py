@@ -7,11 +7,15 @@
 OpenContext module: llm_client
 """
 
+import asyncio
+import threading
+import weakref
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from openai import APIError, AsyncOpenAI, OpenAI
 
+from opencontext.llm.request_scheduler import estimate_message_tokens, get_request_scheduler
 from opencontext.models.context import Vectorize
 from opencontext.utils.logging_utils import get_logger
 from opencontext.monitoring import record_processing_stage
@@ -29,6 +33,11 @@ class LLMType(Enum):
     EMBEDDING = "embedding"
 
 
+def _total_tokens(response: Any) -> Optional[int]:
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "total_tokens", None) if usage else None
+
+
 class LLMClient:
     def __init__(self, llm_type: LLMType, config: Dict[str, Any]):
         self.llm_type = llm_type
@@ -41,9 +50,34 @@ class LLMClient:
         if not self.api_key or not self.base_url or not self.model:
             raise ValueError("API key, base URL, and model must be provided")
         self.client = OpenAI(api_key=self.api_key, base_url=self.base_url, timeout=self.timeout)
-        self.async_client = AsyncOpenAI(
-            api_key=self.api_key, base_url=self.base_url, timeout=self.timeout
+        # HTTP connections of an async client belong to the loop that opened them, so keep
+        # one client per event loop and reuse it for every call made on that loop
+        self._async_clients: "weakref.WeakKeyDictionary[Any, AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
         )
+        self._async_clients_lock = threading.Lock()
+        self._default_async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async client for the running event loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._async_clients_lock:
+            if loop is None:
+                if self._default_async_client is None:
+                    self._default_async_client = self._create_async_client()
+                return self._default_async_client
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._create_async_client()
+                self._async_clients[loop] = client
+            return client
+
+    def _create_async_client(self) -> AsyncOpenAI:
+        return AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=self.timeout)
 
     def generate(self, prompt: str, **kwargs) -> str:
         messages = [{"role": "user", "content": prompt}]
@@ -51,13 +85,20 @@ class LLMClient:
 
     def generate_with_messages(self, messages: List[Dict[str, Any]], **kwargs):
         if self.llm_type == LLMType.CHAT:
-            return self._openai_chat_completion(messages, **kwargs)
+            with get_request_scheduler().slot(estimate_message_tokens(messages)) as lease:
+                response = self._openai_chat_completion(messages, **kwargs)
+                lease.report_usage(_total_tokens(response))
+                return response
         else:
             raise ValueError(f"Unsupported LLM type for message generation: {self.llm_type}")
 
     async def generate_with_messages_async(self, messages: List[Dict[str, Any]], **kwargs):
         if self.llm_type == LLMType.CHAT:
-            return await self._openai_chat_completion_async(messages, **kwargs)
+            scheduler = get_request_scheduler()
+            async with scheduler.slot_async(estimate_message_tokens(messages)) as lease:
+                response = await self._openai_chat_completion_async(messages, **kwargs)
+                lease.report_usage(_total_tokens(response))
+                return response
         else:
             raise ValueError(f"Unsupported LLM type for message generation: {self.llm_type}")
 
@@ -87,6 +128,26 @@ class LLMClient:
         else:
             raise ValueError(f"Unsupported LLM type for embedding generation: {self.llm_type}")
 
+    def generate_embeddings_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """Embed several texts in a single request, results are in input order"""
+        if self.llm_type == LLMType.EMBEDDING:
+            if not texts:
+                return []
+            return self._openai_embedding_batch(list(texts), **kwargs)
+        else:
+            raise ValueError(f"Unsupported LLM type for embedding generation: {self.llm_type}")
+
+    async def generate_embeddings_batch_async(
+        self, texts: List[str], **kwargs
+    ) -> List[List[float]]:
+        """Async version of generate_embeddings_batch"""
+        if self.llm_type == LLMType.EMBEDDING:
+            if not texts:
+                return []
+            return await self._openai_embedding_batch_async(list(texts), **kwargs)
+        else:
+            raise ValueError(f"Unsupported LLM type for embedding generation: {self.llm_type}")
+
     def _openai_chat_completion(self, messages: List[Dict[str, Any]], **kwargs):
         import time
 
@@ -226,7 +287,21 @@ class LLMClient:
             raise
 
     async def _openai_chat_completion_stream_async(self, messages: List[Dict[str, Any]], **kwargs):
-        """Async stream chat completion - async generator"""
+        """Async stream chat completion - async generator, holds a scheduler slot while streaming"""
+        scheduler = get_request_scheduler()
+        stream = self._openai_chat_completion_stream_unscheduled(messages, **kwargs)
+        async with scheduler.slot_async(estimate_message_tokens(messages)):
+            try:
+                async for chunk in stream:
+                    yield chunk
+            finally:
+                # Close the response before the slot is released, also when the consumer
+                # stopped early, rather than whenever the generator is garbage collected
+                await stream.aclose()
+
+    async def _openai_chat_completion_stream_unscheduled(
+        self, messages: List[Dict[str, Any]], **kwargs
+    ):
         try:
             tools = kwargs.get("tools", None)
             thinking = kwargs.get("thinking", None)
@@ -254,65 +329,66 @@ class LLMClient:
             stream = await async_client.chat.completions.create(**create_params)
 
             # Return stream object directly, it's already an async iterator
-            async for chunk in stream:
-                yield chunk
+            try:
+                async for chunk in stream:
+                    yield chunk
+            finally:
+                await stream.close()
         except APIError as e:
             logger.error(f"OpenAI API async stream error: {e}")
             raise
 
     def _openai_embedding(self, text: str, **kwargs) -> List[float]:
-        try:
-            response = self.client.embeddings.create(model=self.model, input=[text])
-            embedding = response.data[0].embedding
-
-            # Record token usage
-            if hasattr(response, "usage") and response.usage:
-                try:
-                    from opencontext.monitoring import record_token_usage
+        return self._openai_embedding_batch([text], **kwargs)[0]
 
-                    record_token_usage(
-                        model=self.model,
-                        prompt_tokens=response.usage.prompt_tokens,
-                        completion_tokens=0,  # embedding has no completion tokens
-                        total_tokens=response.usage.total_tokens,
-                    )
-                except ImportError:
-                    pass  # Monitoring module not installed or initialized
-
-            output_dim = kwargs.get("output_dim", self.config.get("output_dim", 0))
-            if output_dim and len(embedding) > output_dim:
-                import math
-
-                embedding = embedding[:output_dim]
-                norm = math.sqrt(sum(x**2 for x in embedding))
-                if norm > 0:
-                    embedding = [x / norm for x in embedding]
+    async def _openai_embedding_async(self, text: str, **kwargs) -> List[float]:
+        embeddings = await self._openai_embedding_batch_async([text], **kwargs)
+        return embeddings[0]
 
-            return embedding
+    def _openai_embedding_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        try:
+            response = self.client.embeddings.create(model=self.model, input=texts)
+            return self._parse_embedding_response(response, len(texts), **kwargs)
         except APIError as e:
             logger.error(f"OpenAI API error during embedding: {e}")
             raise
-          
-    async def _openai_embedding_async(self, text: str, **kwargs) -> List[float]:
+
+    async def _openai_embedding_batch_async(self, texts: List[str], **kwargs) -> List[List[float]]:
         try:
-            response = await self.async_client.embeddings.create(model=self.model, input=[text])
-            embedding = response.data[0].embedding
+            response = await self.async_client.embeddings.create(model=self.model, input=texts)
+            return self._parse_embedding_response(response, len(texts), **kwargs)
+        except APIError as e:
+            logger.error(f"OpenAI API error during embedding: {e}")
+            raise
 
-            # Record token usage
-            if hasattr(response, "usage") and response.usage:
-                try:
-                    from opencontext.monitoring import record_token_usage
+    def _parse_embedding_response(
+        self, response: Any, expected_count: int, **kwargs
+    ) -> List[List[float]]:
+        """Order embeddings by input index, record usage and apply output_dim truncation"""
+        data = sorted(response.data, key=lambda item: getattr(item, "index", 0) or 0)
+        if len(data) != expected_count:
+            raise ValueError(
+                f"Embedding response size mismatch: expected {expected_count}, got {len(data)}"
+            )
 
-                    record_token_usage(
-                        model=self.model,
-                        prompt_tokens=response.usage.prompt_tokens,
-                        completion_tokens=0,  # embedding has no completion tokens
-                        total_tokens=response.usage.total_tokens,
-                    )
-                except ImportError:
-                    pass  # Monitoring module not installed or initialized
+        # Record token usage
+        if hasattr(response, "usage") and response.usage:
+            try:
+                from opencontext.monitoring import record_token_usage
 
-            output_dim = kwargs.get("output_dim", self.config.get("output_dim", 0))
+                record_token_usage(
+                    model=self.model,
+                    prompt_tokens=response.usage.prompt_tokens,
+                    completion_tokens=0,  # embedding has no completion tokens
+                    total_tokens=response.usage.total_tokens,
+                )
+            except ImportError:
+                pass  # Monitoring module not installed or initialized
+
+        output_dim = kwargs.get("output_dim", self.config.get("output_dim", 0))
+        embeddings = []
+        for item in data:
+            embedding = item.embedding
             if output_dim and len(embedding) > output_dim:
                 import math
 
@@ -320,13 +396,8 @@ class LLMClient:
                 norm = math.sqrt(sum(x**2 for x in embedding))
                 if norm > 0:
                     embedding = [x / norm for x in embedding]
-
-            return embedding
-        except APIError as e:
-            logger.error(f"OpenAI API error during embedding: {e}")
-            raise
-
-
+            embeddings.append(embedding)
+        return embeddings
 
     def vectorize(self, vectorize: Vectorize, **kwargs):
         if vectorize.vector:
@@ -339,6 +410,17 @@ class LLMClient:
             return
         vectorize.vector = await self.generate_embedding_async(vectorize.get_vectorize_content(), **kwargs)
         return
+
+    def vectorize_batch(self, vectorizes: List[Vectorize], **kwargs):
+        pending = [v for v in vectorizes if not v.vector]
+        if not pending:
+            return
+        vectors = self.generate_embeddings_batch(
+            [v.get_vectorize_content() for v in pending], **kwargs
+        )
+        for vectorize, vector in zip(pending, vectors):
+            vectorize.vector = vector
+        return
       
 
     def validate(self) -> tuple[bool, str]:
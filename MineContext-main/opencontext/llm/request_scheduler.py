@@ -0,0 +1,409 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-wide scheduler for chat/VLM requests
+Bounds concurrency and token rate across every caller and admits waiting requests by
+priority, so background ingest cannot starve interactive traffic.
+"""
+
+import asyncio
+import contextvars
+import functools
+import heapq
+import inspect
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Rough cost of one image part, providers bill images by tiles
+IMAGE_TOKEN_ESTIMATE = 1000
+
+
+class RequestPriority(IntEnum):
+    """Lower value is admitted first"""
+
+    INTERACTIVE = 0  # Agent chat, completions
+    NORMAL = 1
+    BACKGROUND = 2  # Screenshot/document ingest, periodic generation
+
+
+_current_priority: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar(
+    "llm_request_priority", default=RequestPriority.NORMAL
+)
+
+
+def get_request_priority() -> RequestPriority:
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Set the priority of LLM requests made in this context (thread or task)"""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        try:
+            _current_priority.reset(token)
+        except ValueError:
+            # Exited from another context, e.g. an async generator closed by the GC
+            pass
+
+
+async def run_with_priority(awaitable: Awaitable[T], priority: RequestPriority) -> T:
+    """Await `awaitable` with the given request priority, tasks it creates inherit it"""
+    with request_priority(priority):
+        return await awaitable
+
+
+def with_priority(priority: RequestPriority) -> Callable:
+    """Decorator running a sync function, coroutine function or async generator at `priority`"""
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def asyncgen_wrapper(*args, **kwargs):
+                # Only each step of the generator runs at `priority`: held across `yield`, it
+                # would leak into the consumer and be reset from another context on close
+                agen = func(*args, **kwargs)
+                try:
+                    while True:
+                        with request_priority(priority):
+                            try:
+                                item = await agen.__anext__()
+                            except StopAsyncIteration:
+                                return
+                        yield item
+                finally:
+                    with request_priority(priority):
+                        await agen.aclose()
+
+            return asyncgen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with request_priority(priority):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with request_priority(priority):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def estimate_message_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Cheap prompt size estimate (about 4 characters per token) used for rate limiting"""
+    chars = 0
+    images = 0
+    for message in messages or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if not isinstance(part, dict):
+                    continue
+                if part.get("type") == "image_url":
+                    images += 1
+                else:
+                    chars += len(str(part.get("text", "")))
+    return chars // 4 + images * IMAGE_TOKEN_ESTIMATE
+
+
+class _Waiter:
+    """A request waiting for admission, woken through an Event or an asyncio future"""
+
+    def __init__(self, priority: int, tokens: int, loop: Optional[asyncio.AbstractEventLoop]):
+        self.priority = priority
+        self.tokens = tokens
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self.cancelled = False
+        self._loop = loop
+        if loop is not None:
+            self._future: Optional[asyncio.Future] = loop.create_future()
+            self._event = None
+        else:
+            self._future = None
+            self._event = threading.Event()
+
+    def grant(self):
+        self.granted = True
+        if self._event is not None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self._future.done():
+            self._future.set_result(None)
+
+    def wait(self):
+        self._event.wait()
+
+    async def wait_async(self):
+        await self._future
+
+
+class RequestLease:
+    """Admission of one request, report actual usage so the token budget stays accurate"""
+
+    def __init__(self, scheduler: "LLMRequestScheduler", priority: int, tokens: int):
+        self._scheduler = scheduler
+        self.priority = priority
+        self.estimated_tokens = tokens
+        self.actual_tokens: Optional[int] = None
+
+    def report_usage(self, total_tokens: Optional[int]):
+        if total_tokens:
+            self.actual_tokens = int(total_tokens)
+
+
+class LLMRequestScheduler:
+    """
+    Admission control for chat/VLM requests shared by sync and async callers.
+
+    At most `max_concurrency` requests are in flight, and `interactive_reserved` of those
+    slots are only available to interactive requests. Waiting requests are admitted in
+    priority order (FIFO within a priority) as soon as a slot frees up, so callers can
+    submit whole batches and keep a sliding window of requests in flight. Optional
+    `tokens_per_minute` / `requests_per_minute` token buckets throttle admission; the
+    token bucket is charged with an estimate and corrected with the reported usage.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        interactive_reserved: int = 2,
+        tokens_per_minute: int = 0,
+        requests_per_minute: int = 0,
+    ):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.interactive_reserved = min(max(0, int(interactive_reserved)), self.max_concurrency - 1)
+        self.tokens_per_minute = max(0, int(tokens_per_minute))
+        self.requests_per_minute = max(0, int(requests_per_minute))
+
+        self._lock = threading.Lock()
+        self._waiters: List = []  # heap of (priority, seq, waiter)
+        self._seq = itertools.count()
+        self._in_flight: Dict[int, int] = {int(p): 0 for p in RequestPriority}
+        self._token_budget = float(self.tokens_per_minute)
+        self._request_budget = float(self.requests_per_minute)
+        self._last_refill = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._stats = {"admitted": 0, "completed": 0, "wait_ms_total": 0, "max_wait_ms": 0}
+
+    # Admission
+
+    @contextmanager
+    def slot(
+        self, estimated_tokens: int = 0, priority: Optional[RequestPriority] = None
+    ) -> Iterator[RequestLease]:
+        """Block the calling thread until the request is admitted"""
+        waiter = self._enqueue(priority, estimated_tokens, None)
+        if not waiter.granted:
+            waiter.wait()
+        lease = RequestLease(self, waiter.priority, waiter.tokens)
+        try:
+            yield lease
+        finally:
+            self._release(lease)
+
+    @asynccontextmanager
+    async def slot_async(
+        self, estimated_tokens: int = 0, priority: Optional[RequestPriority] = None
+    ):
+        """Wait without blocking the event loop until the request is admitted"""
+        waiter = self._enqueue(priority, estimated_tokens, asyncio.get_running_loop())
+        if not waiter.granted:
+            try:
+                await waiter.wait_async()
+            except asyncio.CancelledError:
+                with self._lock:
+                    granted = waiter.granted
+                    waiter.cancelled = True
+                if granted:
+                    self._release(RequestLease(self, waiter.priority, waiter.tokens))
+                raise
+        lease = RequestLease(self, waiter.priority, waiter.tokens)
+        try:
+            yield lease
+        finally:
+            self._release(lease)
+
+    def _enqueue(
+        self,
+        priority: Optional[RequestPriority],
+        tokens: int,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> _Waiter:
+        priority = int(get_request_priority() if priority is None else priority)
+        waiter = _Waiter(priority, max(0, int(tokens)), loop)
+        with self._lock:
+            heapq.heappush(self._waiters, (priority, next(self._seq), waiter))
+            self._dispatch()
+        self._report()
+        return waiter
+
+    def _release(self, lease: RequestLease):
+        with self._lock:
+            self._in_flight[lease.priority] -= 1
+            self._stats["completed"] += 1
+            if self.tokens_per_minute and lease.actual_tokens is not None:
+                # Refund or charge the difference to the estimate
+                self._token_budget += lease.estimated_tokens - lease.actual_tokens
+            self._dispatch()
+        self._report()
+
+    def _dispatch(self):
+        """Admit waiting requests while capacity allows, caller holds the lock"""
+        self._refill()
+        while self._waiters:
+            priority, _, waiter = self._waiters[0]
+            if waiter.cancelled:
+                heapq.heappop(self._waiters)
+                continue
+            if sum(self._in_flight.values()) >= self._concurrency_limit(priority):
+                # Lower priorities cannot use slots a higher priority waiter is blocked on
+                return
+            delay = self._rate_delay(waiter.tokens)
+            if delay > 0:
+                self._schedule_retry(delay)
+                return
+
+            heapq.heappop(self._waiters)
+            if self.tokens_per_minute:
+                self._token_budget -= min(waiter.tokens, self.tokens_per_minute)
+            if self.requests_per_minute:
+                self._request_budget -= 1
+            self._in_flight[priority] += 1
+            wait_ms = int((time.monotonic() - waiter.enqueued_at) * 1000)
+            self._stats["admitted"] += 1
+            self._stats["wait_ms_total"] += wait_ms
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+            waiter.grant()
+
+    def _concurrency_limit(self, priority: int) -> int:
+        if priority <= RequestPriority.INTERACTIVE:
+            return self.max_concurrency
+        return self.max_concurrency - self.interactive_reserved
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.tokens_per_minute:
+            self._token_budget = min(
+                float(self.tokens_per_minute),
+                self._token_budget + elapsed * self.tokens_per_minute / 60,
+            )
+        if self.requests_per_minute:
+            self._request_budget = min(
+                float(self.requests_per_minute),
+                self._request_budget + elapsed * self.requests_per_minute / 60,
+            )
+
+    def _rate_delay(self, tokens: int) -> float:
+        """Seconds until the buckets can pay for a request of `tokens`, 0 if now"""
+        delay = 0.0
+        if self.tokens_per_minute:
+            # Requests larger than the whole budget only wait for a full bucket
+            missing = min(tokens, self.tokens_per_minute) - self._token_budget
+            if missing > 0:
+                delay = max(delay, missing * 60 / self.tokens_per_minute)
+        if self.requests_per_minute and self._request_budget < 1:
+            delay = max(delay, (1 - self._request_budget) * 60 / self.requests_per_minute)
+        return delay
+
+    def _schedule_retry(self, delay: float):
+        if self._timer is not None:
+            return
+
+        def retry():
+            with self._lock:
+                self._timer = None
+                self._dispatch()
+            self._report()
+
+        self._timer = threading.Timer(delay, retry)
+        self._timer.daemon = True
+        self._timer.start()
+
+    # Metrics
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            queued: Dict[str, int] = {p.name.lower(): 0 for p in RequestPriority}
+            for priority, _, waiter in self._waiters:
+                if not waiter.cancelled:
+                    queued[RequestPriority(priority).name.lower()] += 1
+            stats = dict(self._stats)
+            stats["queued"] = queued
+            stats["queue_depth"] = sum(queued.values())
+            stats["in_flight"] = {
+                RequestPriority(p).name.lower(): count for p, count in self._in_flight.items()
+            }
+            stats["max_concurrency"] = self.max_concurrency
+            stats["interactive_reserved"] = self.interactive_reserved
+            stats["avg_wait_ms"] = (
+                stats["wait_ms_total"] / stats["admitted"] if stats["admitted"] else 0
+            )
+            if self.tokens_per_minute:
+                stats["token_budget"] = int(self._token_budget)
+        return stats
+
+    def _report(self):
+        try:
+            from opencontext.monitoring import record_llm_scheduler
+
+            record_llm_scheduler(self.get_statistics())
+        except Exception as e:
+            logger.debug(f"Failed to record LLM scheduler statistics: {e}")
+
+
+# Global scheduler instance
+_scheduler: Optional[LLMRequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_request_scheduler() -> LLMRequestScheduler:
+    """Get the process-wide scheduler, configured from the `llm_scheduler` config section"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                try:
+                    from opencontext.config.global_config import get_config
+
+                    config = get_config("llm_scheduler") or {}
+                except Exception:
+                    config = {}
+                _scheduler = LLMRequestScheduler(
+                    max_concurrency=config.get("max_concurrency", 8),
+                    interactive_reserved=config.get("interactive_reserved", 2),
+                    tokens_per_minute=config.get("tokens_per_minute", 0),
+                    requests_per_minute=config.get("requests_per_minute", 0),
+                )
+    return _scheduler
@@ -20,6 +20,7 @@ from opencontext.context_consumption.generation.realtime_activity_monitor import
 )
 from opencontext.context_consumption.generation.smart_tip_generator import SmartTipGenerator
 from opencontext.context_consumption.generation.smart_todo_manager import SmartTodoManager
+from opencontext.llm.request_scheduler import RequestPriority, with_priority
 from opencontext.managers.event_manager import EventType, get_event_manager
 from opencontext.models.enums import VaultType
 from opencontext.storage.global_storage import get_storage
@@ -209,6 +210,7 @@ class ConsumptionManager:
             last_report_time.date()
         )  # Record date of last daily report generation
 
+        @with_priority(RequestPriority.BACKGROUND)
         def check_and_generate_daily_report():
             if not self._activity_generator or not self._task_enabled.get("report", True):
                 return
@@ -246,6 +248,7 @@ class ConsumptionManager:
             logger.info("Activity task is disabled, skipping timer start")
             return
 
+        @with_priority(RequestPriority.BACKGROUND)
         def generate_activity():
             if not (
                 self._scheduled_tasks_enabled
@@ -285,6 +288,7 @@ class ConsumptionManager:
             logger.info("Tips task is disabled, skipping timer start")
             return
 
+        @with_priority(RequestPriority.BACKGROUND)
         def generate_tips():
             if not (
                 self._scheduled_tasks_enabled
@@ -322,6 +326,7 @@ class ConsumptionManager:
             logger.info("Todos task is disabled, skipping timer start")
             return
 
+        @with_priority(RequestPriority.BACKGROUND)
         def generate_todos():
             if not (
                 self._scheduled_tasks_enabled
@@ -40,6 +40,9 @@ class RawContextProperties(BaseModel):
     content_path: Optional[str] = None  # file path if ContentFormat is VIDEO or IMAGE; None if TEXT
     content_type: Optional[str] = None  # content type, e.g. "text", "image", "video"
     content_text: Optional[str] = None  # text content if ContentFormat is TEXT; None otherwise
+    content_bytes: Optional[bytes] = Field(
+        default=None, exclude=True
+    )  # in-memory encoded content (e.g. a screenshot frame), never serialized
     filter_path: Optional[str] = None  # filter path
     additional_info: Optional[Dict[str, Any]] = None  # additional information
     enable_merge: bool = True
@@ -17,11 +17,15 @@ from .monitor import (
     increment_recording_stat,
     increment_screenshot_count,
     initialize_monitor,
+    record_document_ingest,
+    record_embedding_cache,
+    record_llm_scheduler,
     record_processing_error,
     record_processing_metrics,
     record_processing_stage,
     record_retrieval_metrics,
     record_token_usage,
+    record_write_queue,
     reset_recording_stats,
     record_screenshot_path,
 )
@@ -31,6 +35,10 @@ __all__ = [
     "get_monitor",
     "initialize_monitor",
     "record_token_usage",
+    "record_embedding_cache",
+    "record_write_queue",
+    "record_document_ingest",
+    "record_llm_scheduler",
     "record_processing_metrics",
     "record_retrieval_metrics",
     "record_processing_error",
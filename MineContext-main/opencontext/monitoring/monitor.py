@@ -114,6 +114,12 @@ class Monitor:
         # Recording session statistics
         self._recording_stats = RecordingSessionStats()
 
+        # Embedding cache counters
+        self._embedding_cache_stats = {"hits": 0, "misses": 0, "entries": 0}
+        self._write_queue_stats: Dict[str, Any] = {}
+        self._llm_scheduler_stats: Dict[str, Any] = {}
+        self._document_ingest_stats: Dict[str, Any] = {}
+
         # Start time
         self._start_time = datetime.now()
 
@@ -200,6 +206,53 @@ class Monitor:
             )
             self._retrieval_history.append(metrics)
 
+    def record_embedding_cache(self, hits: int = 0, misses: int = 0, entries: Optional[int] = None):
+        """Record embedding cache hits and misses"""
+        with self._lock:
+            self._embedding_cache_stats["hits"] += hits
+            self._embedding_cache_stats["misses"] += misses
+            if entries is not None:
+                self._embedding_cache_stats["entries"] = entries
+
+    def get_embedding_cache_summary(self) -> Dict[str, Any]:
+        """Get embedding cache hit/miss summary since startup"""
+        with self._lock:
+            stats = dict(self._embedding_cache_stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["lookups"] = lookups
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def record_write_queue(self, stats: Dict[str, Any]):
+        """Record the latest vector write-behind queue statistics"""
+        with self._lock:
+            self._write_queue_stats = dict(stats)
+
+    def get_write_queue_summary(self) -> Dict[str, Any]:
+        """Get vector write-behind queue depth, throughput and backpressure statistics"""
+        with self._lock:
+            return dict(self._write_queue_stats)
+
+    def record_llm_scheduler(self, stats: Dict[str, Any]):
+        """Record the latest LLM request scheduler statistics"""
+        with self._lock:
+            self._llm_scheduler_stats = dict(stats)
+
+    def get_llm_scheduler_summary(self) -> Dict[str, Any]:
+        """Get LLM request queue depth, in-flight requests and admission wait times"""
+        with self._lock:
+            return dict(self._llm_scheduler_stats)
+
+    def record_document_ingest(self, stats: Dict[str, Any]):
+        """Record the latest document ingest progress"""
+        with self._lock:
+            self._document_ingest_stats = dict(stats)
+
+    def get_document_ingest_summary(self) -> Dict[str, Any]:
+        """Get queued and in-flight documents with per-document progress and ETA"""
+        with self._lock:
+            return dict(self._document_ingest_stats)
+
     def get_context_type_stats(self, force_refresh: bool = False) -> Dict[str, int]:
         """Get record count for each context_type"""
         now = datetime.now()
@@ -715,6 +768,10 @@ class Monitor:
             "processing": self.get_processing_summary(hours=24),
             "stage_timing": self.get_stage_timing_summary(hours=24),
             "data_stats_24h": self.get_data_stats_summary(hours=24),
+            "embedding_cache": self.get_embedding_cache_summary(),
+            "write_queue": self.get_write_queue_summary(),
+            "llm_scheduler": self.get_llm_scheduler_summary(),
+            "document_ingest": self.get_document_ingest_summary(),
             "last_updated": datetime.now().isoformat(),
         }
 
@@ -775,6 +832,26 @@ def record_processing_error(
     get_monitor().record_processing_error(error_message, processor_name, context_count, timestamp)
 
 
+def record_embedding_cache(hits: int = 0, misses: int = 0, entries: Optional[int] = None):
+    """Global function: Record embedding cache hits and misses"""
+    get_monitor().record_embedding_cache(hits, misses, entries)
+
+
+def record_write_queue(stats: Dict[str, Any]):
+    """Global function: Record vector write-behind queue statistics"""
+    get_monitor().record_write_queue(stats)
+
+
+def record_llm_scheduler(stats: Dict[str, Any]):
+    """Global function: Record LLM request scheduler statistics"""
+    get_monitor().record_llm_scheduler(stats)
+
+
+def record_document_ingest(stats: Dict[str, Any]):
+    """Global function: Record document ingest progress"""
+    get_monitor().record_document_ingest(stats)
+
+
 def record_processing_stage(
     stage_name: str, duration_ms: int, status: str = "success", metadata: Optional[str] = None
 ):
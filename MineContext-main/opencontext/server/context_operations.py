@@ -53,14 +53,19 @@ class ContextOperations:
     def update_context(self, doc_id: str, context: ProcessedContext) -> bool:
         """Update a processed context."""
         if self.storage:
-            return self.storage.upsert_processed_context(context)
+            doc_id = self.storage.upsert_processed_context(context)
+            # Interactive edits are read back right away, don't leave them in the write-behind queue
+            self.storage.flush_writes()
+            return doc_id
         logger.warning("Storage is not initialized.")
         return False
 
     def delete_context(self, doc_id: str, context_type: str) -> bool:
         """Delete a processed context."""
         if self.storage:
-            return self.storage.delete_processed_context(doc_id, context_type)
+            deleted = self.storage.delete_processed_context(doc_id, context_type)
+            self.storage.flush_writes()
+            return deleted
         logger.warning("Storage is not initialized.")
         return False
 
@@ -155,6 +160,7 @@ class ContextOperations:
         top_k: int = 10,
         context_types: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
+        hybrid: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Perform vector search without LLM processing.
@@ -164,6 +170,8 @@ class ContextOperations:
             top_k: Number of results to return
             context_types: Context type filter list
             filters: Additional filter conditions
+            hybrid: Fuse full-text and vector results, the fused rank only sets the order,
+                scores stay vector similarities
 
         Returns:
             List of search results with context and scores
@@ -176,7 +184,8 @@ class ContextOperations:
             query_vectorize = Vectorize(text=query)
 
             # Execute vector search
-            search_results = self.storage.search(
+            search = self.storage.hybrid_search if hybrid else self.storage.search
+            search_results = search(
                 query=query_vectorize, top_k=top_k, context_types=context_types, filters=filters
             )
 
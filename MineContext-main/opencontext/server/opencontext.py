@@ -245,11 +245,12 @@ class OpenContext:
         top_k: int = 10,
         context_types: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
+        hybrid: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Perform vector search without LLM processing."""
+        """Perform vector search, or hybrid full-text and vector search, without LLM processing."""
         if not self.context_operations:
             raise RuntimeError("Context operations not initialized")
-        return self.context_operations.search(query, top_k, context_types, filters)
+        return self.context_operations.search(query, top_k, context_types, filters, hybrid)
 
     def get_context_types(self) -> List[str]:
         """Get all available context types."""
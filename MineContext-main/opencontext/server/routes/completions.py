@@ -9,7 +9,6 @@ Intelligent Completion API Routes
 Provides GitHub Copilot-like note content completion functionality
 """
 
-import asyncio
 import json
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -18,7 +17,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from opencontext.context_consumption.completion import get_completion_service
+from opencontext.context_consumption.completion import (
+    CompletionSuperseded,
+    get_completion_service,
+)
 from opencontext.models.enums import CompletionType
 from opencontext.server.middleware.auth import auth_dependency
 from opencontext.utils.logging_utils import get_logger
@@ -34,6 +36,10 @@ class CompletionRequest(BaseModel):
     text: str = Field(..., description="Current document content")
     cursor_position: int = Field(..., description="Cursor position")
     document_id: Optional[int] = Field(None, description="Document ID")
+    session_id: Optional[str] = Field(
+        default=None,
+        description="Editor session ID, a newer request of the session cancels the pending one",
+    )
     completion_types: Optional[list] = Field(
         default=None,
         description="Specify completion types, e.g., ['semantic_continuation', 'template_completion']",
@@ -54,6 +60,16 @@ class CompletionResponse(BaseModel):
     error: Optional[str] = None
 
 
+def _filter_completion_types(request: CompletionRequest, suggestions: list) -> list:
+    """Keep suggestions of the requested completion types (if specified)"""
+    if request.completion_types:
+        valid_types = {ct.value for ct in CompletionType}
+        filter_types = set(request.completion_types) & valid_types
+        if filter_types:
+            return [s for s in suggestions if s.completion_type.value in filter_types]
+    return suggestions
+
+
 @router.post("/api/completions/suggest")
 async def get_completion_suggestions(request: CompletionRequest, _auth: str = auth_dependency):
     """
@@ -78,19 +94,28 @@ async def get_completion_suggestions(request: CompletionRequest, _auth: str = au
         completion_service = get_completion_service()
 
         # Get completion suggestions
-        suggestions = completion_service.get_completions(
-            current_text=request.text,
-            cursor_position=request.cursor_position,
-            document_id=request.document_id,
-            user_context=request.context or {},
-        )
+        try:
+            suggestions = await completion_service.get_completions_async(
+                current_text=request.text,
+                cursor_position=request.cursor_position,
+                document_id=request.document_id,
+                user_context=request.context or {},
+                session_id=request.session_id,
+            )
+        except CompletionSuperseded:
+            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            return JSONResponse(
+                {
+                    "success": True,
+                    "suggestions": [],
+                    "processing_time_ms": processing_time,
+                    "superseded": True,
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
 
         # Filter specified completion types (if specified)
-        if request.completion_types:
-            valid_types = {ct.value for ct in CompletionType}
-            filter_types = set(request.completion_types) & valid_types
-            if filter_types:
-                suggestions = [s for s in suggestions if s.completion_type.value in filter_types]
+        suggestions = _filter_completion_types(request, suggestions)
 
         # Limit number of suggestions
         if request.max_suggestions:
@@ -137,10 +162,12 @@ async def get_completion_suggestions_stream(
 ):
     """
     Stream completion suggestions
-    Suitable for scenarios requiring real-time completion progress display
+    Template and reference suggestions are sent first, semantic continuations when the LLM
+    answers. A newer request of the same editor session ends the stream with a superseded event.
     """
 
     async def generate_completions():
+        start_time = datetime.now()
         try:
             # Send start event
             yield f"data: {json.dumps({'type': 'start', 'timestamp': datetime.now().isoformat()})}\n\n"
@@ -148,42 +175,26 @@ async def get_completion_suggestions_stream(
             # Get completion service
             completion_service = get_completion_service()
 
-            # Simulate streaming different types of completions
-            completion_types = [
-                CompletionType.TEMPLATE_COMPLETION,
-                CompletionType.SEMANTIC_CONTINUATION,
-                CompletionType.REFERENCE_SUGGESTION,
-            ]
-
-            all_suggestions = []
-
-            for comp_type in completion_types:
-                # Send processing status
-                yield f"data: {json.dumps({'type': 'processing', 'completion_type': comp_type.value})}\n\n"
-
-                # Get completions for this type
-                suggestions = completion_service.get_completions(
-                    current_text=request.text,
-                    cursor_position=request.cursor_position,
-                    document_id=request.document_id,
-                    user_context=request.context or {},
-                )
-
-                # Filter suggestions for current type
-                type_suggestions = [s for s in suggestions if s.completion_type == comp_type]
-
-                if type_suggestions:
-                    all_suggestions.extend(type_suggestions)
-
-                    # Send suggestions for this type
-                    for suggestion in type_suggestions:
-                        yield f"data: {json.dumps({'type': 'suggestion', 'data': suggestion.to_dict()})}\n\n"
-
-                # Small delay to simulate processing time
-                await asyncio.sleep(0.1)
+            total_suggestions = 0
+            async for batch in completion_service.stream_completions(
+                current_text=request.text,
+                cursor_position=request.cursor_position,
+                document_id=request.document_id,
+                user_context=request.context or {},
+                session_id=request.session_id,
+            ):
+                # Send suggestions of each source as soon as it finished
+                for suggestion in _filter_completion_types(request, batch.suggestions):
+                    total_suggestions += 1
+                    yield f"data: {json.dumps({'type': 'suggestion', 'source': batch.source, 'elapsed_ms': batch.elapsed_ms, 'data': suggestion.to_dict()})}\n\n"
 
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete', 'total_suggestions': len(all_suggestions)})}\n\n"
+            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            yield f"data: {json.dumps({'type': 'complete', 'total_suggestions': total_suggestions, 'processing_time_ms': processing_time})}\n\n"
+            yield "data: [DONE]\n\n"
+
+        except CompletionSuperseded:
+            yield f"data: {json.dumps({'type': 'superseded'})}\n\n"
             yield "data: [DONE]\n\n"
 
         except Exception as e:
@@ -252,6 +263,7 @@ async def get_completion_stats(_auth: str = auth_dependency):
         stats = {
             "service_status": "active",
             "cache_stats": cache_stats,
+            "source_stats": completion_service.get_source_stats(),
             "supported_types": [ct.value for ct in CompletionType],
             "timestamp": datetime.now().isoformat(),
         }
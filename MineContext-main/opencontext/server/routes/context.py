@@ -64,6 +64,7 @@ class VectorSearchRequest(BaseModel):
     top_k: int = 10
     context_types: Optional[List[str]] = None
     filters: Optional[Dict[str, Any]] = None
+    hybrid: bool = False
 
 
 @router.post("/contexts/delete")
@@ -127,6 +128,7 @@ async def vector_search(
             top_k=request.top_k,
             context_types=request.context_types,
             filters=request.filters,
+            hybrid=request.hybrid,
         )
 
         return convert_resp(
@@ -137,6 +139,7 @@ async def vector_search(
                 "top_k": request.top_k,
                 "context_types": request.context_types,
                 "filters": request.filters,
+                "hybrid": request.hybrid,
             }
         )
 
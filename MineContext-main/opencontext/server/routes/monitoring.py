@@ -242,3 +242,63 @@ async def reset_recording_stats(_auth: str = auth_dependency):
         raise HTTPException(
             status_code=500, detail=f"Failed to reset recording statistics: {str(e)}"
         )
+
+
+@router.get("/embedding-cache")
+async def get_embedding_cache_stats(_auth: str = auth_dependency):
+    """
+    Get embedding cache hit/miss statistics
+    """
+    try:
+        monitor = get_monitor()
+        stats = monitor.get_embedding_cache_summary()
+        return {"success": True, "data": stats}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get embedding cache statistics: {str(e)}"
+        )
+
+
+@router.get("/write-queue")
+async def get_write_queue_stats(_auth: str = auth_dependency):
+    """
+    Get vector write-behind queue depth and backpressure statistics
+    """
+    try:
+        monitor = get_monitor()
+        stats = monitor.get_write_queue_summary()
+        return {"success": True, "data": stats}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get write queue statistics: {str(e)}"
+        )
+
+
+@router.get("/llm-scheduler")
+async def get_llm_scheduler_stats(_auth: str = auth_dependency):
+    """
+    Get LLM request scheduler queue depth and in-flight requests by priority
+    """
+    try:
+        monitor = get_monitor()
+        stats = monitor.get_llm_scheduler_summary()
+        return {"success": True, "data": stats}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get LLM scheduler statistics: {str(e)}"
+        )
+
+
+@router.get("/document-ingest")
+async def get_document_ingest_stats(_auth: str = auth_dependency):
+    """
+    Get queued and in-flight documents with per-document progress and ETA
+    """
+    try:
+        monitor = get_monitor()
+        stats = monitor.get_document_ingest_summary()
+        return {"success": True, "data": stats}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get document ingest statistics: {str(e)}"
+        )
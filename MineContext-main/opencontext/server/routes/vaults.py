@@ -78,14 +78,18 @@ async def note_editor_page(request: Request):
 async def get_documents_list(
     limit: int = Query(default=50, description="Return limit"),
     offset: int = Query(default=0, description="Offset"),
+    q: Optional[str] = Query(default=None, description="Full-text search query"),
     _auth: str = auth_dependency,
 ):
     """
-    Get document list
+    Get document list, or the best full-text matches of q
     """
     try:
         storage = get_storage()
-        documents = storage.get_vaults(limit=limit, offset=offset, is_deleted=False)
+        if q:
+            documents = storage.search_vaults(q, limit=limit, is_deleted=False)
+        else:
+            documents = storage.get_vaults(limit=limit, offset=offset, is_deleted=False)
 
         # Format return data
         result = []
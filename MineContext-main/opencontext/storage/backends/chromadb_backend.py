@@ -16,16 +16,23 @@ import json
 import signal
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
 import chromadb
 
-from opencontext.llm.global_embedding_client import do_vectorize
+from opencontext.llm.global_embedding_client import do_vectorize, do_vectorize_batch
 from opencontext.models.context import ContextProperties, ExtractedData, ProcessedContext, Vectorize
 from opencontext.models.enums import ContentFormat, ContextType
 from opencontext.storage.base_storage import IVectorStorageBackend, StorageType
+from opencontext.storage.search_utils import (
+    DEFAULT_SEARCH_WORKERS,
+    CollectionEmptinessCache,
+    merge_top_k,
+)
 from opencontext.utils.logging_utils import get_logger
+from opencontext.utils.rwlock import KeyedReadWriteLock
 
 logger = get_logger(__name__)
 
@@ -48,8 +55,12 @@ class ChromaDBBackend(IVectorStorageBackend):
         self._max_retry_count = 3
         self._retry_delay = 1.0  # seconds
         self._pending_writes = []  # Pending writes
-        self._write_lock = threading.Lock()  # Write lock
+        # Searches on a collection run concurrently, upserts and deletes take it exclusively
+        self._collection_locks = KeyedReadWriteLock()
+        self._pending_lock = threading.Lock()  # Guards _pending_writes
         self._cleanup_registered = False
+        self._search_executor: Optional[ThreadPoolExecutor] = None
+        self._emptiness = CollectionEmptinessCache()
 
         # Register graceful shutdown handler
         self._register_cleanup_handlers()
@@ -80,7 +91,7 @@ class ChromaDBBackend(IVectorStorageBackend):
     def _cleanup(self) -> None:
         """Clean up resources and persist data"""
         try:
-            with self._write_lock:
+            with self._pending_lock:
                 # Complete all pending writes
                 if self._pending_writes:
                     logger.info(
@@ -103,12 +114,13 @@ class ChromaDBBackend(IVectorStorageBackend):
                 try:
                     # Execute write operation
                     collection = write_op["collection"]
-                    collection.upsert(
-                        ids=write_op["ids"],
-                        documents=write_op["documents"],
-                        metadatas=write_op["metadatas"],
-                        embeddings=write_op["embeddings"],
-                    )
+                    with self._collection_locks.write_lock(write_op["context_type"]):
+                        collection.upsert(
+                            ids=write_op["ids"],
+                            documents=write_op["documents"],
+                            metadatas=write_op["metadatas"],
+                            embeddings=write_op["embeddings"],
+                        )
                     logger.debug(f"Completed pending write: {len(write_op['ids'])} documents")
                 except Exception as e:
                     logger.error(f"Failed to flush write operation: {e}")
@@ -180,6 +192,10 @@ class ChromaDBBackend(IVectorStorageBackend):
             )
             self._collections["todo"] = todo_collection
 
+            self._search_executor = ThreadPoolExecutor(
+                max_workers=chroma_config.get("search_workers", DEFAULT_SEARCH_WORKERS),
+                thread_name_prefix="chromadb-search",
+            )
             self._initialized = True
             logger.info(
                 f"ChromaDB vector backend initialized successfully, created {len(self._collections)} collections"
@@ -369,6 +385,12 @@ class ChromaDBBackend(IVectorStorageBackend):
         if not self._ensure_connection():
             raise RuntimeError("ChromaDB connection not available")
 
+        # Embed all missing vectors up front with batched requests
+        try:
+            do_vectorize_batch([c.vectorize for c in contexts if c.vectorize])
+        except Exception as e:
+            logger.warning(f"Batch vectorization failed, falling back to per-context: {e}")
+
         contexts_by_type = {}
         for context in contexts:
             context_type = context.extracted_data.context_type.value
@@ -418,7 +440,7 @@ class ChromaDBBackend(IVectorStorageBackend):
                 continue
 
             try:
-                with self._write_lock:
+                with self._collection_locks.write_lock(context_type):
                     collection.upsert(
                         ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings
                     )
@@ -427,12 +449,13 @@ class ChromaDBBackend(IVectorStorageBackend):
                     # Persist immediately to prevent data loss
                     if self._client and hasattr(self._client, "persist"):
                         self._client.persist()
+                self._emptiness.mark_non_empty(context_type)
 
             except Exception as e:
                 logger.error(f"Batch storing context to {context_type} collection failed: {e}")
 
                 # If write fails, record pending writes for later retry
-                with self._write_lock:
+                with self._pending_lock:
                     self._pending_writes.append(
                         {
                             "collection": collection,
@@ -458,7 +481,7 @@ class ChromaDBBackend(IVectorStorageBackend):
             return None
         # Search in all collections
         try:
-            with self._write_lock:
+            with self._collection_locks.read_lock(context_type):
                 result = self._collections[context_type].get(
                     ids=[id],
                     include=(
@@ -505,36 +528,9 @@ class ChromaDBBackend(IVectorStorageBackend):
             try:
                 where_clause = self._build_where_clause(filter)
 
-                # ChromaDB's get method does not directly support offset, so pagination needs to be implemented in other ways
-                with self._write_lock:
-                    results = collection.get(
-                        limit=limit + offset,  # Get more data to simulate offset
-                        where=where_clause,
-                        include=(
-                            ["metadatas", "documents", "embeddings"]
-                            if need_vector
-                            else ["metadatas", "documents"]
-                        ),
-                    )
-
-                contexts = []
-                if results and results["ids"]:
-                    # Manually apply offset
-                    start_idx = min(offset, len(results["ids"]))
-                    end_idx = min(start_idx + limit, len(results["ids"]))
-
-                    for i in range(start_idx, end_idx):
-                        doc = {
-                            "id": results["ids"][i],
-                            "document": results["documents"][i],
-                            "metadata": results["metadatas"][i],
-                        }
-                        if need_vector:
-                            doc["embedding"] = results["embeddings"][i]
-                        context = self._chroma_result_to_context(doc, need_vector)
-                        if context:
-                            contexts.append(context)
-
+                contexts, _ = self._get_contexts_slice(
+                    context_type, collection, limit, offset, where_clause, need_vector
+                )
                 if contexts:
                     result[context_type] = contexts
 
@@ -544,6 +540,77 @@ class ChromaDBBackend(IVectorStorageBackend):
 
         return result
 
+    def get_processed_contexts_page(
+        self,
+        context_type: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        need_vector: bool = False,
+    ) -> Tuple[List[ProcessedContext], Optional[str]]:
+        """Get one page of a collection in storage order
+
+        ChromaDB cannot order a scan by metadata, so the cursor carries the position in the
+        collection's storage order and the offset is applied by ChromaDB itself.
+        """
+        if not self._initialized or context_type not in self._collections:
+            return [], None
+
+        offset = int(cursor) if cursor else 0
+        try:
+            where_clause = self._build_where_clause(filter)
+            contexts, fetched = self._get_contexts_slice(
+                context_type,
+                self._collections[context_type],
+                limit,
+                offset,
+                where_clause,
+                need_vector,
+            )
+        except Exception as e:
+            logger.exception(f"Failed to get contexts page from {context_type} collection: {e}")
+            return [], None
+
+        next_cursor = str(offset + fetched) if fetched >= limit else None
+        return contexts, next_cursor
+
+    def _get_contexts_slice(
+        self,
+        context_type: str,
+        collection: chromadb.Collection,
+        limit: int,
+        offset: int,
+        where_clause: Optional[Dict[str, Any]],
+        need_vector: bool,
+    ) -> Tuple[List[ProcessedContext], int]:
+        """Read `limit` records starting at `offset`, returning the contexts and the raw row count"""
+        with self._collection_locks.read_lock(context_type):
+            results = collection.get(
+                limit=limit,
+                offset=offset,
+                where=where_clause,
+                include=(
+                    ["metadatas", "documents", "embeddings"]
+                    if need_vector
+                    else ["metadatas", "documents"]
+                ),
+            )
+
+        contexts = []
+        fetched = len(results["ids"]) if results and results["ids"] else 0
+        for i in range(fetched):
+            doc = {
+                "id": results["ids"][i],
+                "document": results["documents"][i],
+                "metadata": results["metadatas"][i],
+            }
+            if need_vector:
+                doc["embedding"] = results["embeddings"][i]
+            context = self._chroma_result_to_context(doc, need_vector)
+            if context:
+                contexts.append(context)
+        return contexts, fetched
+
     def delete_processed_context(self, id: str, context_type: str) -> bool:
         """Delete ProcessedContext by ID"""
         return self.delete_contexts([id], context_type)
@@ -569,7 +636,7 @@ class ChromaDBBackend(IVectorStorageBackend):
                 else:
                     logger.warning(f"Collection not found: {context_type}")
         else:
-            target_collections = self._collections
+            target_collections = {k: v for k, v in self._collections.items() if k != "todo"}
 
         # Ensure query is vectorized
         query_vector = None
@@ -583,70 +650,133 @@ class ChromaDBBackend(IVectorStorageBackend):
             logger.warning("Unable to get query vector, search failed")
             return []
 
-        all_results = []
+        where_clause = self._build_where_clause(filters)
+        if len(target_collections) == 1:
+            result_lists = [
+                self._search_collection(
+                    context_type, collection, query_vector, top_k, where_clause, need_vector
+                )
+                for context_type, collection in target_collections.items()
+            ]
+        else:
+            # Query collections concurrently so a cross-type search is bound by the slowest one
+            futures = [
+                self._search_executor.submit(
+                    self._search_collection,
+                    context_type,
+                    collection,
+                    query_vector,
+                    top_k,
+                    where_clause,
+                    need_vector,
+                )
+                for context_type, collection in target_collections.items()
+            ]
+            result_lists = [future.result() for future in futures]
 
-        for context_type, collection in target_collections.items():
-            try:
-                # Check if collection is empty
+        return merge_top_k(result_lists, top_k)
+
+    def search_by_types(
+        self,
+        query: Vectorize,
+        top_k_per_type: Dict[str, int],
+        filters: Optional[Dict[str, Any]] = None,
+        need_vector: bool = False,
+    ) -> Dict[str, List[Tuple[ProcessedContext, float]]]:
+        """Vector search with one query embedding and a result count per collection"""
+        if not self._initialized:
+            return {}
+
+        targets = {}
+        for context_type, top_k in top_k_per_type.items():
+            if context_type not in self._collections:
+                logger.warning(f"Collection not found: {context_type}")
+            elif top_k > 0:
+                targets[context_type] = (self._collections[context_type], top_k)
+        if not targets:
+            return {}
+
+        if not query.vector:
+            do_vectorize(query)
+        if not query.vector:
+            logger.warning("Unable to get query vector, search failed")
+            return {}
+
+        where_clause = self._build_where_clause(filters)
+        futures = {
+            context_type: self._search_executor.submit(
+                self._search_collection,
+                context_type,
+                collection,
+                query.vector,
+                top_k,
+                where_clause,
+                need_vector,
+            )
+            for context_type, (collection, top_k) in targets.items()
+        }
+        return {context_type: future.result() for context_type, future in futures.items()}
+
+    def _search_collection(
+        self,
+        context_type: str,
+        collection: chromadb.Collection,
+        query_vector: List[float],
+        top_k: int,
+        where_clause: Optional[Dict[str, Any]],
+        need_vector: bool,
+    ) -> List[Tuple[ProcessedContext, float]]:
+        """Vector search in a single collection"""
+        results_with_scores = []
+        try:
+            with self._collection_locks.read_lock(context_type):
+                # Skip empty collections without calling count() on every search
                 try:
-                    with self._write_lock:
-                        count = collection.count()
-                    if count == 0:
-                        continue
+                    if self._emptiness.is_empty(context_type, collection.count):
+                        return []
                 except Exception as count_error:
                     logger.debug(
                         f"Unable to get count for collection '{context_type}': {count_error}"
                     )
                     # If count fails, collection has issues, skip
-                    continue
+                    return []
 
-                where_clause = self._build_where_clause(filters)
-
-                with self._write_lock:
-                    results = collection.query(
-                        query_embeddings=[query_vector],
-                        n_results=top_k,
-                        where=where_clause,
-                        include=(
-                            ["metadatas", "documents", "distances", "embeddings"]
-                            if need_vector
-                            else ["metadatas", "documents", "distances"]
-                        ),
-                    )
+                results = collection.query(
+                    query_embeddings=[query_vector],
+                    n_results=top_k,
+                    where=where_clause,
+                    include=(
+                        ["metadatas", "documents", "distances", "embeddings"]
+                        if need_vector
+                        else ["metadatas", "documents", "distances"]
+                    ),
+                )
 
-                if results and results["ids"][0]:
-                    for i in range(len(results["ids"][0])):
-                        doc = {
-                            "id": results["ids"][0][i],
-                            "document": results["documents"][0][i],
-                            "metadata": results["metadatas"][0][i],
-                        }
-                        if need_vector:
-                            doc["embedding"] = results["embeddings"][0][i]
-                        context = self._chroma_result_to_context(doc, need_vector)
-                        if context:
-                            distance = results["distances"][0][i]
-                            score = 1 - distance  # Convert to similarity score
-                            all_results.append((context, score))
+            if results and results["ids"][0]:
+                for i in range(len(results["ids"][0])):
+                    doc = {
+                        "id": results["ids"][0][i],
+                        "document": results["documents"][0][i],
+                        "metadata": results["metadatas"][0][i],
+                    }
+                    if need_vector:
+                        doc["embedding"] = results["embeddings"][0][i]
+                    context = self._chroma_result_to_context(doc, need_vector)
+                    if context:
+                        distance = results["distances"][0][i]
+                        score = 1 - distance  # Convert to similarity score
+                        results_with_scores.append((context, score))
 
-            except Exception as e:
-                # Special handling for HNSW index errors
-                if (
-                    "hnsw segment reader" in str(e).lower()
-                    or "nothing found on disk" in str(e).lower()
-                ):
-                    logger.error(
-                        f"Collection '{context_type}' index not initialized (no data), skipping search: {e}"
-                    )
-                    continue
-                else:
-                    logger.exception(f"Vector search failed in {context_type} collection: {e}")
-                    continue
+        except Exception as e:
+            # Special handling for HNSW index errors
+            if "hnsw segment reader" in str(e).lower() or "nothing found on disk" in str(e).lower():
+                logger.error(
+                    f"Collection '{context_type}' index not initialized (no data), skipping search: {e}"
+                )
+            else:
+                logger.exception(f"Vector search failed in {context_type} collection: {e}")
 
-        # Sort by score and limit results
-        all_results.sort(key=lambda x: x[1], reverse=True)
-        # logger.info(f"Found {len(all_results)} results, returning top {top_k}")
-        return all_results[:top_k]
+        return results_with_scores
 
     def _chroma_result_to_context(
         self, doc: Dict[str, Any], need_vector: bool = True
@@ -780,8 +910,9 @@ class ChromaDBBackend(IVectorStorageBackend):
 
         collection = self._collections[context_type]
         try:
-            with self._write_lock:
+            with self._collection_locks.write_lock(context_type):
                 collection.delete(ids=ids)
+            self._emptiness.invalidate(context_type)
             return True
         except Exception as e:
             logger.exception(f"Failed to delete ChromaDB contexts: {e}")
@@ -798,7 +929,7 @@ class ChromaDBBackend(IVectorStorageBackend):
         try:
             collection = self._collections[context_type]
             # Use count method to get the number of documents in the collection
-            with self._write_lock:
+            with self._collection_locks.read_lock(context_type):
                 count = collection.count()
             return count
         except Exception as e:
@@ -844,7 +975,7 @@ class ChromaDBBackend(IVectorStorageBackend):
                 meta.update(metadata)
 
             # Store to vector database
-            with self._write_lock:
+            with self._collection_locks.write_lock("todo"):
                 collection.upsert(
                     ids=[f"todo_{todo_id}"],
                     embeddings=[embedding],
@@ -884,14 +1015,14 @@ class ChromaDBBackend(IVectorStorageBackend):
                 return []
 
             # Check if collection is empty
-            with self._write_lock:
+            with self._collection_locks.read_lock("todo"):
                 count = collection.count()
             if count == 0:
                 logger.debug("Todo collection is empty, no similar todos found")
                 return []
 
             # Query vector database
-            with self._write_lock:
+            with self._collection_locks.read_lock("todo"):
                 results = collection.query(
                     query_embeddings=[query_embedding],
                     n_results=min(top_k, count),
@@ -931,7 +1062,7 @@ class ChromaDBBackend(IVectorStorageBackend):
                 logger.error("Todo collection not found")
                 return False
 
-            with self._write_lock:
+            with self._collection_locks.write_lock("todo"):
                 collection.delete(ids=[f"todo_{todo_id}"])
             logger.debug(f"Deleted todo embedding: id={todo_id}")
             return True
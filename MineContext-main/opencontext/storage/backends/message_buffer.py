@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+In-memory buffer for streaming message content
+Accumulates token chunks per message so they can be written with one UPDATE per flush
+instead of one UPDATE and commit per chunk.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _PendingContent:
+    chunks: List[str] = field(default_factory=list)
+    size: int = 0
+    token_count: int = 0
+    first_chunk_at: float = field(default_factory=time.monotonic)
+
+
+class StreamingMessageBuffer:
+    """
+    Pending content of in-flight streaming messages.
+
+    `add` only touches memory and reports whether the message is due for a flush: on its
+    first chunk (so a missing message is noticed right away), once `max_chars` are
+    buffered, or once the oldest buffered chunk is `max_delay_ms` old. A background timer
+    hands messages that stopped receiving chunks to `on_due` after the same delay.
+
+    The buffer does no I/O itself. The owner writes what `take` returns, and must hold
+    its write lock across `take` and the write so flushes of one message stay in order.
+    """
+
+    def __init__(
+        self,
+        on_due: Callable[[List[int]], None],
+        max_chars: int = 2048,
+        max_delay_ms: float = 500,
+    ):
+        self._on_due = on_due
+        self.max_chars = max(1, int(max_chars))
+        self.max_delay = max(0.0, float(max_delay_ms)) / 1000
+        self._pending: Dict[int, _PendingContent] = {}
+        self._started: Set[int] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, message_id: int, content_chunk: str, token_count: int = 0) -> bool:
+        """Buffer a chunk, returning True when the message should be flushed now"""
+        with self._lock:
+            pending = self._pending.get(message_id)
+            if pending is None:
+                pending = self._pending[message_id] = _PendingContent()
+            pending.chunks.append(content_chunk)
+            pending.size += len(content_chunk)
+            pending.token_count += token_count
+
+            if message_id not in self._started:
+                self._started.add(message_id)
+                return True
+            due = (
+                pending.size >= self.max_chars
+                or time.monotonic() - pending.first_chunk_at >= self.max_delay
+            )
+        self._ensure_timer()
+        return due
+
+    def peek(self, message_id: int) -> Optional[Tuple[str, int]]:
+        """Buffered (content, token_count) of a message that has not been written yet"""
+        with self._lock:
+            pending = self._pending.get(message_id)
+            if pending is None:
+                return None
+            return "".join(pending.chunks), pending.token_count
+
+    def take(
+        self, message_ids: Optional[Iterable[int]] = None, finished: bool = False
+    ) -> List[Tuple[int, str, int]]:
+        """
+        Remove and return buffered (message_id, content, token_count) entries.
+
+        Args:
+            message_ids: Messages to take, all buffered messages when None
+            finished: The messages will receive no more chunks, forget about them
+        """
+        with self._lock:
+            ids = list(self._pending) if message_ids is None else list(message_ids)
+            entries = []
+            for message_id in ids:
+                pending = self._pending.pop(message_id, None)
+                if finished:
+                    self._started.discard(message_id)
+                if pending is not None:
+                    entries.append((message_id, "".join(pending.chunks), pending.token_count))
+            return entries
+
+    def due_message_ids(self) -> List[int]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                message_id
+                for message_id, pending in self._pending.items()
+                if now - pending.first_chunk_at >= self.max_delay
+            ]
+
+    def _ensure_timer(self):
+        if self._thread is not None or self._stop.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="message-buffer-flush", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        interval = max(self.max_delay, 0.05)
+        while not self._stop.wait(interval):
+            message_ids = self.due_message_ids()
+            if not message_ids:
+                continue
+            try:
+                self._on_due(message_ids)
+            except Exception as e:
+                logger.exception(f"Failed to flush buffered message content: {e}")
+
+    def close(self):
+        """Stop the background timer, buffered content is left for the owner to take"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
@@ -7,12 +7,13 @@
 import datetime
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
 from qdrant_client import QdrantClient, models
 
-from opencontext.llm.global_embedding_client import do_vectorize
+from opencontext.llm.global_embedding_client import do_vectorize, do_vectorize_batch
 from opencontext.models.context import (
     ContextProperties,
     ExtractedData,
@@ -21,6 +22,11 @@ from opencontext.models.context import (
 )
 from opencontext.models.enums import ContentFormat, ContextType
 from opencontext.storage.base_storage import IVectorStorageBackend, StorageType
+from opencontext.storage.search_utils import (
+    DEFAULT_SEARCH_WORKERS,
+    CollectionEmptinessCache,
+    merge_top_k,
+)
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -45,6 +51,8 @@ class QdrantBackend(IVectorStorageBackend):
         self._initialized = False
         self._config = None
         self._vector_size = None
+        self._search_executor: Optional[ThreadPoolExecutor] = None
+        self._emptiness = CollectionEmptinessCache()
 
     def initialize(self, config: Dict[str, Any]) -> bool:
         try:
@@ -53,9 +61,15 @@ class QdrantBackend(IVectorStorageBackend):
 
             self._vector_size = qdrant_config.get("vector_size", None)
             client_config = {
-                k: v for k, v in qdrant_config.items() if k != "vector_size"
+                k: v
+                for k, v in qdrant_config.items()
+                if k not in ("vector_size", "search_workers")
             }
             self._client = QdrantClient(**client_config)
+            self._search_executor = ThreadPoolExecutor(
+                max_workers=qdrant_config.get("search_workers", DEFAULT_SEARCH_WORKERS),
+                thread_name_prefix="qdrant-search",
+            )
 
             context_types = [ct.value for ct in ContextType]
 
@@ -187,6 +201,12 @@ class QdrantBackend(IVectorStorageBackend):
         if not self._check_connection():
             raise RuntimeError("Qdrant connection not available")
 
+        # Embed all missing vectors up front with batched requests
+        try:
+            do_vectorize_batch([c.vectorize for c in contexts if c.vectorize])
+        except Exception as e:
+            logger.warning(f"Batch vectorization failed, falling back to per-context: {e}")
+
         contexts_by_type = {}
         for context in contexts:
             context_type = context.extracted_data.context_type.value
@@ -235,6 +255,7 @@ class QdrantBackend(IVectorStorageBackend):
                     points=points,
                 )
                 stored_ids.extend(point_to_context_id.values())
+                self._emptiness.mark_non_empty(context_type)
 
             except Exception as e:
                 logger.error(
@@ -296,24 +317,28 @@ class QdrantBackend(IVectorStorageBackend):
             try:
                 filter_condition = self._build_filter_condition(filter)
 
-                fetch_limit = limit + offset
+                # Skip `offset` points by id only, then read the page from there
+                start_from = None
+                if offset > 0:
+                    _, start_from = self._client.scroll(
+                        collection_name=collection_name,
+                        scroll_filter=filter_condition,
+                        limit=offset,
+                        with_payload=False,
+                        with_vectors=False,
+                    )
+                    if start_from is None:
+                        continue
 
                 records, _ = self._client.scroll(
                     collection_name=collection_name,
                     scroll_filter=filter_condition,
-                    limit=fetch_limit,
+                    limit=limit,
+                    offset=start_from,
                     with_payload=True,
                     with_vectors=need_vector,
                 )
 
-                if offset > 0 and len(records) > offset:
-                    records = records[offset:]
-                elif offset > 0:
-                    records = []
-
-                if len(records) > limit:
-                    records = records[:limit]
-
                 contexts = []
                 for point in records:
                     context = self._qdrant_result_to_context(point, need_vector)
@@ -331,6 +356,40 @@ class QdrantBackend(IVectorStorageBackend):
 
         return result
 
+    def get_processed_contexts_page(
+        self,
+        context_type: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        need_vector: bool = False,
+    ) -> Tuple[List[ProcessedContext], Optional[str]]:
+        """Get one page ordered by point id, the cursor is the next point id"""
+        if not self._initialized or context_type not in self._collections:
+            return [], None
+
+        try:
+            records, next_offset = self._client.scroll(
+                collection_name=self._collections[context_type],
+                scroll_filter=self._build_filter_condition(filter),
+                limit=limit,
+                offset=cursor,
+                with_payload=True,
+                with_vectors=need_vector,
+            )
+        except Exception as e:
+            logger.exception(
+                f"Failed to get contexts page from {context_type} collection: {e}"
+            )
+            return [], None
+
+        contexts = []
+        for point in records:
+            context = self._qdrant_result_to_context(point, need_vector)
+            if context:
+                contexts.append(context)
+        return contexts, str(next_offset) if next_offset is not None else None
+
     def delete_processed_context(self, id: str, context_type: str) -> bool:
         return self.delete_contexts([id], context_type)
 
@@ -368,39 +427,114 @@ class QdrantBackend(IVectorStorageBackend):
             logger.warning("Unable to get query vector, search failed")
             return []
 
-        all_results = []
+        filter_condition = self._build_filter_condition(filters)
+        if len(target_collections) == 1:
+            result_lists = [
+                self._search_collection(
+                    context_type,
+                    collection_name,
+                    query_vector,
+                    top_k,
+                    filter_condition,
+                    need_vector,
+                )
+                for context_type, collection_name in target_collections.items()
+            ]
+        else:
+            # Query collections concurrently so a cross-type search is bound by the slowest one
+            futures = [
+                self._search_executor.submit(
+                    self._search_collection,
+                    context_type,
+                    collection_name,
+                    query_vector,
+                    top_k,
+                    filter_condition,
+                    need_vector,
+                )
+                for context_type, collection_name in target_collections.items()
+            ]
+            result_lists = [future.result() for future in futures]
 
-        for context_type, collection_name in target_collections.items():
-            try:
-                collection_info = self._client.get_collection(collection_name)
-                if collection_info.points_count == 0:
-                    continue
+        return merge_top_k(result_lists, top_k)
 
-                filter_condition = self._build_filter_condition(filters)
+    def search_by_types(
+        self,
+        query: Vectorize,
+        top_k_per_type: Dict[str, int],
+        filters: Optional[Dict[str, Any]] = None,
+        need_vector: bool = False,
+    ) -> Dict[str, List[Tuple[ProcessedContext, float]]]:
+        """Vector search with one query embedding and a result count per collection"""
+        if not self._initialized:
+            return {}
 
-                results = self._client.query_points(
-                    collection_name=collection_name,
-                    query=query_vector,
-                    query_filter=filter_condition,
-                    limit=top_k,
-                    with_payload=True,
-                    with_vectors=need_vector,
-                ).points
+        targets = {}
+        for context_type, top_k in top_k_per_type.items():
+            if context_type not in self._collections:
+                logger.warning(f"Collection not found: {context_type}")
+            elif top_k > 0:
+                targets[context_type] = (self._collections[context_type], top_k)
+        if not targets:
+            return {}
 
-                for scored_point in results:
-                    context = self._qdrant_result_to_context(scored_point, need_vector)
-                    if context:
-                        score = scored_point.score
-                        all_results.append((context, score))
+        if not query.vector:
+            do_vectorize(query)
+        if not query.vector:
+            logger.warning("Unable to get query vector, search failed")
+            return {}
 
-            except Exception as e:
-                logger.exception(
-                    f"Vector search failed in {context_type} collection: {e}"
-                )
-                continue
+        filter_condition = self._build_filter_condition(filters)
+        futures = {
+            context_type: self._search_executor.submit(
+                self._search_collection,
+                context_type,
+                collection_name,
+                query.vector,
+                top_k,
+                filter_condition,
+                need_vector,
+            )
+            for context_type, (collection_name, top_k) in targets.items()
+        }
+        return {context_type: future.result() for context_type, future in futures.items()}
+
+    def _search_collection(
+        self,
+        context_type: str,
+        collection_name: str,
+        query_vector: List[float],
+        top_k: int,
+        filter_condition: Optional[models.Filter],
+        need_vector: bool,
+    ) -> List[Tuple[ProcessedContext, float]]:
+        results_with_scores = []
+        try:
+            # Skip empty collections without fetching collection info on every search
+            if self._emptiness.is_empty(
+                context_type,
+                lambda: self._client.get_collection(collection_name).points_count,
+            ):
+                return []
+
+            results = self._client.query_points(
+                collection_name=collection_name,
+                query=query_vector,
+                query_filter=filter_condition,
+                limit=top_k,
+                with_payload=True,
+                with_vectors=need_vector,
+            ).points
+
+            for scored_point in results:
+                context = self._qdrant_result_to_context(scored_point, need_vector)
+                if context:
+                    results_with_scores.append((context, scored_point.score))
+
+        except Exception as e:
+            logger.exception(f"Vector search failed in {context_type} collection: {e}")
 
-        all_results.sort(key=lambda x: x[1], reverse=True)
-        return all_results[:top_k]
+        return results_with_scores
 
     def _qdrant_result_to_context(
         self, point: models.Record, need_vector: bool = True
@@ -551,6 +685,7 @@ class QdrantBackend(IVectorStorageBackend):
                 collection_name=collection_name,
                 points_selector=models.PointIdsList(points=uuid_ids),
             )
+            self._emptiness.invalidate(context_type)
             return True
         except Exception as e:
             logger.exception(f"Failed to delete Qdrant contexts: {e}")
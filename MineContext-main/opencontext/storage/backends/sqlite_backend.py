@@ -8,12 +8,15 @@
 SQLite document note storage backend implementation
 """
 
+import functools
 import json
 import os
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
+from opencontext.storage.backends.message_buffer import StreamingMessageBuffer
+from opencontext.storage.backends.sqlite_pool import SQLiteConnectionPool
 from opencontext.storage.base_storage import (
     DataType,
     DocumentData,
@@ -21,11 +24,38 @@ from opencontext.storage.base_storage import (
     QueryResult,
     StorageType,
 )
+from opencontext.storage.fulltext_index import TRIGRAM_MIN_TERM_LENGTH, build_match_expression
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
 
+def _read_scope(func):
+    """Run the method on a pooled reader connection"""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._pool is None:
+            return func(self, *args, **kwargs)
+        with self._pool.reader():
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _write_scope(func):
+    """Run the method on the single writer connection, serialized with other writes"""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._pool is None:
+            return func(self, *args, **kwargs)
+        with self._pool.writer():
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 class SQLiteBackend(IDocumentStorageBackend):
     """
     SQLite document note storage backend
@@ -34,9 +64,18 @@ class SQLiteBackend(IDocumentStorageBackend):
 
     def __init__(self):
         self.db_path: Optional[str] = None
-        self.connection: Optional[sqlite3.Connection] = None
+        self._pool: Optional[SQLiteConnectionPool] = None
+        self._message_buffer: Optional[StreamingMessageBuffer] = None
+        self._vault_fts_min_term_length = 1
         self._initialized = False
 
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """Connection bound to the calling thread by _read_scope/_write_scope"""
+        if self._pool is None:
+            return None
+        return self._pool.connection or self._pool.writer_connection
+
     def initialize(self, config: Dict[str, Any]) -> bool:
         """Initialize SQLite database"""
         try:
@@ -47,12 +86,25 @@ class SQLiteBackend(IDocumentStorageBackend):
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
-            self.connection = sqlite3.connect(
-                self.db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row  # Allow column name access
+            sqlite_config = config.get("config", {})
+            self._pool = SQLiteConnectionPool(
+                self.db_path,
+                reader_pool_size=sqlite_config.get("reader_pool_size", 8),
+                pragmas=sqlite_config.get("pragmas"),
+            )
 
             # Create table structure
-            self._create_tables()
+            with self._pool.writer():
+                self._create_tables()
+
+            # Streaming message chunks are buffered and written in batches, 0 disables
+            stream_flush_chars = sqlite_config.get("stream_flush_chars", 2048)
+            if stream_flush_chars > 0:
+                self._message_buffer = StreamingMessageBuffer(
+                    self._flush_message_content,
+                    max_chars=stream_flush_chars,
+                    max_delay_ms=sqlite_config.get("stream_flush_interval_ms", 500),
+                )
 
             self._initialized = True
             logger.info(
@@ -253,6 +305,74 @@ class SQLiteBackend(IDocumentStorageBackend):
         """
         )
 
+        # Positions of change log consumers
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS change_cursors (
+                consumer TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # Change log of the vaults table, appended by triggers so every write path is covered.
+        # Changes are only logged while a consumer has registered a cursor, pruning happens
+        # when cursors advance, so without consumers the log would grow without bound
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS vault_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                vault_id INTEGER NOT NULL,
+                operation TEXT NOT NULL,
+                changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+        # Recreated on every start so databases with older trigger definitions pick up the
+        # consumer condition
+        for trigger in (
+            "trg_vaults_insert_change",
+            "trg_vaults_update_change",
+            "trg_vaults_delete_change",
+        ):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        cursor.execute(
+            """
+            CREATE TRIGGER trg_vaults_insert_change AFTER INSERT ON vaults
+            WHEN EXISTS (SELECT 1 FROM change_cursors)
+            BEGIN
+                INSERT INTO vault_changes (vault_id, operation) VALUES (NEW.id, 'insert');
+            END
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER trg_vaults_update_change AFTER UPDATE ON vaults
+            WHEN EXISTS (SELECT 1 FROM change_cursors)
+            BEGIN
+                INSERT INTO vault_changes (vault_id, operation)
+                VALUES (
+                    NEW.id,
+                    CASE WHEN NEW.is_deleted AND NOT OLD.is_deleted THEN 'delete' ELSE 'update' END
+                );
+            END
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER trg_vaults_delete_change AFTER DELETE ON vaults
+            WHEN EXISTS (SELECT 1 FROM change_cursors)
+            BEGIN
+                INSERT INTO vault_changes (vault_id, operation) VALUES (OLD.id, 'delete');
+            END
+        """
+        )
+        # Drop changes logged before the consumer condition existed
+        cursor.execute("DELETE FROM vault_changes WHERE NOT EXISTS (SELECT 1 FROM change_cursors)")
+
+        self._create_vault_fulltext_index(cursor)
+
         # New table indexes
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_vaults_created ON vaults (created_at)")
@@ -342,6 +462,62 @@ class SQLiteBackend(IDocumentStorageBackend):
         # Add default Quick Start document (only on first initialization)
         self._insert_default_vault_document()
 
+    def _create_vault_fulltext_index(self, cursor):
+        """FTS5 index over vaults, kept in sync by triggers"""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'vaults_fts'")
+        row = cursor.fetchone()
+        created = row is None
+        if created:
+            columns = "title, summary, content, tags, content='vaults', content_rowid='id'"
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE vaults_fts USING fts5({columns}, tokenize='trigram')"
+                )
+            except sqlite3.OperationalError:
+                # SQLite before 3.34 has no trigram tokenizer
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE vaults_fts USING fts5({columns}, "
+                    "tokenize='unicode61 remove_diacritics 2')"
+                )
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'vaults_fts'")
+            row = cursor.fetchone()
+        if "trigram" in row[0]:
+            self._vault_fts_min_term_length = TRIGRAM_MIN_TERM_LENGTH
+
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_vaults_fts_insert AFTER INSERT ON vaults
+            BEGIN
+                INSERT INTO vaults_fts (rowid, title, summary, content, tags)
+                VALUES (NEW.id, NEW.title, NEW.summary, NEW.content, NEW.tags);
+            END
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_vaults_fts_update
+            AFTER UPDATE OF title, summary, content, tags ON vaults
+            BEGIN
+                INSERT INTO vaults_fts (vaults_fts, rowid, title, summary, content, tags)
+                VALUES ('delete', OLD.id, OLD.title, OLD.summary, OLD.content, OLD.tags);
+                INSERT INTO vaults_fts (rowid, title, summary, content, tags)
+                VALUES (NEW.id, NEW.title, NEW.summary, NEW.content, NEW.tags);
+            END
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_vaults_fts_delete AFTER DELETE ON vaults
+            BEGIN
+                INSERT INTO vaults_fts (vaults_fts, rowid, title, summary, content, tags)
+                VALUES ('delete', OLD.id, OLD.title, OLD.summary, OLD.content, OLD.tags);
+            END
+        """
+        )
+        if created:
+            # Index vaults written before the index existed
+            cursor.execute("INSERT INTO vaults_fts (vaults_fts) VALUES ('rebuild')")
+
     def _insert_default_vault_document(self):
         """Insert default Quick Start document"""
         cursor = self.connection.cursor()
@@ -407,6 +583,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             self.connection.rollback()
 
     # Report table operations
+    @_write_scope
     def insert_vaults(
         self,
         title: str,
@@ -450,6 +627,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to insert report: {e}")
             raise
 
+    @_read_scope
     def get_reports(
         self, limit: int = 100, offset: int = 0, is_deleted: bool = False
     ) -> List[Dict]:
@@ -478,6 +656,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get report list: {e}")
             return []
 
+    @_read_scope
     def get_vaults(
         self,
         limit: int = 100,
@@ -557,6 +736,54 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get vaults list: {e}")
             return []
 
+    @_read_scope
+    def search_vaults(
+        self,
+        query: str,
+        limit: int = 20,
+        document_type: str = None,
+        is_deleted: bool = False,
+    ) -> List[Dict]:
+        """
+        Full-text search over vault title, summary, content and tags
+
+        Returns:
+            List[Dict]: Vaults records with a BM25 "score", best match first
+        """
+        if not self._initialized:
+            return []
+
+        match = build_match_expression(query, self._vault_fts_min_term_length)
+        if match is None:
+            return []
+
+        cursor = self.connection.cursor()
+        try:
+            where_clauses = ["vaults_fts MATCH ?", "v.is_deleted = ?"]
+            params = [match, is_deleted]
+            if document_type:
+                where_clauses.append("v.document_type = ?")
+                params.append(document_type)
+            params.append(limit)
+            cursor.execute(
+                f"""
+                SELECT v.id, v.title, v.summary, v.content, v.tags, v.parent_id, v.is_folder,
+                       v.is_deleted, v.created_at, v.updated_at, v.document_type,
+                       -bm25(vaults_fts) AS score
+                FROM vaults_fts
+                JOIN vaults v ON v.id = vaults_fts.rowid
+                WHERE {" AND ".join(where_clauses)}
+                ORDER BY bm25(vaults_fts)
+                LIMIT ?
+            """,
+                params,
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.exception(f"Failed to search vaults: {e}")
+            return []
+
+    @_read_scope
     def get_vault(self, vault_id: int) -> Optional[Dict]:
         """Get vaults by ID"""
         if not self._initialized:
@@ -582,6 +809,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get vaults: {e}")
             return None
 
+    @_write_scope
     def update_vault(self, vault_id: int, **kwargs) -> bool:
         """Update report"""
         if not self._initialized:
@@ -623,7 +851,97 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to update report: {e}")
             return False
 
+    @_read_scope
+    def get_vault_changes(self, after_seq: int = 0, limit: int = 500) -> List[Dict]:
+        """
+        Get vault changes logged after a sequence number, oldest first
+
+        Each change carries the current row of its vault, whose columns are None when the
+        row no longer exists.
+        """
+        if not self._initialized:
+            return []
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT c.seq, c.vault_id, c.operation, v.title, v.summary, v.content, v.tags,
+                       v.parent_id, v.is_folder, v.is_deleted, v.created_at, v.updated_at,
+                       v.document_type
+                FROM vault_changes c
+                LEFT JOIN vaults v ON v.id = c.vault_id
+                WHERE c.seq > ?
+                ORDER BY c.seq
+                LIMIT ?
+            """,
+                (after_seq, limit),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.exception(f"Failed to get vault changes: {e}")
+            return []
+
+    @_read_scope
+    def get_latest_vault_change_seq(self) -> int:
+        """Sequence number of the most recent vault change, 0 when none was logged"""
+        if not self._initialized:
+            return 0
+
+        cursor = self.connection.cursor()
+        try:
+            # AUTOINCREMENT keeps its high-water mark here after read changes are pruned
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'vault_changes'")
+            row = cursor.fetchone()
+            return row[0] if row else 0
+        except Exception as e:
+            logger.exception(f"Failed to get latest vault change: {e}")
+            return 0
+
+    @_read_scope
+    def get_change_cursor(self, consumer: str) -> Optional[int]:
+        """Persisted change log position of a consumer, None if it never stored one"""
+        if not self._initialized:
+            return None
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SELECT seq FROM change_cursors WHERE consumer = ?", (consumer,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            logger.exception(f"Failed to get change cursor of {consumer}: {e}")
+            return None
+
+    @_write_scope
+    def set_change_cursor(self, consumer: str, seq: int) -> bool:
+        """Persist a consumer's change log position and drop changes every consumer has read"""
+        if not self._initialized:
+            return False
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO change_cursors (consumer, seq, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(consumer) DO UPDATE
+                SET seq = excluded.seq, updated_at = excluded.updated_at
+            """,
+                (consumer, seq),
+            )
+            cursor.execute(
+                "DELETE FROM vault_changes WHERE seq <= (SELECT MIN(seq) FROM change_cursors)"
+            )
+            self.connection.commit()
+            return True
+        except Exception as e:
+            self.connection.rollback()
+            logger.exception(f"Failed to set change cursor of {consumer}: {e}")
+            return False
+
     # Todo table operations
+    @_write_scope
     def insert_todo(
         self,
         content: str,
@@ -666,6 +984,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to insert todo item: {e}")
             raise
 
+    @_read_scope
     def get_todos(
         self,
         status: int = None,
@@ -709,6 +1028,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get todo item list: {e}")
             return []
 
+    @_write_scope
     def update_todo_status(self, todo_id: int, status: int, end_time: datetime = None) -> bool:
         """Update todo item status"""
         if not self._initialized:
@@ -736,6 +1056,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             return False
 
     # Activity table operations
+    @_write_scope
     def insert_activity(
         self,
         title: str,
@@ -787,6 +1108,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to insert activity record: {e}")
             raise
 
+    @_read_scope
     def get_activities(
         self,
         start_time: datetime = None,
@@ -832,6 +1154,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             return []
 
     # Tips table operations
+    @_write_scope
     def insert_tip(self, content: str) -> int:
         """Insert tip"""
         if not self._initialized:
@@ -856,6 +1179,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to insert tip: {e}")
             raise
 
+    @_read_scope
     def get_tips(
         self,
         start_time: datetime = None,
@@ -907,6 +1231,7 @@ class SQLiteBackend(IDocumentStorageBackend):
         return StorageType.DOCUMENT_DB
 
     # Monitoring data operations
+    @_write_scope
     def save_monitoring_token_usage(
         self, model: str, prompt_tokens: int, completion_tokens: int, total_tokens: int
     ) -> bool:
@@ -955,6 +1280,7 @@ class SQLiteBackend(IDocumentStorageBackend):
                 pass
             return False
 
+    @_write_scope
     def save_monitoring_stage_timing(
         self,
         stage_name: str,
@@ -1051,6 +1377,7 @@ class SQLiteBackend(IDocumentStorageBackend):
                 pass
             return False
 
+    @_write_scope
     def save_monitoring_data_stats(
         self,
         data_type: str,
@@ -1091,6 +1418,7 @@ class SQLiteBackend(IDocumentStorageBackend):
                 pass
             return False
 
+    @_read_scope
     def query_monitoring_token_usage(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Query token usage monitoring data"""
         if not self._initialized:
@@ -1124,6 +1452,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.error(f"Failed to query token usage: {e}")
             return []
 
+    @_read_scope
     def query_monitoring_stage_timing(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Query stage timing monitoring data"""
         if not self._initialized:
@@ -1163,6 +1492,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.error(f"Failed to query stage timing: {e}")
             return []
 
+    @_read_scope
     def query_monitoring_data_stats(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Query data statistics monitoring data"""
         if not self._initialized:
@@ -1194,6 +1524,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.error(f"Failed to query data stats: {e}")
             return []
 
+    @_read_scope
     def query_monitoring_data_stats_by_range(
         self, start_time: datetime, end_time: datetime
     ) -> List[Dict[str, Any]]:
@@ -1229,6 +1560,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.error(f"Failed to query data stats by range: {e}")
             return []
 
+    @_read_scope
     def query_monitoring_data_stats_trend(
         self, hours: int = 24, interval_hours: int = 1
     ) -> List[Dict[str, Any]]:
@@ -1278,6 +1610,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.error(f"Failed to query data stats trend: {e}")
             return []
 
+    @_write_scope
     def cleanup_old_monitoring_data(self, days: int = 7) -> bool:
         """Clean up monitoring data older than specified days"""
         if not self._initialized:
@@ -1318,6 +1651,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             return False
 
     # Conversation/Message operations
+    @_write_scope
     def create_conversation(
         self,
         page_name: str,
@@ -1353,6 +1687,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to create conversation: {e}")
             return None
 
+    @_read_scope
     def get_conversation(self, conversation_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a single conversation's details (4.1.2)
@@ -1379,6 +1714,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get conversation: {e}")
             return None
 
+    @_read_scope
     def get_conversation_list(
         self,
         limit: int = 20,
@@ -1444,6 +1780,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get conversation list: {e}")
             return {"items": [], "total": 0}
 
+    @_write_scope
     def update_conversation(
         self,
         conversation_id: int,
@@ -1509,6 +1846,7 @@ class SQLiteBackend(IDocumentStorageBackend):
     # Conversation/Message operations (Continued)
     # -----------------------------------------------------------------
 
+    @_read_scope
     def get_message(self, message_id: int, include_thinking: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get a single message by its ID, optionally including thinking records.
@@ -1533,7 +1871,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             )
             row = cursor.fetchone()
             if row:
-                message = dict(row)
+                message = self._with_buffered_content(dict(row))
 
                 # Include thinking records if requested
                 if include_thinking:
@@ -1545,6 +1883,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get message: {e}")
             return None
 
+    @_write_scope
     def create_message(
         self,
         conversation_id: int,
@@ -1624,6 +1963,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             metadata=metadata,
         )
 
+    @_write_scope
     def update_message(
         self,
         message_id: int,
@@ -1638,6 +1978,10 @@ class SQLiteBackend(IDocumentStorageBackend):
         if not self._initialized:
             return None
 
+        # Buffered chunks are superseded by the new content
+        if self._message_buffer:
+            self._message_buffer.take([message_id], finished=True)
+
         cursor = self.connection.cursor()
         try:
             now = datetime.now()
@@ -1693,10 +2037,52 @@ class SQLiteBackend(IDocumentStorageBackend):
     ) -> bool:
         """
         Append content to a streaming message (4.2.5)
+        Chunks are buffered in memory and written in batches, reads of the message already
+        include the buffered content.
         """
         if not self._initialized:
             return False
 
+        if self._message_buffer is None:
+            return self._write_message_content(message_id, content_chunk, token_count)
+        if self._message_buffer.add(message_id, content_chunk, token_count):
+            return self._flush_message_content([message_id])
+        return True
+
+    @_write_scope
+    def _flush_message_content(
+        self, message_ids: Optional[List[int]] = None, finished: bool = False
+    ) -> bool:
+        """Write buffered chunks of the given messages (all when None) to the database"""
+        if self._message_buffer is None:
+            return True
+
+        success = True
+        for message_id, content, token_count in self._message_buffer.take(message_ids, finished):
+            if not self._write_message_content(message_id, content, token_count):
+                # Do not keep buffering for a message that cannot be written
+                self._message_buffer.take([message_id], finished=True)
+                success = False
+        return success
+
+    def _with_buffered_content(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Add content of an in-flight message that is still in the buffer"""
+        # Called after the row is read: a flush in between may hide a chunk from this read,
+        # but content is never counted twice
+        buffered = self._message_buffer.peek(message["id"]) if self._message_buffer else None
+        if buffered:
+            content, token_count = buffered
+            message["content"] = (message.get("content") or "") + content
+            message["token_count"] = (message.get("token_count") or 0) + token_count
+            if message.get("status") == "pending":
+                message["status"] = "streaming"
+        return message
+
+    @_write_scope
+    def _write_message_content(
+        self, message_id: int, content_chunk: str, token_count: int = 0
+    ) -> bool:
+        """Append content to a message row and touch its conversation"""
         cursor = self.connection.cursor()
         try:
             now = datetime.now()
@@ -1736,6 +2122,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to append message content: {e}")
             return False
 
+    @_write_scope
     def update_message_metadata(
         self,
         message_id: int,
@@ -1769,6 +2156,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to update message metadata: {e}")
             return False
 
+    @_write_scope
     def mark_message_finished(
         self,
         message_id: int,
@@ -1784,6 +2172,9 @@ class SQLiteBackend(IDocumentStorageBackend):
         if status not in ["completed", "failed", "cancelled"]:
             status = "completed"  # Default to completed
 
+        # Write buffered chunks before the final status
+        self._flush_message_content([message_id], finished=True)
+
         cursor = self.connection.cursor()
         try:
             now = datetime.now()
@@ -1844,6 +2235,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             error_message="Message interrupted by user."
         )
 
+    @_read_scope
     def get_conversation_messages(self, conversation_id: int) -> List[Dict[str, Any]]:
         """
         Get all messages for a specific conversation, ordered by creation time (4.2.7)
@@ -1866,7 +2258,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             # Convert sqlite3.Row objects to standard dicts and add thinking records
             messages = []
             for row in rows:
-                message = dict(row)
+                message = self._with_buffered_content(dict(row))
                 # Add thinking records for this message
                 message['thinking'] = self.get_message_thinking(message['id'])
                 messages.append(message)
@@ -1875,6 +2267,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get conversation messages: {e}")
             return []
 
+    @_write_scope
     def delete_message(self, message_id: int) -> bool:
         """
         Delete a message from the database.
@@ -1889,6 +2282,9 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.warning("Storage not initialized")
             return False
 
+        if self._message_buffer:
+            self._message_buffer.take([message_id], finished=True)
+
         cursor = self.connection.cursor()
         try:
             cursor.execute(
@@ -1904,6 +2300,7 @@ class SQLiteBackend(IDocumentStorageBackend):
 
     # Message Thinking Management Methods
 
+    @_write_scope
     def add_message_thinking(
         self,
         message_id: int,
@@ -1960,6 +2357,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to add thinking to message {message_id}: {e}")
             return None
 
+    @_read_scope
     def get_message_thinking(self, message_id: int) -> List[Dict[str, Any]]:
         """
         Get all thinking records for a message, ordered by sequence.
@@ -1990,6 +2388,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to get thinking for message {message_id}: {e}")
             return []
 
+    @_write_scope
     def clear_message_thinking(self, message_id: int) -> bool:
         """
         Clear all thinking records for a message.
@@ -2016,6 +2415,7 @@ class SQLiteBackend(IDocumentStorageBackend):
             logger.exception(f"Failed to clear thinking for message {message_id}: {e}")
             return False
 
+    @_read_scope
     def query(
         self, query: str, limit: int = 10, filters: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
@@ -2128,8 +2528,13 @@ class SQLiteBackend(IDocumentStorageBackend):
 
     def close(self):
         """Close the database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        if self._message_buffer:
+            self._message_buffer.close()
+            if self._pool:
+                self._flush_message_content()
+            self._message_buffer = None
+        if self._pool:
+            self._pool.close()
+            self._pool = None
             self._initialized = False
             logger.info("SQLite database connection closed")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+SQLite connection management - WAL journal, a pool of reader connections and a single
+serialized writer connection
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,  # KiB, negative means size instead of pages
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+
+class SQLiteConnectionPool:
+    """
+    Connection manager for one SQLite database file.
+
+    Writes go through a single connection guarded by a re-entrant lock, so write
+    transactions are serialized in-process instead of fighting over SQLite's file lock.
+    Reads check out one of `reader_pool_size` connections; in WAL mode they run
+    concurrently with each other and with the writer. With a pool size of 0, reads
+    share the writer connection and lock.
+
+    The connection bound to the current thread is available as `connection` while
+    inside `reader()` or `writer()`. Scopes nest: a write scope opened inside a read
+    scope uses the writer and restores the reader afterwards.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        reader_pool_size: int = 4,
+        pragmas: Optional[Dict[str, Any]] = None,
+    ):
+        self.path = path
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._writer = self._connect()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._all_readers: List[sqlite3.Connection] = []
+        for _ in range(max(0, int(reader_pool_size))):
+            reader = self._connect(read_only=True)
+            self._all_readers.append(reader)
+            self._readers.put(reader)
+        logger.info(
+            f"SQLite connection pool opened for {path}: 1 writer, "
+            f"{len(self._all_readers)} readers, journal_mode={self.journal_mode}"
+        )
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Allow column name access
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @property
+    def journal_mode(self) -> str:
+        with self._write_lock:
+            return self._writer.execute("PRAGMA journal_mode").fetchone()[0]
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """Connection bound to the current thread, None outside reader()/writer()"""
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    @property
+    def writer_connection(self) -> sqlite3.Connection:
+        return self._writer
+
+    def _push(self, conn: sqlite3.Connection):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        self._local.stack.append(conn)
+
+    def _pop(self):
+        self._local.stack.pop()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Bind a connection for reading to the current thread"""
+        current = self.connection
+        if current is not None:
+            # Nested in another scope, keep using its connection
+            yield current
+            return
+        if not self._all_readers:
+            with self.writer() as conn:
+                yield conn
+            return
+
+        conn = self._readers.get()
+        self._push(conn)
+        try:
+            yield conn
+        finally:
+            self._pop()
+            self._readers.put(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Bind the writer connection to the current thread, serialized across threads"""
+        with self._write_lock:
+            outermost = self.connection is not self._writer
+            self._push(self._writer)
+            try:
+                yield self._writer
+            finally:
+                self._pop()
+                if outermost and self._writer.in_transaction:
+                    # A write path returned without commit or rollback, do not leak it
+                    logger.debug("Rolling back SQLite transaction left open by a write scope")
+                    self._writer.rollback()
+
+    def close(self):
+        with self._write_lock:
+            for reader in self._all_readers:
+                reader.close()
+            self._all_readers.clear()
+            self._writer.close()
@@ -13,9 +13,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from opencontext.models.context import ProcessedContext, Vectorize
+from opencontext.models.enums import ContextType
 
 
 class StorageType(Enum):
@@ -110,6 +111,52 @@ class IVectorStorageBackend(IStorageBackend):
     ) -> Dict[str, List[ProcessedContext]]:
         """Get processed contexts"""
 
+    @abstractmethod
+    def get_processed_contexts_page(
+        self,
+        context_type: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        need_vector: bool = False,
+    ) -> Tuple[List[ProcessedContext], Optional[str]]:
+        """Get one page of contexts of a type
+
+        Args:
+            context_type: Context type to read
+            limit: Maximum page size
+            cursor: Opaque cursor returned by the previous page, None for the first page
+            filter: Metadata filter
+            need_vector: Whether to include embeddings
+
+        Returns:
+            (contexts, cursor of the next page or None when exhausted)
+        """
+
+    def iter_processed_contexts(
+        self,
+        context_types: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        page_size: int = 500,
+        need_vector: bool = False,
+    ) -> Iterator[ProcessedContext]:
+        """Stream every matching context page by page, keeping one page in memory"""
+        if not context_types:
+            context_types = [ct.value for ct in ContextType]
+        for context_type in context_types:
+            cursor = None
+            while True:
+                contexts, cursor = self.get_processed_contexts_page(
+                    context_type,
+                    limit=page_size,
+                    cursor=cursor,
+                    filter=filter,
+                    need_vector=need_vector,
+                )
+                yield from contexts
+                if cursor is None:
+                    break
+
     @abstractmethod
     def get_processed_context(self, id: str, context_type: str) -> ProcessedContext:
         """Get specified context"""
@@ -128,6 +175,25 @@ class IVectorStorageBackend(IStorageBackend):
     ) -> List[Tuple[ProcessedContext, float]]:
         """Vector similarity search"""
 
+    def search_by_types(
+        self,
+        query: Vectorize,
+        top_k_per_type: Dict[str, int],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, List[Tuple[ProcessedContext, float]]]:
+        """
+        Vector similarity search with its own result count per context type
+
+        Backends override this to embed the query once and search collections concurrently.
+        """
+        return {
+            context_type: self.search(
+                query=query, top_k=top_k, context_types=[context_type], filters=filters
+            )
+            for context_type, top_k in top_k_per_type.items()
+            if top_k > 0
+        }
+
     @abstractmethod
     def upsert_todo_embedding(
         self,
@@ -227,11 +293,38 @@ class IDocumentStorageBackend(IStorageBackend):
         """Get vault by ID"""
         pass
 
+    @abstractmethod
+    def search_vaults(
+        self,
+        query: str,
+        limit: int = 20,
+        document_type: str = None,
+        is_deleted: bool = False,
+    ) -> List[Dict]:
+        """Full-text search over vaults, best match first"""
+        pass
+
     @abstractmethod
     def update_vault(self, vault_id: int, **kwargs) -> bool:
         """Update vault"""
         pass
 
+    @abstractmethod
+    def get_vault_changes(self, after_seq: int = 0, limit: int = 500) -> List[Dict]:
+        """Get vault changes logged after a sequence number, oldest first"""
+
+    @abstractmethod
+    def get_latest_vault_change_seq(self) -> int:
+        """Get the sequence number of the most recent vault change"""
+
+    @abstractmethod
+    def get_change_cursor(self, consumer: str) -> Optional[int]:
+        """Get the persisted change log position of a consumer"""
+
+    @abstractmethod
+    def set_change_cursor(self, consumer: str, seq: int) -> bool:
+        """Persist the change log position of a consumer"""
+
     @abstractmethod
     def insert_todo(
         self,
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Full-text index of processed contexts
+An SQLite FTS5 table kept alongside the vector database, so exact terms such as names,
+ticket ids and file names are found with an index lookup and BM25 ranking, and can be fused
+with vector search results.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from opencontext.models.context import ProcessedContext
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Words, identifiers such as "OPS-1234" or "report_v2.pdf", and runs of CJK characters
+_TERM_PATTERN = re.compile(r"\w[\w\-./:@#]*")
+
+# The trigram tokenizer matches substrings of any script, but only of at least 3 characters
+TRIGRAM_MIN_TERM_LENGTH = 3
+
+
+def context_search_text(context: ProcessedContext) -> str:
+    """Text of a context that keyword queries are matched against"""
+    parts = []
+    extracted = context.extracted_data
+    if extracted:
+        parts.extend([extracted.title or "", extracted.summary or ""])
+        parts.extend(extracted.keywords or [])
+        parts.extend(extracted.entities or [])
+    if context.vectorize and context.vectorize.text:
+        parts.append(context.vectorize.text)
+    seen = set()
+    unique_parts = []
+    for part in parts:
+        part = part.strip() if isinstance(part, str) else ""
+        if part and part not in seen:
+            seen.add(part)
+            unique_parts.append(part)
+    return "\n".join(unique_parts)
+
+
+def build_match_expression(query: str, min_term_length: int = 1) -> Optional[str]:
+    """FTS5 query matching any term of a free-text query, None if no term is usable"""
+    terms = []
+    for term in _TERM_PATTERN.findall(query or ""):
+        if len(term) >= min_term_length and term not in terms:
+            terms.append(term)
+    if not terms:
+        return None
+    return " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+class ContextFullTextIndex:
+    """
+    SQLite FTS5 index of context id -> (context type, searchable text).
+
+    Without a path, or when the database file cannot be opened, the index lives in memory
+    and is rebuilt from the vector database on start.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._min_term_length = 1
+        if path:
+            self._open(path)
+        if self._conn is None:
+            self._open(":memory:")
+
+    def _open(self, path: str):
+        try:
+            if path != ":memory:":
+                dir_name = os.path.dirname(path)
+                if dir_name:
+                    os.makedirs(dir_name, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS context_docs (
+                    rowid INTEGER PRIMARY KEY,
+                    id TEXT NOT NULL UNIQUE,
+                    context_type TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_context_docs_type ON context_docs (context_type)"
+            )
+            try:
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS context_fts "
+                    "USING fts5(text, tokenize='trigram')"
+                )
+            except sqlite3.OperationalError:
+                # SQLite before 3.34 has no trigram tokenizer
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS context_fts "
+                    "USING fts5(text, tokenize='unicode61 remove_diacritics 2')"
+                )
+            row = self._conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'context_fts'"
+            ).fetchone()
+            if row and "trigram" in row[0]:
+                self._min_term_length = TRIGRAM_MIN_TERM_LENGTH
+            self._conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to open full-text index at {path}, keeping it in memory: {e}")
+            self._conn = None
+
+    def upsert(self, contexts: Iterable[ProcessedContext]):
+        """Index contexts, replacing earlier versions with the same id"""
+        rows = [
+            (context.id, context.extracted_data.context_type.value, context_search_text(context))
+            for context in contexts
+            if context.extracted_data is not None
+        ]
+        if self._conn is None or not rows:
+            return
+        with self._lock:
+            try:
+                with self._conn:
+                    for context_id, context_type, text in rows:
+                        self._delete_locked(context_id)
+                        cursor = self._conn.execute(
+                            "INSERT INTO context_docs (id, context_type) VALUES (?, ?)",
+                            (context_id, context_type),
+                        )
+                        self._conn.execute(
+                            "INSERT INTO context_fts (rowid, text) VALUES (?, ?)",
+                            (cursor.lastrowid, text),
+                        )
+            except Exception as e:
+                logger.error(f"Failed to update full-text index: {e}")
+
+    def delete(self, ids: Iterable[str]):
+        ids = list(ids)
+        if self._conn is None or not ids:
+            return
+        with self._lock:
+            try:
+                with self._conn:
+                    for context_id in ids:
+                        self._delete_locked(context_id)
+            except Exception as e:
+                logger.error(f"Failed to delete from full-text index: {e}")
+
+    def _delete_locked(self, context_id: str):
+        row = self._conn.execute(
+            "SELECT rowid FROM context_docs WHERE id = ?", (context_id,)
+        ).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM context_fts WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM context_docs WHERE rowid = ?", (row[0],))
+
+    def search(
+        self, query: str, context_types: Optional[List[str]] = None, limit: int = 20
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Contexts matching any term of the query, best BM25 match first
+
+        Returns:
+            (context id, context type, score) tuples, higher scores are better matches
+        """
+        match = build_match_expression(query, self._min_term_length)
+        if self._conn is None or match is None:
+            return []
+        sql = (
+            "SELECT d.id, d.context_type, bm25(context_fts) AS rank "
+            "FROM context_fts JOIN context_docs d ON d.rowid = context_fts.rowid "
+            "WHERE context_fts MATCH ?"
+        )
+        params: list = [match]
+        if context_types:
+            sql += f" AND d.context_type IN ({','.join('?' * len(context_types))})"
+            params.extend(context_types)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            try:
+                return [
+                    (context_id, context_type, -rank)
+                    for context_id, context_type, rank in self._conn.execute(sql, params)
+                ]
+            except Exception as e:
+                logger.error(f"Full-text search failed: {e}")
+                return []
+
+    def count(self) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            try:
+                return self._conn.execute("SELECT COUNT(*) FROM context_docs").fetchone()[0]
+            except Exception as e:
+                logger.error(f"Failed to count full-text index entries: {e}")
+                return 0
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {"documents": self.count(), "min_term_length": self._min_term_length}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
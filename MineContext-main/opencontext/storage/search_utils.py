@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Helpers shared by vector backends for multi-collection searches
+"""
+
+import heapq
+import threading
+import time
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from opencontext.models.context import ProcessedContext
+
+DEFAULT_SEARCH_WORKERS = 8
+
+
+def merge_top_k(
+    result_lists: Iterable[List[Tuple[ProcessedContext, float]]], top_k: int
+) -> List[Tuple[ProcessedContext, float]]:
+    """Merge per-collection (context, score) lists into the overall top_k by score"""
+    return heapq.nlargest(top_k, chain.from_iterable(result_lists), key=lambda x: x[1])
+
+
+def merge_unique(
+    result_lists: Iterable[List[Tuple[ProcessedContext, float]]], top_k: Optional[int] = None
+) -> List[Tuple[ProcessedContext, float]]:
+    """
+    Merge (context, score) lists by score, keeping the best hit of each context.
+
+    Contexts are the same when they share an id, or a title and summary: processing can
+    store one piece of information under several context types.
+    """
+    merged = []
+    seen_ids = set()
+    seen_content = set()
+    for context, score in sorted(chain.from_iterable(result_lists), key=lambda x: -x[1]):
+        if context.id in seen_ids:
+            continue
+        extracted = context.extracted_data
+        content_key = (extracted.title, extracted.summary) if extracted else None
+        if content_key and any(content_key):
+            if content_key in seen_content:
+                continue
+            seen_content.add(content_key)
+        seen_ids.add(context.id)
+        merged.append((context, score))
+        if top_k is not None and len(merged) >= top_k:
+            break
+    return merged
+
+
+def reciprocal_rank_fusion(rankings: Iterable[List[str]], k: int = 60) -> Dict[str, float]:
+    """
+    Fuse rankings of ids by summing 1 / (k + rank) over the rankings each id appears in
+
+    Scores are normalized to [0, 1], 1 meaning ranked first by every ranking.
+    """
+    rankings = list(rankings)
+    if not rankings:
+        return {}
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    best = len(rankings) / (k + 1)
+    return {item_id: score / best for item_id, score in scores.items()}
+
+
+class CollectionEmptinessCache:
+    """
+    Remembers which collections are empty so searches can skip count() calls.
+
+    Writes through this backend mark a collection non-empty and deletes forget its state.
+    Entries also expire after `ttl_seconds` to pick up writes made by other processes
+    sharing the same database.
+    """
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self._state: Dict[str, Tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def is_empty(self, name: str, count_func: Callable[[], int]) -> bool:
+        with self._lock:
+            cached = self._state.get(name)
+        if cached and time.monotonic() - cached[1] < self.ttl_seconds:
+            return cached[0]
+        empty = count_func() == 0
+        with self._lock:
+            self._state[name] = (empty, time.monotonic())
+        return empty
+
+    def mark_non_empty(self, name: str):
+        with self._lock:
+            self._state[name] = (False, time.monotonic())
+
+    def invalidate(self, name: str):
+        with self._lock:
+            self._state.pop(name, None)
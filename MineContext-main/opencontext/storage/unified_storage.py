@@ -8,8 +8,9 @@
 Unified storage system - unified management supporting multiple storage backends
 """
 
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from opencontext.models.context import ProcessedContext, Vectorize
 from opencontext.models.enums import ContextType
@@ -22,7 +23,10 @@ from opencontext.storage.base_storage import (
     QueryResult,
     StorageType,
 )
+from opencontext.storage.fulltext_index import ContextFullTextIndex
+from opencontext.storage.search_utils import merge_unique, reciprocal_rank_fusion
 from opencontext.utils.logging_utils import get_logger
+from opencontext.utils.vector_math import cosine_similarity
 
 logger = get_logger(__name__)
 
@@ -87,6 +91,30 @@ class StorageBackendFactory:
         return SQLiteBackend()
 
 
+def _keyword_filterable(filters: Optional[Dict[str, Any]]) -> bool:
+    """Whether full-text hits can be checked against all of these filters"""
+    return all(
+        key in ("entities", "context_type") or (key.endswith("_ts") and isinstance(value, dict))
+        for key, value in (filters or {}).items()
+        if value
+    )
+
+
+def _matches_time_filters(context: ProcessedContext, filters: Optional[Dict[str, Any]]) -> bool:
+    for key, value in (filters or {}).items():
+        if not key.endswith("_ts") or not isinstance(value, dict) or not value:
+            continue
+        moment = getattr(context.properties, key[: -len("_ts")], None)
+        if moment is None:
+            return False
+        timestamp = moment.timestamp()
+        if "$gte" in value and timestamp < value["$gte"]:
+            return False
+        if "$lte" in value and timestamp > value["$lte"]:
+            return False
+    return True
+
+
 class UnifiedStorage:
     """
     Unified storage system - manages multiple storage backends, supports automatic routing based on data type and storage requirements
@@ -97,6 +125,10 @@ class UnifiedStorage:
         self._initialized = False
         self._vector_backend: IVectorStorageBackend = None
         self._document_backend: IDocumentStorageBackend = None
+        self._write_queue = None
+        self._fulltext_index: Optional[ContextFullTextIndex] = None
+        self._hybrid_search = False
+        self._rrf_k = 60
 
     def get_vector_collection_names(self) -> Optional[List[str]]:
         """Get all collection names in vector database"""
@@ -149,13 +181,86 @@ class UnifiedStorage:
                     logger.error(f"Storage backend {config['name']} initialization failed")
                     return False
 
+            self._configure_write_behind(storage_config.get("write_behind") or {})
             self._initialized = True
+            self._configure_fulltext(storage_config.get("fulltext") or {})
             return True
 
         except Exception as e:
             logger.exception(f"Unified storage system initialization failed: {e}")
             return False
 
+    def _configure_write_behind(self, config: Dict[str, Any]):
+        """Put a write-behind queue in front of the vector backend if enabled"""
+        if not config.get("enabled", False) or not self._vector_backend:
+            return
+        from opencontext.storage.write_behind import WriteBehindQueue
+
+        try:
+            self._write_queue = WriteBehindQueue(
+                self._vector_backend,
+                wal_path=config.get("wal_path", "./persist/write_behind/vector_wal.db"),
+                max_pending=config.get("max_pending", 10000),
+                batch_size=config.get("batch_size", 256),
+                flush_interval_ms=config.get("flush_interval_ms", 200),
+                max_block_seconds=config.get("max_block_seconds", 30),
+            )
+            logger.info("Vector write-behind queue enabled")
+        except Exception as e:
+            logger.exception(f"Failed to start write-behind queue, writing synchronously: {e}")
+            self._write_queue = None
+
+    def _configure_fulltext(self, config: Dict[str, Any]):
+        """Keep a full-text index next to the vector backend if enabled"""
+        if not config.get("enabled", False) or not self._vector_backend:
+            return
+        self._fulltext_index = ContextFullTextIndex(config.get("path"))
+        self._hybrid_search = config.get("hybrid_search", True)
+        self._rrf_k = config.get("rrf_k", 60)
+        if self._fulltext_index.count() == 0:
+            # A new or in-memory index starts empty, fill it from the vector database
+            threading.Thread(
+                target=self.rebuild_fulltext_index, name="fulltext-rebuild", daemon=True
+            ).start()
+        logger.info("Full-text index enabled")
+
+    def rebuild_fulltext_index(self, batch_size: int = 500) -> int:
+        """Index every stored context, returns the number of contexts indexed"""
+        if not self._fulltext_index:
+            return 0
+        indexed = 0
+        batch = []
+        try:
+            for context in self.iter_processed_contexts(page_size=batch_size):
+                batch.append(context)
+                if len(batch) >= batch_size:
+                    self._fulltext_index.upsert(batch)
+                    indexed += len(batch)
+                    batch = []
+            self._fulltext_index.upsert(batch)
+            indexed += len(batch)
+            logger.info(f"Full-text index rebuilt with {indexed} contexts")
+        except Exception as e:
+            logger.exception(f"Failed to rebuild full-text index: {e}")
+        return indexed
+
+    @property
+    def hybrid_search_enabled(self) -> bool:
+        """Whether retrieval should fuse full-text and vector results"""
+        return self._fulltext_index is not None and self._hybrid_search
+
+    def get_fulltext_statistics(self) -> Dict[str, int]:
+        return self._fulltext_index.get_statistics() if self._fulltext_index else {}
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued vector writes are committed, True if nothing is left pending"""
+        if not self._write_queue:
+            return True
+        return self._write_queue.flush(timeout)
+
+    def get_write_queue_statistics(self) -> Dict[str, int]:
+        return self._write_queue.get_statistics() if self._write_queue else {}
+
     def get_default_backend(self, storage_type: StorageType) -> Optional[IStorageBackend]:
         """Get default storage backend for specified type"""
         if storage_type == StorageType.VECTOR_DB:
@@ -177,8 +282,13 @@ class UnifiedStorage:
             return None
 
         try:
-            # Directly pass ProcessedContext to vector database
-            doc_ids = self._vector_backend.batch_upsert_processed_context(contexts)
+            if self._write_queue:
+                doc_ids = self._write_queue.enqueue_upserts(contexts)
+            else:
+                # Directly pass ProcessedContext to vector database
+                doc_ids = self._vector_backend.batch_upsert_processed_context(contexts)
+            if doc_ids and self._fulltext_index:
+                self._fulltext_index.upsert(contexts)
             return doc_ids
 
         except Exception as e:
@@ -196,8 +306,13 @@ class UnifiedStorage:
             return None
 
         try:
-            # Directly pass ProcessedContext to vector database
-            doc_id = self._vector_backend.upsert_processed_context(context)
+            if self._write_queue:
+                doc_id = self._write_queue.enqueue_upserts([context])[0]
+            else:
+                # Directly pass ProcessedContext to vector database
+                doc_id = self._vector_backend.upsert_processed_context(context)
+            if doc_id and self._fulltext_index:
+                self._fulltext_index.upsert([context])
             return doc_id
 
         except Exception as e:
@@ -208,8 +323,46 @@ class UnifiedStorage:
         return self._vector_backend.get_processed_context(id, context_type)
 
     def delete_processed_context(self, id: str, context_type: str):
+        if self._fulltext_index:
+            self._fulltext_index.delete([id])
+        if self._write_queue:
+            self._write_queue.enqueue_deletes({context_type: [id]})
+            return True
         return self._vector_backend.delete_processed_context(id, context_type)
 
+    def batch_delete_processed_contexts(self, ids_by_type: Dict[str, List[str]]) -> bool:
+        """Delete several contexts with one vector database call per context_type"""
+        if not self._initialized:
+            logger.error("Unified storage system not initialized")
+            return False
+
+        if not self._vector_backend:
+            logger.error("Vector database backend not initialized")
+            return False
+
+        if self._fulltext_index:
+            self._fulltext_index.delete(id for ids in ids_by_type.values() for id in ids)
+
+        if self._write_queue:
+            try:
+                self._write_queue.enqueue_deletes(ids_by_type)
+                return True
+            except Exception as e:
+                logger.exception(f"Failed to queue context deletions: {e}")
+                return False
+
+        success = True
+        for context_type, ids in ids_by_type.items():
+            if not ids:
+                continue
+            try:
+                if not self._vector_backend.delete_contexts(ids, context_type):
+                    success = False
+            except Exception as e:
+                logger.exception(f"Failed to delete {len(ids)} {context_type} contexts: {e}")
+                success = False
+        return success
+
     def get_all_processed_contexts(
         self,
         context_types: Optional[List[str]] = None,
@@ -241,6 +394,46 @@ class UnifiedStorage:
             logger.exception(f"Failed to query ProcessedContext: {e}")
             return {}
 
+    def get_processed_contexts_page(
+        self,
+        context_type: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        need_vector: bool = False,
+    ) -> Tuple[List[ProcessedContext], Optional[str]]:
+        """Get one page of contexts and the opaque cursor of the next page (None when done)"""
+        if not self._initialized or not self._vector_backend:
+            logger.error("Vector database backend not initialized")
+            return [], None
+
+        try:
+            return self._vector_backend.get_processed_contexts_page(
+                context_type, limit=limit, cursor=cursor, filter=filter, need_vector=need_vector
+            )
+        except Exception as e:
+            logger.exception(f"Failed to query ProcessedContext page: {e}")
+            return [], None
+
+    def iter_processed_contexts(
+        self,
+        context_types: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        page_size: int = 500,
+        need_vector: bool = False,
+    ) -> Iterator[ProcessedContext]:
+        """Stream all matching contexts with cursor pagination, one page in memory at a time"""
+        if not self._initialized or not self._vector_backend:
+            logger.error("Vector database backend not initialized")
+            return
+
+        yield from self._vector_backend.iter_processed_contexts(
+            context_types=context_types,
+            filter=filter,
+            page_size=page_size,
+            need_vector=need_vector,
+        )
+
     def get_processed_context_count(self, context_type: str) -> int:
         """Get record count for specified context_type"""
         if not self._initialized:
@@ -308,6 +501,130 @@ class UnifiedStorage:
             logger.exception(f"Vector search failed: {e}")
             return []
 
+    def keyword_search(
+        self,
+        query: str,
+        top_k: int = 10,
+        context_types: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[ProcessedContext, float]]:
+        """Full-text search, (context, BM25 score) tuples with the best match first"""
+        if not self._initialized or not self._fulltext_index:
+            return []
+        try:
+            hits = self._fulltext_index.search(query, context_types, limit=top_k * 2)
+            return self._load_keyword_hits(hits, filters, top_k)
+        except Exception as e:
+            logger.exception(f"Keyword search failed: {e}")
+            return []
+
+    def _load_keyword_hits(
+        self,
+        hits: List[Tuple[str, str, float]],
+        filters: Optional[Dict[str, Any]],
+        top_k: int,
+        known: Optional[Dict[str, ProcessedContext]] = None,
+        need_vector: bool = False,
+    ) -> List[Tuple[ProcessedContext, float]]:
+        """Contexts of full-text hits that still exist and pass the time range filters"""
+        results = []
+        for context_id, context_type, score in hits:
+            context = (known or {}).get(context_id)
+            if context is None:
+                context = self._vector_backend.get_processed_context(
+                    context_id, context_type, need_vector=need_vector
+                )
+            if context is None or not _matches_time_filters(context, filters):
+                continue
+            results.append((context, score))
+            if len(results) >= top_k:
+                break
+        return results
+
+    def hybrid_search(
+        self,
+        query: Vectorize,
+        top_k: int = 10,
+        context_types: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[ProcessedContext, float]]:
+        """
+        Vector search fused with full-text search by reciprocal rank fusion
+
+        Falls back to vector search when there is no full-text index, no query text, or
+        filters other than time ranges and entities that full-text hits cannot be checked
+        against. Results are ordered by fused rank, but scores stay vector similarities so
+        similarity thresholds keep working: keyword-only hits are scored against their stored
+        embedding, 0 when it is not available.
+        """
+        if not self.hybrid_search_enabled or not query.text or not _keyword_filterable(filters):
+            return self.search(query, top_k, context_types, filters)
+
+        candidates = max(top_k * 2, 20)
+        vector_results = self.search(query, candidates, context_types, filters)
+        try:
+            hits = self._fulltext_index.search(query.text, context_types, limit=candidates)
+            known = {context.id: context for context, _ in vector_results}
+            keyword_results = self._load_keyword_hits(
+                hits, filters, candidates, known, need_vector=True
+            )
+        except Exception as e:
+            logger.exception(f"Keyword part of hybrid search failed: {e}")
+            return vector_results[:top_k]
+
+        contexts = {context.id: context for context, _ in vector_results + keyword_results}
+        similarities = {context.id: score for context, score in vector_results}
+        for context, _ in keyword_results:
+            if context.id not in similarities:
+                vector = context.vectorize.vector if context.vectorize else None
+                similarities[context.id] = cosine_similarity(query.vector, vector)
+        fused = reciprocal_rank_fusion(
+            [
+                [context.id for context, _ in vector_results],
+                [context.id for context, _ in keyword_results],
+            ],
+            k=self._rrf_k,
+        )
+        ranked = sorted(fused, key=lambda context_id: -fused[context_id])[:top_k]
+        return [(contexts[context_id], similarities[context_id]) for context_id in ranked]
+
+    def search_multi_type(
+        self,
+        query: Vectorize,
+        top_k_per_type: Dict[str, int],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> List[Tuple[ProcessedContext, float]]:
+        """
+        Vector search across several context types with a single query embedding
+
+        Args:
+            query: Query to search for, embedded once if it has no vector yet
+            top_k_per_type: Maximum results per context type
+            filters: Filters applied to every context type
+            top_k: Maximum results overall, all per-type results by default
+
+        Returns:
+            (context, score) tuples ranked by score, each context only once
+        """
+        if not self._initialized:
+            logger.error("Unified storage system not initialized")
+            return []
+
+        if not self._vector_backend:
+            logger.error("Vector database backend not initialized")
+            return []
+
+        try:
+            results_by_type = self._vector_backend.search_by_types(
+                query=query, top_k_per_type=top_k_per_type, filters=filters
+            )
+            return merge_unique(results_by_type.values(), top_k)
+
+        except Exception as e:
+            logger.exception(f"Multi-type vector search failed: {e}")
+            return []
+
     def upsert_todo_embedding(
         self,
         todo_id: int,
@@ -575,6 +892,61 @@ class UnifiedStorage:
             return None
         return self._document_backend.get_vault(vault_id)
 
+    def search_vaults(
+        self,
+        query: str,
+        limit: int = 20,
+        document_type: str = None,
+        is_deleted: bool = False,
+    ) -> List[Dict]:
+        """Full-text search over vaults, best match first"""
+        if not self._initialized:
+            return []
+
+        if not self._document_backend:
+            return []
+        return self._document_backend.search_vaults(
+            query, limit=limit, document_type=document_type, is_deleted=is_deleted
+        )
+
+    def get_vault_changes(self, after_seq: int = 0, limit: int = 500) -> List[Dict]:
+        """Get vault changes logged after a sequence number, oldest first"""
+        if not self._initialized:
+            logger.error("Unified storage system not initialized")
+            return []
+
+        if not self._document_backend:
+            return []
+        return self._document_backend.get_vault_changes(after_seq, limit)
+
+    def get_latest_vault_change_seq(self) -> int:
+        """Get the sequence number of the most recent vault change"""
+        if not self._initialized:
+            return 0
+
+        if not self._document_backend:
+            return 0
+        return self._document_backend.get_latest_vault_change_seq()
+
+    def get_change_cursor(self, consumer: str) -> Optional[int]:
+        """Get the persisted change log position of a consumer"""
+        if not self._initialized:
+            return None
+
+        if not self._document_backend:
+            return None
+        return self._document_backend.get_change_cursor(consumer)
+
+    def set_change_cursor(self, consumer: str, seq: int) -> bool:
+        """Persist the change log position of a consumer"""
+        if not self._initialized:
+            logger.error("Unified storage system not initialized")
+            return False
+
+        if not self._document_backend:
+            return False
+        return self._document_backend.set_change_cursor(consumer, seq)
+
     def insert_todo(
         self,
         content: str,
@@ -0,0 +1,443 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Write-behind queue for vector storage
+Buffers upserts and deletes, coalesces them per collection and commits them from a background
+thread. Every operation is recorded in an on-disk write-ahead log first, so pending writes
+survive crashes and are replayed on the next start. Operations the backend keeps rejecting are
+moved to a dead-letter table instead of holding up the writes behind them.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from opencontext.models.context import ProcessedContext
+from opencontext.monitoring import record_write_queue
+from opencontext.storage.base_storage import IVectorStorageBackend
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+
+
+@dataclass
+class _PendingOp:
+    seq: int
+    op: str
+    context_type: str
+    payload: Union[ProcessedContext, List[str]]
+    attempts: int = 0
+
+    def keys(self) -> List[Tuple[str, str]]:
+        if self.op == OP_UPSERT:
+            return [(self.context_type, self.payload.id)]
+        return [(self.context_type, context_id) for context_id in self.payload]
+
+
+class WriteBehindQueue:
+    """
+    Bounded write-behind queue in front of a vector backend.
+
+    Producers only pay for a local SQLite insert into the write-ahead log. A background
+    flusher drains up to `batch_size` operations at a time, keeps the last write per
+    (context_type, id), and commits them with one delete and one batch upsert call per
+    collection. Each operation's log entry is removed once its writes are committed; an
+    operation rejected `max_retries` times is moved to the dead-letter table while the rest of
+    its batch goes through. Failures in a batch where nothing was committed point at the
+    backend rather than the operations, and are retried with backoff without counting against
+    them. When more than `max_pending` operations are waiting, producers block for up to
+    `max_block_seconds`.
+    """
+
+    def __init__(
+        self,
+        backend: IVectorStorageBackend,
+        wal_path: str,
+        max_pending: int = 10000,
+        batch_size: int = 256,
+        flush_interval_ms: float = 200,
+        max_block_seconds: float = 30,
+        max_retries: int = 5,
+    ):
+        self._backend = backend
+        self.max_pending = max(1, int(max_pending))
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.0, float(flush_interval_ms)) / 1000
+        self.max_block_seconds = max(0.0, float(max_block_seconds))
+        self.max_retries = max(1, int(max_retries))
+
+        self._queue: Deque[_PendingOp] = deque()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._wal_lock = threading.Lock()
+        self._stopping = False
+        self._flush_requested = False
+        self._backing_off = False
+        self._stats = {
+            "enqueued": 0,
+            "flushed": 0,
+            "flushed_batches": 0,
+            "failed_batches": 0,
+            "failed_ops": 0,
+            "dead_lettered": 0,
+            "backpressure_waits": 0,
+            "backpressure_wait_ms": 0,
+            "last_flush_ms": 0,
+        }
+
+        self._wal = self._open_wal(wal_path)
+        self._replay_wal()
+
+        self._thread = threading.Thread(target=self._run, name="vector-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _open_wal(self, path: str) -> sqlite3.Connection:
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pending_writes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                op TEXT NOT NULL,
+                context_type TEXT NOT NULL,
+                payload TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dead_letter_writes (
+                seq INTEGER PRIMARY KEY,
+                op TEXT NOT NULL,
+                context_type TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                failed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        return conn
+
+    def _replay_wal(self):
+        """Load operations left over from a previous run"""
+        rows = self._wal.execute(
+            "SELECT seq, op, context_type, payload FROM pending_writes ORDER BY seq"
+        ).fetchall()
+        for seq, op, context_type, payload in rows:
+            try:
+                if op == OP_UPSERT:
+                    data = ProcessedContext.model_validate_json(payload)
+                else:
+                    data = json.loads(payload)
+                self._queue.append(_PendingOp(seq, op, context_type, data))
+            except Exception as e:
+                logger.error(f"Dropping unreadable write-ahead log entry {seq}: {e}")
+                with self._wal_lock:
+                    self._wal.execute("DELETE FROM pending_writes WHERE seq = ?", (seq,))
+                    self._wal.commit()
+        if rows:
+            logger.info(f"Replaying {len(self._queue)} pending vector writes from write-ahead log")
+
+    def enqueue_upserts(self, contexts: List[ProcessedContext]) -> List[str]:
+        """Queue contexts for upsert, returning their ids"""
+        entries = [
+            (OP_UPSERT, c.extracted_data.context_type.value, c.model_dump_json(), c)
+            for c in contexts
+        ]
+        self._enqueue(entries)
+        return [c.id for c in contexts]
+
+    def enqueue_deletes(self, ids_by_type: Dict[str, List[str]]):
+        """Queue context deletions grouped by context_type"""
+        entries = [
+            (OP_DELETE, context_type, json.dumps(ids), list(ids))
+            for context_type, ids in ids_by_type.items()
+            if ids
+        ]
+        self._enqueue(entries)
+
+    def _enqueue(self, entries: List[Tuple[str, str, str, Any]]):
+        if not entries:
+            return
+        self._wait_for_capacity(len(entries))
+
+        with self._wal_lock:
+            seqs = []
+            for op, context_type, payload, _ in entries:
+                cursor = self._wal.execute(
+                    "INSERT INTO pending_writes (op, context_type, payload) VALUES (?, ?, ?)",
+                    (op, context_type, payload),
+                )
+                seqs.append(cursor.lastrowid)
+            self._wal.commit()
+
+        with self._cond:
+            for seq, (op, context_type, _, data) in zip(seqs, entries):
+                self._queue.append(_PendingOp(seq, op, context_type, data))
+            self._stats["enqueued"] += len(entries)
+            self._cond.notify_all()
+
+    def _wait_for_capacity(self, count: int):
+        """Block the producer while the queue is full (backpressure)"""
+        with self._cond:
+            if self._depth() + count <= self.max_pending or self._stopping:
+                return
+            started = time.time()
+            self._stats["backpressure_waits"] += 1
+            deadline = started + self.max_block_seconds
+            while self._depth() + count > self.max_pending and self._depth() > 0:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    logger.warning(
+                        f"Vector write queue still full after {self.max_block_seconds}s, "
+                        f"admitting {count} operations over the limit"
+                    )
+                    break
+                self._cond.wait(remaining)
+            self._stats["backpressure_wait_ms"] += int((time.time() - started) * 1000)
+        self._report()
+
+    def _depth(self) -> int:
+        return len(self._queue) + self._in_flight
+
+    def _run(self):
+        backoff = 0
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if not self._queue and self._stopping:
+                    return
+                # Give producers a short window to fill the batch
+                if (
+                    len(self._queue) < self.batch_size
+                    and not self._stopping
+                    and not self._flush_requested
+                ):
+                    self._cond.wait(self.flush_interval)
+                count = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = len(batch)
+            if not batch:
+                continue
+
+            started = time.time()
+            failed = self._commit(batch)
+            elapsed_ms = int((time.time() - started) * 1000)
+
+            failed_seqs = {op.seq for op in failed}
+            committed = [op for op in batch if op.seq not in failed_seqs]
+            self._remove_from_wal(committed)
+
+            # Nothing went through: the backend itself is failing rather than these writes,
+            # back off without counting the attempt against them
+            backoff = backoff + 1 if failed and not committed else 0
+            dead = []
+            retry = []
+            for op in failed:
+                if not backoff:
+                    op.attempts += 1
+                (dead if op.attempts >= self.max_retries else retry).append(op)
+            if dead:
+                logger.error(
+                    f"Moving {len(dead)} vector writes to the dead-letter table after "
+                    f"{self.max_retries} attempts"
+                )
+                self._dead_letter(dead)
+
+            with self._cond:
+                # Retried operations go first, so later writes to the same ids still win
+                self._queue.extendleft(reversed(retry))
+                self._in_flight = 0
+                self._stats["flushed"] += len(committed)
+                self._stats["failed_ops"] += len(failed)
+                self._stats["dead_lettered"] += len(dead)
+                if committed:
+                    self._stats["flushed_batches"] += 1
+                if failed:
+                    self._stats["failed_batches"] += 1
+                self._stats["last_flush_ms"] = elapsed_ms
+                if not self._queue:
+                    self._flush_requested = False
+                self._backing_off = bool(backoff)
+                self._cond.notify_all()
+                if backoff:
+                    if self._stopping:
+                        # Leave the rest in the write-ahead log for the next start
+                        return
+                    self._cond.wait(min(30.0, 0.5 * 2**backoff))
+                    self._backing_off = False
+            self._report()
+
+    def _commit(self, batch: List[_PendingOp]) -> List[_PendingOp]:
+        """
+        Coalesce a batch to the last write per id and apply it to the backend
+
+        Returns:
+            The operations with at least one write that was not committed
+        """
+        final: Dict[Tuple[str, str], Optional[ProcessedContext]] = {}
+        for op in batch:
+            if op.op == OP_UPSERT:
+                final[(op.context_type, op.payload.id)] = op.payload
+            else:
+                for context_id in op.payload:
+                    final[(op.context_type, context_id)] = None
+
+        deletes: Dict[str, List[str]] = {}
+        upserts: List[ProcessedContext] = []
+        for (context_type, context_id), context in final.items():
+            if context is None:
+                deletes.setdefault(context_type, []).append(context_id)
+            else:
+                upserts.append(context)
+
+        failed_keys = set()
+        for context_type, ids in deletes.items():
+            try:
+                deleted = self._backend.delete_contexts(ids, context_type)
+            except Exception as e:
+                logger.exception(f"Failed to delete {len(ids)} {context_type} contexts: {e}")
+                deleted = False
+            if not deleted:
+                logger.warning(f"Failed to delete {len(ids)} {context_type} contexts")
+                failed_keys.update((context_type, context_id) for context_id in ids)
+
+        if upserts:
+            try:
+                stored = set(self._backend.batch_upsert_processed_context(upserts) or [])
+            except Exception as e:
+                # Find the contexts the batch failed on by storing them one by one
+                logger.warning(f"Batch upsert of {len(upserts)} contexts failed: {e}")
+                stored = set()
+                for context in upserts:
+                    try:
+                        stored.update(self._backend.batch_upsert_processed_context([context]) or [])
+                    except Exception as e:
+                        logger.error(f"Failed to upsert context {context.id}: {e}")
+            if len(stored) < len(upserts):
+                logger.warning(f"Stored {len(stored)} of {len(upserts)} contexts")
+            failed_keys.update(
+                (context.extracted_data.context_type.value, context.id)
+                for context in upserts
+                if context.id not in stored
+            )
+
+        if not failed_keys:
+            return []
+        return [op for op in batch if any(key in failed_keys for key in op.keys())]
+
+    def _remove_from_wal(self, ops: List[_PendingOp]):
+        if not ops:
+            return
+        try:
+            with self._wal_lock:
+                self._wal.executemany(
+                    "DELETE FROM pending_writes WHERE seq = ?", [(op.seq,) for op in ops]
+                )
+                self._wal.commit()
+        except Exception as e:
+            # Entries left behind are replayed next start, upserts and deletes are idempotent
+            logger.error(f"Failed to trim write-ahead log: {e}")
+
+    def _dead_letter(self, ops: List[_PendingOp]):
+        """Move operations out of the write-ahead log so they are not replayed on start"""
+        try:
+            with self._wal_lock:
+                with self._wal:
+                    self._wal.executemany(
+                        "INSERT OR REPLACE INTO dead_letter_writes "
+                        "SELECT seq, op, context_type, payload, ?, ? "
+                        "FROM pending_writes WHERE seq = ?",
+                        [(op.attempts, time.time(), op.seq) for op in ops],
+                    )
+                    self._wal.executemany(
+                        "DELETE FROM pending_writes WHERE seq = ?", [(op.seq,) for op in ops]
+                    )
+        except Exception as e:
+            logger.error(f"Failed to move vector writes to the dead-letter table: {e}")
+
+    def requeue_dead_letters(self) -> int:
+        """Queue the dead-lettered operations again, e.g. after fixing their cause"""
+        with self._wal_lock:
+            rows = self._wal.execute(
+                "SELECT op, context_type, payload FROM dead_letter_writes ORDER BY seq"
+            ).fetchall()
+            self._wal.execute("DELETE FROM dead_letter_writes")
+            self._wal.commit()
+        entries = []
+        for op, context_type, payload in rows:
+            try:
+                if op == OP_UPSERT:
+                    data = ProcessedContext.model_validate_json(payload)
+                else:
+                    data = json.loads(payload)
+                entries.append((op, context_type, payload, data))
+            except Exception as e:
+                logger.error(f"Dropping unreadable dead-letter entry: {e}")
+        self._enqueue(entries)
+        return len(entries)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued operation has been committed, False if the backend is failing"""
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._depth() > 0:
+                if self._backing_off:
+                    return False
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 30):
+        """Drain the queue and stop the flusher thread"""
+        if self._stopping:
+            return
+        self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            with self._wal_lock:
+                self._wal.close()
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._cond:
+            stats = dict(self._stats)
+            stats["depth"] = self._depth()
+        stats["max_pending"] = self.max_pending
+        try:
+            with self._wal_lock:
+                stats["dead_letters"] = self._wal.execute(
+                    "SELECT COUNT(*) FROM dead_letter_writes"
+                ).fetchone()[0]
+        except Exception:
+            stats["dead_letters"] = 0
+        return stats
+
+    def _report(self):
+        record_write_queue(self.get_statistics())
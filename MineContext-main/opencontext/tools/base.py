@@ -17,7 +17,12 @@ logger = get_logger(__name__)
 
 
 class BaseTool(ABC):
-    """Base class for entity tools"""
+    """
+    Base class for entity tools
+
+    ToolsExecutor runs `execute` on a worker thread. A tool that can do its work without
+    blocking may also define a coroutine `execute_async(**kwargs)`, which is awaited instead.
+    """
 
     @classmethod
     def get_name(cls) -> str:
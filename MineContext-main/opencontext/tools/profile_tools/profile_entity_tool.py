@@ -12,10 +12,11 @@ Unified entity management tool, integrating storage, search, matching and LLM in
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
-from opencontext.models.context import ProcessedContext, ProfileContextMetadata, Vectorize
+from opencontext.models.context import ProcessedContext, ProfileContextMetadata
 from opencontext.models.enums import ContextType
 from opencontext.storage.global_storage import get_storage
 from opencontext.tools.base import BaseTool
+from opencontext.tools.query_cache import search_contexts
 from opencontext.utils.json_parser import parse_json_from_response
 from opencontext.utils.logging_utils import get_logger
 
@@ -328,8 +329,9 @@ class ProfileEntityTool(BaseTool):
         filter = {}
         if entity_type:
             filter["entity_type"] = entity_type
-        results = self.storage.search(
-            query=Vectorize(text=" ".join(entity_names)),
+        results = search_contexts(
+            self.storage,
+            " ".join(entity_names),
             top_k=top_k,
             context_types=[ContextType.ENTITY_CONTEXT.value],
             filters=filter,
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Query cache scoped to one agent workflow turn
+Retrieval tools of a turn often search with the same query text, context type and filters,
+within a round of concurrent tool calls and again when the workflow retries. While a cache is
+active, query embeddings and search results are computed once and served from memory.
+"""
+
+import json
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from opencontext.llm.global_embedding_client import do_vectorize
+from opencontext.models.context import ProcessedContext, Vectorize
+
+
+class QueryCache:
+    """
+    Query embeddings and retrieval results of one workflow turn.
+
+    Concurrent lookups of the same key wait for the first one instead of computing it again.
+    Empty results are not kept, as storage also returns them on errors.
+    """
+
+    def __init__(self):
+        self._vectors: Dict[str, Future] = {}
+        self._results: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "embedding_hits": 0,
+            "embedding_misses": 0,
+            "result_hits": 0,
+            "result_misses": 0,
+        }
+
+    def _get_or_compute(
+        self, table: Dict[Hashable, Future], key: Hashable, compute: Callable[[], Any], stat: str
+    ) -> Any:
+        with self._lock:
+            future = table.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                table[key] = future
+            self._stats[f"{stat}_misses" if owner else f"{stat}_hits"] += 1
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                table.pop(key, None)
+            future.set_exception(e)
+            raise
+        if not value:
+            with self._lock:
+                table.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def vectorize(self, text: str) -> Vectorize:
+        """Query Vectorize with its embedding filled in"""
+
+        def embed() -> Optional[List[float]]:
+            vectorize = Vectorize(text=text)
+            do_vectorize(vectorize)
+            return vectorize.vector
+
+        vector = self._get_or_compute(self._vectors, text, embed, "embedding")
+        return Vectorize(text=text, vector=list(vector) if vector else None)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Result cached under key, computed on the first lookup"""
+        return self._get_or_compute(self._results, key, compute, "result")
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_current_cache: ContextVar[Optional[QueryCache]] = ContextVar("query_cache", default=None)
+
+
+def get_query_cache() -> Optional[QueryCache]:
+    """Cache of the running workflow turn, None outside of one"""
+    return _current_cache.get()
+
+
+@contextmanager
+def use_query_cache(cache: QueryCache):
+    """Serve retrieval in this context, and tool threads started from it, from cache"""
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def _result_key(
+    kind: str,
+    query: Optional[str],
+    context_types: Optional[List[str]],
+    filters: Optional[Dict[str, Any]],
+    top_k: Optional[int],
+) -> Tuple:
+    return (
+        kind,
+        query,
+        tuple(sorted(context_types or [])),
+        json.dumps(filters or {}, sort_keys=True, ensure_ascii=False, default=str),
+        top_k,
+    )
+
+
+def search_contexts(
+    storage,
+    query: str,
+    context_types: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    top_k: int = 10,
+    hybrid: bool = False,
+) -> List[Tuple[ProcessedContext, float]]:
+    """
+    Vector search for a query text, through the current turn's cache when there is one
+
+    With hybrid, full-text matches are fused into the ranking when storage has a full-text
+    index; scores remain vector similarities.
+    """
+    hybrid = hybrid and getattr(storage, "hybrid_search_enabled", False)
+    storage_search = storage.hybrid_search if hybrid else storage.search
+    cache = get_query_cache()
+    if cache is None:
+        return storage_search(
+            query=Vectorize(text=query), context_types=context_types, filters=filters, top_k=top_k
+        )
+
+    def search():
+        return storage_search(
+            query=cache.vectorize(query),
+            context_types=context_types,
+            filters=filters,
+            top_k=top_k,
+        )
+
+    key = _result_key("hybrid" if hybrid else "search", query, context_types, filters, top_k)
+    return list(cache.get_or_compute(key, search) or [])
+
+
+def search_contexts_by_types(
+    storage,
+    query: str,
+    top_k_per_type: Dict[str, int],
+    filters: Optional[Dict[str, Any]] = None,
+    top_k: Optional[int] = None,
+) -> List[Tuple[ProcessedContext, float]]:
+    """Multi-type vector search for a query text, through the current turn's cache if any"""
+    cache = get_query_cache()
+    if cache is None:
+        return storage.search_multi_type(
+            query=Vectorize(text=query),
+            top_k_per_type=top_k_per_type,
+            filters=filters,
+            top_k=top_k,
+        )
+
+    def search():
+        return storage.search_multi_type(
+            query=cache.vectorize(query),
+            top_k_per_type=top_k_per_type,
+            filters=filters,
+            top_k=top_k,
+        )
+
+    quotas = [f"{context_type}:{k}" for context_type, k in top_k_per_type.items()]
+    key = _result_key("multi_type", query, quotas, filters, top_k)
+    return list(cache.get_or_compute(key, search) or [])
+
+
+def get_contexts(
+    storage,
+    context_types: List[str],
+    filters: Optional[Dict[str, Any]] = None,
+    limit: int = 10,
+) -> Dict[str, List[ProcessedContext]]:
+    """Filter-only retrieval, through the current turn's cache when there is one"""
+
+    def get_all():
+        return storage.get_all_processed_contexts(
+            context_types=context_types, limit=limit, filter=filters
+        )
+
+    cache = get_query_cache()
+    if cache is None:
+        return get_all()
+    key = _result_key("filter", None, context_types, filters, limit)
+    return dict(cache.get_or_compute(key, get_all) or {})
@@ -21,6 +21,7 @@ from .get_daily_reports_tool import GetDailyReportsTool
 from .get_tips_tool import GetTipsTool
 from .get_todos_tool import GetTodosTool
 from .intent_context_tool import IntentContextTool
+from .multi_type_context_tool import MultiTypeContextTool
 from .procedural_context_tool import ProceduralContextTool
 from .semantic_context_tool import SemanticContextTool
 from .state_context_tool import StateContextTool
@@ -35,6 +36,7 @@ __all__ = [
     "SemanticContextTool",
     "ProceduralContextTool",
     "StateContextTool",
+    "MultiTypeContextTool",
     # Document retrieval tools
     "GetDailyReportsTool",
     "GetActivitiesTool",
@@ -11,11 +11,12 @@ Provides common functionality for searching and filtering processed contexts
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-from opencontext.models.context import ProcessedContext, Vectorize
+from opencontext.models.context import ProcessedContext
 from opencontext.models.enums import ContextSimpleDescriptions, ContextType
 from opencontext.storage.global_storage import get_storage
 from opencontext.tools.base import BaseTool
 from opencontext.tools.profile_tools.profile_entity_tool import ProfileEntityTool
+from opencontext.tools.query_cache import get_contexts, search_contexts
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -113,18 +114,19 @@ class BaseContextRetrievalTool(BaseTool):
         built_filters = self._build_filters(filters)
 
         if query:
-            # Semantic search with query
-            vectorize = Vectorize(text=query)
-            return self.storage.search(
-                query=vectorize,
+            # Semantic search with query, fused with full-text matches when enabled
+            return search_contexts(
+                self.storage,
+                query,
                 context_types=[context_type_str],
                 filters=built_filters,
                 top_k=top_k,
+                hybrid=True,
             )
         else:
             # Filter-only retrieval without query
-            results_dict = self.storage.get_all_processed_contexts(
-                context_types=[context_type_str], limit=top_k, filter=built_filters
+            results_dict = get_contexts(
+                self.storage, [context_type_str], filters=built_filters, limit=top_k
             )
 
             # Convert results to (context, score) format
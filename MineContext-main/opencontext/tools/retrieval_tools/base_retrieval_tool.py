@@ -10,10 +10,11 @@ Base retrieval tool class, provides common retrieval functions and formatting me
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-from opencontext.models.context import ProcessedContext, Vectorize
+from opencontext.models.context import ProcessedContext
 from opencontext.storage.global_storage import get_storage
 from opencontext.tools.base import BaseTool
 from opencontext.tools.profile_tools.profile_entity_tool import ProfileEntityTool
+from opencontext.tools.query_cache import get_contexts, search_contexts
 
 
 @dataclass
@@ -84,15 +85,17 @@ class BaseRetrievalTool(BaseTool):
 
         if query:
             # Semantic search
-            vectorize = Vectorize(text=query)
-            return self.storage.search(
-                query=vectorize, context_types=context_types, filters=filters, top_k=top_k
+            return search_contexts(
+                self.storage,
+                query,
+                context_types=context_types,
+                filters=filters,
+                top_k=top_k,
+                hybrid=True,
             )
         else:
             # Pure filter query
-            results_dict = self.storage.get_all_processed_contexts(
-                context_types=context_types, limit=top_k, filter=filters
-            )
+            results_dict = get_contexts(self.storage, context_types, filters=filters, limit=top_k)
 
             # Convert results to (context, score) format
             results = []
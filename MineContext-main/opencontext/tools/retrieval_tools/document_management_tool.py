@@ -11,9 +11,10 @@ Separate from retrieval tools which focus on search/filter operations
 
 from typing import Any, Dict, List, Tuple
 
-from opencontext.models.context import ProcessedContext, Vectorize
+from opencontext.models.context import ProcessedContext
 from opencontext.models.enums import ContextType
 from opencontext.storage.global_storage import get_storage
+from opencontext.tools.query_cache import get_contexts, search_contexts
 from opencontext.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -150,15 +151,17 @@ class DocumentManagementTool:
         """Execute document search operation - directly use the built filter dictionary"""
         if query:
             # Semantic search
-            vectorize = Vectorize(text=query)
-            return self.storage.search(
-                query=vectorize, context_types=context_types, filters=filters, top_k=top_k
+            return search_contexts(
+                self.storage,
+                query,
+                context_types=context_types,
+                filters=filters,
+                top_k=top_k,
+                hybrid=True,
             )
         else:
             # Pure filter query
-            results_dict = self.storage.get_all_processed_contexts(
-                context_types=context_types, limit=top_k, filter=filters
-            )
+            results_dict = get_contexts(self.storage, context_types, filters=filters, limit=top_k)
 
             # Convert results to (context, score) format
             results = []
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Multi-type context retrieval tool
+Searches several context types with one query embedding and a merged ranking
+"""
+
+from typing import Any, Dict, List
+
+from opencontext.models.context import ProcessedContext
+from opencontext.models.enums import ContextSimpleDescriptions, ContextType
+from opencontext.tools.query_cache import search_contexts_by_types
+from opencontext.tools.retrieval_tools.base_retrieval_tool import (
+    BaseRetrievalTool,
+    RetrievalToolFilter,
+    TimeRangeFilter,
+)
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Context types covered by the type-specific context retrieval tools
+SEARCHABLE_CONTEXT_TYPES = [
+    ContextType.ACTIVITY_CONTEXT.value,
+    ContextType.INTENT_CONTEXT.value,
+    ContextType.SEMANTIC_CONTEXT.value,
+    ContextType.PROCEDURAL_CONTEXT.value,
+    ContextType.STATE_CONTEXT.value,
+]
+
+
+class MultiTypeContextTool(BaseRetrievalTool):
+    """
+    Multi-type context retrieval tool
+
+    Replaces calling every type-specific retrieval tool with the same query: the query is
+    embedded once, the requested context types are searched concurrently with their own
+    result counts, and the results are merged into one ranking without duplicates.
+    """
+
+    @classmethod
+    def get_name(cls) -> str:
+        """Get tool name"""
+        return "retrieve_contexts"
+
+    @classmethod
+    def get_description(cls) -> str:
+        """Get tool description"""
+        type_lines = "\n".join(
+            f"- {context_type}: {ContextSimpleDescriptions.get(context_type, {}).get('description', '')}"
+            for context_type in SEARCHABLE_CONTEXT_TYPES
+        )
+        return f"""Semantic search across several context types at once with a single query.
+
+**What this tool retrieves:**
+{type_lines}
+
+**When to use this tool:**
+- When the same query should be looked up in more than one context type
+- When it is unclear which context type holds the answer
+- Prefer it over calling several type-specific retrieval tools with the same query
+
+**Options:**
+- context_types: the types to search (all of the above by default)
+- top_k_per_type / type_top_k: how many results each type may contribute
+- top_k: how many results to return after merging, ranked by similarity
+- Time range and entity filters apply to every type"""
+
+    @classmethod
+    def get_parameters(cls) -> Dict[str, Any]:
+        """Get tool parameter definitions"""
+        return {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Natural language query for semantic search",
+                },
+                "context_types": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": SEARCHABLE_CONTEXT_TYPES},
+                    "description": "Context types to search, all of them if omitted",
+                },
+                "top_k_per_type": {
+                    "type": "integer",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                    "description": "Maximum results contributed by each context type",
+                },
+                "type_top_k": {
+                    "type": "object",
+                    "additionalProperties": {"type": "integer"},
+                    "description": "Per context type result counts overriding top_k_per_type, e.g. {'semantic_context': 20}",
+                },
+                "top_k": {
+                    "type": "integer",
+                    "default": 30,
+                    "minimum": 1,
+                    "maximum": 100,
+                    "description": "Number of merged results to return",
+                },
+                "entities": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Entity list for filtering records containing specific entities (e.g., person names, project names). For current user, use 'current_user'",
+                },
+                "time_range": {
+                    "type": "object",
+                    "properties": {
+                        "start": {
+                            "type": "integer",
+                            "description": "Start timestamp in seconds (Unix epoch). MUST be a calculated integer, not a string or expression",
+                        },
+                        "end": {
+                            "type": "integer",
+                            "description": "End timestamp in seconds (Unix epoch). MUST be a calculated integer, not a string or expression",
+                        },
+                        "time_type": {
+                            "type": "string",
+                            "enum": ["create_time_ts", "update_time_ts", "event_time_ts"],
+                            "default": "event_time_ts",
+                            "description": "Time type: create_time_ts (creation time), update_time_ts (update time), event_time_ts (event time)",
+                        },
+                    },
+                    "description": "Time range filter applied to every context type. Start and end must be pre-calculated integer timestamps.",
+                },
+            },
+            "required": ["query"],
+        }
+
+    def _format_context_result(
+        self, context: ProcessedContext, score: float, additional_fields: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Format single context result with its context type"""
+        context_type = context.extracted_data.context_type.value
+        fields = {"context_type": context_type}
+        context_desc = ContextSimpleDescriptions.get(context_type, {})
+        if context_desc:
+            fields["context_description"] = context_desc.get("description", "")
+        if additional_fields:
+            fields.update(additional_fields)
+        return super()._format_context_result(context, score, fields)
+
+    def execute(self, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Execute multi-type context retrieval
+
+        Args:
+            query: Search query
+            context_types: Optional context types to search
+            top_k_per_type: Results per context type (default 10)
+            type_top_k: Optional per context type result counts
+            top_k: Number of merged results to return (default 30)
+            entities: Optional entity list for filtering
+            time_range: Optional time range filter
+
+        Returns:
+            List of formatted context results
+        """
+        query = kwargs.get("query")
+        if not query:
+            return [{"error": "query is required for multi-type context retrieval"}]
+
+        context_types = [
+            context_type
+            for context_type in kwargs.get("context_types") or SEARCHABLE_CONTEXT_TYPES
+            if context_type in SEARCHABLE_CONTEXT_TYPES
+        ] or SEARCHABLE_CONTEXT_TYPES
+        top_k_per_type = kwargs.get("top_k_per_type", 10)
+        type_top_k = kwargs.get("type_top_k") or {}
+        quotas = {
+            context_type: int(type_top_k.get(context_type, top_k_per_type))
+            for context_type in context_types
+        }
+        top_k = kwargs.get("top_k", 30)
+
+        filters = RetrievalToolFilter(entities=kwargs.get("entities") or [])
+        time_range = kwargs.get("time_range")
+        if time_range:
+            filters.time_range = TimeRangeFilter(**time_range)
+
+        try:
+            search_results = search_contexts_by_types(
+                self.storage,
+                query,
+                quotas,
+                filters=self._build_filters(filters),
+                top_k=top_k,
+            )
+            return self._format_results(search_results)
+
+        except Exception as e:
+            logger.error(f"{self.get_name()} execute exception: {str(e)}")
+            return [{"error": f"Error occurred during multi-type context retrieval: {str(e)}"}]
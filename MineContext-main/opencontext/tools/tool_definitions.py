@@ -13,6 +13,7 @@ CONTEXT_RETRIEVAL_TOOLS = [
     {"type": "function", "function": SemanticContextTool.get_definition()},
     {"type": "function", "function": ProceduralContextTool.get_definition()},
     {"type": "function", "function": StateContextTool.get_definition()},
+    {"type": "function", "function": MultiTypeContextTool.get_definition()},
 ]
 
 # Document retrieval tools (SQLite-based)
@@ -2,14 +2,44 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import contextvars
+import inspect
 import json
-from typing import Any, Dict, List, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from difflib import get_close_matches
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from opencontext.config import GlobalConfig
+from opencontext.config import GlobalConfig, get_config
 from opencontext.tools.base import BaseTool
 from opencontext.tools.operation_tools import *
 from opencontext.tools.profile_tools import ProfileEntityTool
 from opencontext.tools.retrieval_tools import *
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Synchronous tools run on a pool shared by every executor, so concurrent tool calls of an
+# agent turn run in parallel without blocking the event loop
+_tool_pool: Optional[ThreadPoolExecutor] = None
+_tool_pool_lock = threading.Lock()
+
+
+def _get_executor_config() -> Dict[str, Any]:
+    return get_config("tools.executor") or {}
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    global _tool_pool
+    if _tool_pool is None:
+        with _tool_pool_lock:
+            if _tool_pool is None:
+                max_workers = _get_executor_config().get("max_workers", 8)
+                _tool_pool = ThreadPoolExecutor(
+                    max_workers=max(1, max_workers), thread_name_prefix="tool"
+                )
+    return _tool_pool
 
 
 class ToolsExecutor:
@@ -21,6 +51,7 @@ class ToolsExecutor:
             SemanticContextTool.get_name(): SemanticContextTool(),
             ProceduralContextTool.get_name(): ProceduralContextTool(),
             StateContextTool.get_name(): StateContextTool(),
+            MultiTypeContextTool.get_name(): MultiTypeContextTool(),
             # Document retrieval tools
             GetDailyReportsTool.get_name(): GetDailyReportsTool(),
             GetActivitiesTool.get_name(): GetActivitiesTool(),
@@ -31,93 +62,118 @@ class ToolsExecutor:
             # Operation tools
             WebSearchTool.get_name(): WebSearchTool(),
         }
+        config = _get_executor_config()
+        self._default_timeout = config.get("timeout_seconds", 30)
+        self._timeouts: Dict[str, float] = config.get("timeouts") or {}
 
-    async def run_async(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
-        if tool_name in self._tools_map:
-            tool = self._tools_map[tool_name]
-
-            if (
-                isinstance(tool_input, list)
-                and len(tool_input) == 1
-                and isinstance(tool_input[0], dict)
-            ):
-                tool_input = tool_input[0]
-
-            # Ensure tool_input is dictionary type
-            if not isinstance(tool_input, dict):
-                return {
-                    "error": f"Tool parameter format error: expected dict, got {type(tool_input).__name__}",
-                    "message": "Tool parameters must be in dictionary format",
-                    "received_type": type(tool_input).__name__,
-                }
+    def _get_timeout(self, tool_name: str) -> Optional[float]:
+        timeout = self._timeouts.get(tool_name, self._default_timeout)
+        return timeout if timeout and timeout > 0 else None
 
-            return tool.execute(**tool_input)
-        else:
+    def _resolve(self, tool_name: str, tool_input: Any) -> Tuple[Optional[BaseTool], Any]:
+        """Tool and normalized input, or None and an error result"""
+        if tool_name not in self._tools_map:
             # Log unknown tool call but don't throw exception, return warning message
-            import logging
-            from difflib import get_close_matches
-
-            logger = logging.getLogger(__name__)
-
             # Provide similar tool name suggestions
             available_tools = list(self._tools_map.keys())
             suggestions = get_close_matches(tool_name, available_tools, n=3, cutoff=0.6)
             suggestion_text = f"Suggested tools: {', '.join(suggestions)}" if suggestions else ""
 
             error_msg = f"Unknown tool: {tool_name}. {suggestion_text}"
+            logger.warning(error_msg)
             available_tools_text = f"Available tools: {', '.join(available_tools[:10])}" + (
                 "..." if len(available_tools) > 10 else ""
             )
-            return {
+            return None, {
                 "error": error_msg,
                 "message": "This tool does not exist, please use system-provided tools",
                 "available_tools": available_tools_text,
                 "suggestions": suggestions,
             }
 
-    def run(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
-        if tool_name in self._tools_map:
-            tool = self._tools_map[tool_name]
-
-            # Process input parameters: if tool_input is a list containing a single dictionary, extract the dictionary
-            if (
-                isinstance(tool_input, list)
-                and len(tool_input) == 1
-                and isinstance(tool_input[0], dict)
-            ):
-                tool_input = tool_input[0]
-
-            # Ensure tool_input is dictionary type
-            if not isinstance(tool_input, dict):
-                return {
-                    "error": f"Tool parameter format error: expected dict, got {type(tool_input).__name__}",
-                    "message": "Tool parameters must be in dictionary format",
-                    "received_type": type(tool_input).__name__,
-                }
+        # Process input parameters: if tool_input is a list containing a single dictionary, extract the dictionary
+        if (
+            isinstance(tool_input, list)
+            and len(tool_input) == 1
+            and isinstance(tool_input[0], dict)
+        ):
+            tool_input = tool_input[0]
+
+        # Ensure tool_input is dictionary type
+        if not isinstance(tool_input, dict):
+            return None, {
+                "error": f"Tool parameter format error: expected dict, got {type(tool_input).__name__}",
+                "message": "Tool parameters must be in dictionary format",
+                "received_type": type(tool_input).__name__,
+            }
+        return self._tools_map[tool_name], tool_input
 
+    async def run_async(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
+        result, _ = await self.run_with_timing_async(tool_name, tool_input)
+        return result
+
+    async def run_with_timing_async(
+        self, tool_name: str, tool_input: Dict[str, Any]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Run a tool without blocking the event loop.
+
+        Tools with a coroutine `execute_async` are awaited, others run on the shared tool
+        thread pool. A call exceeding its timeout returns an error result; its thread
+        cannot be interrupted and finishes in the background.
+
+        Returns:
+            (result, timing) where timing has the call's status, time spent waiting for a
+            pool thread (queued_ms), running (execute_ms) and in total (total_ms)
+        """
+        started = time.perf_counter()
+        timing: Dict[str, Any] = {"tool": tool_name, "status": "ok", "queued_ms": 0.0}
+        tool, tool_input = self._resolve(tool_name, tool_input)
+        if tool is None:
+            timing.update(status="invalid", execute_ms=0.0, total_ms=0.0)
+            return tool_input, timing
+
+        execute_started = [started]
+
+        def execute():
+            execute_started[0] = time.perf_counter()
             return tool.execute(**tool_input)
-        else:
-            # Log unknown tool call but don't throw exception, return warning message
-            import logging
-            from difflib import get_close_matches
-
-            logger = logging.getLogger(__name__)
 
-            # Provide similar tool name suggestions
-            available_tools = list(self._tools_map.keys())
-            suggestions = get_close_matches(tool_name, available_tools, n=3, cutoff=0.6)
-            suggestion_text = f"Suggested tools: {', '.join(suggestions)}" if suggestions else ""
-
-            error_msg = f"Unknown tool: {tool_name}. {suggestion_text}"
-            available_tools_text = f"Available tools: {', '.join(available_tools[:10])}" + (
-                "..." if len(available_tools) > 10 else ""
+        execute_async = getattr(tool, "execute_async", None)
+        if inspect.iscoroutinefunction(execute_async):
+            call = execute_async(**tool_input)
+        else:
+            # Copy the context so request priority and other context variables carry over
+            call = asyncio.get_running_loop().run_in_executor(
+                _get_tool_pool(), contextvars.copy_context().run, execute
             )
-            return {
-                "error": error_msg,
-                "message": "This tool does not exist, please use system-provided tools",
-                "available_tools": available_tools_text,
-                "suggestions": suggestions,
+
+        timeout = self._get_timeout(tool_name)
+        try:
+            result = await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            timing["status"] = "timeout"
+            result = {
+                "error": f"Tool {tool_name} timed out after {timeout}s",
+                "message": "The tool took too long, continue without its results",
             }
+        except Exception as e:
+            logger.exception(f"Tool {tool_name} execution failed: {e}")
+            timing["status"] = "error"
+            result = {"error": f"Tool {tool_name} failed: {e}"}
+
+        finished = time.perf_counter()
+        timing["queued_ms"] = round((execute_started[0] - started) * 1000, 1)
+        timing["execute_ms"] = round((finished - execute_started[0]) * 1000, 1)
+        timing["total_ms"] = round((finished - started) * 1000, 1)
+        logger.debug(f"Tool call timing: {timing}")
+        return result, timing
+
+    def run(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
+        tool, tool_input = self._resolve(tool_name, tool_input)
+        if tool is None:
+            return tool_input
+        return tool.execute(**tool_input)
 
     async def batch_run_tools_async(self, tool_calls: List[Dict[str, Any]]) -> Any:
         results = []
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Background file writer - persists in-memory payloads to disk off the caller's thread
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Optional, Set, Tuple
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncFileWriter:
+    """
+    Writes files from a single background thread.
+
+    `write` returns immediately; the path is valid once the file has been written.
+    `discard` cancels a pending write or removes a file that was already written, so
+    a consumer that drops a payload does not race the writer.
+    """
+
+    def __init__(self, max_pending: int = 256):
+        self._queue: "queue.Queue[Optional[Tuple[str, bytes, Optional[str]]]]" = queue.Queue(
+            maxsize=max(1, int(max_pending))
+        )
+        self._pending: Set[str] = set()
+        self._discarded: Set[str] = set()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._thread = threading.Thread(target=self._run, name="async-file-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, path: str, data: bytes, stage_name: Optional[str] = None):
+        """
+        Queue `data` to be written to `path`.
+
+        Args:
+            path: Target file path, parent directories are created as needed
+            data: File content
+            stage_name: Record the write duration under this monitoring stage
+        """
+        with self._lock:
+            self._pending.add(path)
+            self._discarded.discard(path)
+        # Blocks when the disk cannot keep up, bounding memory held by queued payloads
+        self._queue.put((path, data, stage_name))
+
+    def discard(self, path: str):
+        """Drop a queued write, or delete the file if it has been written already"""
+        with self._lock:
+            if path in self._pending:
+                self._discarded.add(path)
+                return
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception as e:
+            logger.error(f"Failed to delete file {path}: {e}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued write has finished"""
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, data, stage_name = item
+            with self._lock:
+                skip = path in self._discarded
+            if not skip:
+                self._write_file(path, data, stage_name)
+            with self._idle:
+                self._discarded.discard(path)
+                self._pending.discard(path)
+                self._idle.notify_all()
+
+    def _write_file(self, path: str, data: bytes, stage_name: Optional[str]):
+        start_time = time.time()
+        status = "success"
+        try:
+            dir_name = os.path.dirname(path)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
+            # Write to a temporary name so readers never see a partial file
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            status = "error"
+            logger.error(f"Failed to write file {path}: {e}")
+        if stage_name:
+            from opencontext.monitoring import record_processing_stage
+
+            record_processing_stage(stage_name, int((time.time() - start_time) * 1000), status)
+
+    def close(self, timeout: float = 10):
+        """Finish queued writes and stop the writer thread"""
+        self.flush(timeout)
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+# Global writer instance
+_file_writer: Optional[AsyncFileWriter] = None
+_file_writer_lock = threading.Lock()
+
+
+def get_file_writer() -> AsyncFileWriter:
+    """Get global background file writer"""
+    global _file_writer
+    if _file_writer is None:
+        with _file_writer_lock:
+            if _file_writer is None:
+                _file_writer = AsyncFileWriter()
+                atexit.register(_file_writer.close)
+    return _file_writer
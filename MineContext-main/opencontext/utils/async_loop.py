@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Long-lived asyncio event loop running on its own thread
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from opencontext.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """
+    Event loop on a dedicated daemon thread that synchronous code submits coroutines to.
+
+    Using one loop for the lifetime of a component, instead of asyncio.run per batch,
+    keeps loop-bound resources such as the async HTTP clients' keep-alive connections
+    alive between batches.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._started.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            try:
+                pending = asyncio.all_tasks(self._loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            finally:
+                self._loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the loop and return a thread-safe future"""
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError(f"Event loop {self.name} is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and block the calling thread until it finishes"""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(f"run() called from inside event loop {self.name}")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def close(self, timeout: float = 5):
+        """Stop the loop, cancelling coroutines that are still running"""
+        if self._loop.is_closed() or not self._thread.is_alive():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"Event loop {self.name} did not stop within {timeout}s")
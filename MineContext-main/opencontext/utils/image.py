@@ -7,11 +7,14 @@
 OpenContext module: image
 """
 
-from typing import Optional
+from io import BytesIO
+from typing import Optional, Tuple
 
 import imagehash
 from PIL import Image
 
+IMAGE_MIME_TYPES = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg"}
+
 
 def calculate_bytes2phash(image_bytes: bytes) -> Optional[str]:
     """
@@ -65,3 +68,48 @@ def resize_image(path: str, max_size: int, resize_quality: int) -> bool:
         logger = get_logger(__name__)
         logger.error(f"Failed to resize image {path}: {e}")
     return False
+
+
+def downscale_image(image: Image.Image, max_size: int) -> Image.Image:
+    """
+    Scale an in-memory image proportionally so neither side exceeds max_size.
+    Returns the image itself when no scaling is needed.
+    """
+    if max_size and (image.width > max_size or image.height > max_size):
+        ratio = max_size / max(image.width, image.height)
+        size = (max(1, round(image.width * ratio)), max(1, round(image.height * ratio)))
+        return image.resize(size, Image.Resampling.BILINEAR)
+    return image
+
+
+def calculate_image_dhash(image: Image.Image) -> str:
+    """Difference hash of an in-memory image, same format as calculate_phash"""
+    return str(imagehash.dhash(image, hash_size=8))
+
+
+def encode_image(image: Image.Image, image_format: str, quality: int = 85) -> Tuple[bytes, str]:
+    """
+    Encode an in-memory image once for storage and VLM input.
+
+    Returns:
+        (encoded bytes, normalized format name: "jpeg" or "png")
+    """
+    buffer = BytesIO()
+    if image_format.lower() in ("jpg", "jpeg"):
+        image.save(buffer, format="JPEG", quality=quality)
+        return buffer.getvalue(), "jpeg"
+    image.save(buffer, format="PNG", compress_level=6)
+    return buffer.getvalue(), "png"
+
+
+def resize_image_bytes(
+    image_bytes: bytes, image_format: str, max_size: int, resize_quality: int
+) -> Optional[bytes]:
+    """
+    In-memory counterpart of resize_image.
+    Returns re-encoded bytes, or None if the image already fits.
+    """
+    with Image.open(BytesIO(image_bytes)) as img:
+        if not max_size or (img.width <= max_size and img.height <= max_size):
+            return None
+        return encode_image(downscale_image(img, max_size), image_format, resize_quality)[0]
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Reader/writer lock - many concurrent readers or one exclusive writer
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Hashable, Iterator
+
+
+class ReadWriteLock:
+    """
+    Writer-preferring reader/writer lock.
+
+    Any number of threads may hold the read lock at once. A writer waits until all
+    readers have left, and new readers queue behind a waiting writer so a steady
+    stream of searches cannot starve upserts. Neither side is reentrant.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class KeyedReadWriteLock:
+    """One ReadWriteLock per key, created on first use"""
+
+    def __init__(self):
+        self._locks: Dict[Hashable, ReadWriteLock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: Hashable) -> ReadWriteLock:
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(key, ReadWriteLock())
+        return lock
+
+    def read_lock(self, key: Hashable):
+        return self.get(key).read_lock()
+
+    def write_lock(self, key: Hashable):
+        return self.get(key).write_lock()
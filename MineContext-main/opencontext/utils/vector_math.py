@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Vector math helpers - cosine similarity kernels over normalized float32 matrices
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+VectorLike = Optional[Sequence[float]]
+
+
+def normalize_rows(
+    vectors: Sequence[VectorLike], dim: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack vectors into an L2-normalized float32 matrix.
+
+    Missing, zero-norm or wrongly sized vectors become zero rows and are reported as
+    invalid in the returned mask. The dimension is taken from the first usable vector
+    unless given explicitly.
+
+    Returns:
+        (matrix of shape (n, dim), boolean validity mask of shape (n,))
+    """
+    if dim is None:
+        dim = next((len(v) for v in vectors if v is not None and len(v) > 0), 0)
+    matrix = np.zeros((len(vectors), dim), dtype=np.float32)
+    valid = np.zeros(len(vectors), dtype=bool)
+    if dim == 0:
+        return matrix, valid
+
+    for i, vector in enumerate(vectors):
+        if vector is not None and len(vector) == dim:
+            matrix[i] = vector
+            valid[i] = True
+
+    norms = np.linalg.norm(matrix, axis=1)
+    valid &= norms > 0
+    matrix[valid] /= norms[valid, None]
+    matrix[~valid] = 0.0
+    return matrix, valid
+
+
+def cosine_similarity(vec1: VectorLike, vec2: VectorLike) -> float:
+    """Cosine similarity of two vectors, 0.0 if either is missing, empty or zero"""
+    if vec1 is None or vec2 is None or len(vec1) == 0 or len(vec1) != len(vec2):
+        return 0.0
+    matrix, valid = normalize_rows([vec1, vec2])
+    if not valid.all():
+        return 0.0
+    return float(matrix[0] @ matrix[1])
+
+
+def similarities_to_query(query: VectorLike, vectors: Sequence[VectorLike]) -> np.ndarray:
+    """Cosine similarity of one query against many vectors, computed as one matrix product"""
+    if query is None or len(query) == 0 or not vectors:
+        return np.zeros(len(vectors), dtype=np.float32)
+    matrix, valid = normalize_rows([query, *vectors], dim=len(query))
+    if not valid[0]:
+        return np.zeros(len(vectors), dtype=np.float32)
+    return matrix[1:] @ matrix[0]
+
+
+def similarity_matrix(vectors: Sequence[VectorLike]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairwise cosine similarity matrix and validity mask for a list of vectors"""
+    matrix, valid = normalize_rows(vectors)
+    return matrix @ matrix.T, valid
+
+
+def greedy_similarity_groups(vectors: Sequence[VectorLike], threshold: float) -> List[List[int]]:
+    """
+    Seed-and-sweep grouping by cosine similarity.
+
+    Takes the first ungrouped item as seed and groups every remaining item whose
+    similarity to the seed exceeds `threshold`, in input order. Each sweep is a single
+    matrix-vector product over the remaining rows. Items without a usable vector always
+    form their own group.
+    """
+    matrix, valid = normalize_rows(vectors)
+    remaining = np.ones(len(vectors), dtype=bool)
+    groups = []
+    for seed in range(len(vectors)):
+        if not remaining[seed]:
+            continue
+        remaining[seed] = False
+        if not valid[seed]:
+            groups.append([seed])
+            continue
+        candidates = np.flatnonzero(remaining & valid)
+        if candidates.size:
+            sims = matrix[candidates] @ matrix[seed]
+            members = candidates[sims > threshold]
+            remaining[members] = False
+        else:
+            members = candidates
+        groups.append([seed, *members.tolist()])
+    return groups
+
+
+def leader_clusters(
+    vectors: Sequence[VectorLike], threshold: float, max_cluster_size: Optional[int] = None
+) -> List[List[int]]:
+    """
+    Single-pass leader clustering by cosine similarity.
+
+    Each item joins the most similar existing leader whose similarity exceeds `threshold`
+    and whose cluster still has room, otherwise it becomes a new leader. Every item is
+    compared against the leaders only, so the cost is O(n * clusters) instead of the
+    O(n²) of pairwise grouping. Items without a usable vector form their own cluster.
+    """
+    matrix, valid = normalize_rows(vectors)
+    capacity = max_cluster_size if max_cluster_size and max_cluster_size > 0 else None
+    leaders = np.zeros((min(len(vectors), 64), matrix.shape[1]), dtype=np.float32)
+    leader_to_cluster: List[int] = []
+    open_leaders = np.zeros(len(leaders), dtype=bool)
+    clusters: List[List[int]] = []
+
+    for i in range(len(vectors)):
+        if not valid[i]:
+            clusters.append([i])
+            continue
+        count = len(leader_to_cluster)
+        if count and open_leaders[:count].any():
+            sims = leaders[:count] @ matrix[i]
+            sims[~open_leaders[:count]] = -np.inf
+            best = int(np.argmax(sims))
+            if sims[best] > threshold:
+                cluster = clusters[leader_to_cluster[best]]
+                cluster.append(i)
+                if capacity and len(cluster) >= capacity:
+                    open_leaders[best] = False
+                continue
+        if count == len(leaders):
+            leaders = np.concatenate([leaders, np.zeros_like(leaders)])
+            open_leaders = np.concatenate([open_leaders, np.zeros_like(open_leaders)])
+        leaders[count] = matrix[i]
+        open_leaders[count] = capacity is None or capacity > 1
+        leader_to_cluster.append(len(clusters))
+        clusters.append([i])
+    return clusters
@@ -16,6 +16,7 @@ class CompletionHandler {
         this.lastTriggerTime = 0;
         this.requestTimestamp = null; // 请求时的文档时间戳
         this.pendingRequests = new Set(); // 跟踪待处理的请求
+        this.sessionId = Date.now() + '_' + Math.random().toString(36).substr(2, 9); // 编辑器会话ID，新请求会取消同一会话中未完成的请求
         
         // DOM元素
         this.overlay = document.getElementById('completionOverlay');
@@ -205,6 +206,7 @@ class CompletionHandler {
             text: content,
             cursor_position: cursorIndex,
             document_id: documentId,
+            session_id: this.sessionId,
             max_suggestions: this.config.maxVisibleSuggestions,
             context: {
                 current_line: this.cm.getLine(cursor.line),